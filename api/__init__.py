@@ -7,4 +7,6 @@ import grequests # Asynchronous parallel requests
 import requests
 
 import api.bulk_api
+import api.course_attrs
 import api.class_api
+import api.roster_registry
@@ -9,7 +9,7 @@
 """
 
 import json
-from typing import List, Tuple, Set, cast
+from typing import List, Optional, Tuple, Set, cast
 
 # For whatever reason, grequests must be imported before requests
 # - https://github.com/spyoungtech/grequests/issues/103
@@ -29,6 +29,34 @@ from ui.parser import get_dept_from_name
 
 _data_to_add: Set[ Tuple[ str, str ] ] = set()
 
+# The number of times a failed request (no response, a server error, or
+# an unreadable body) is retried
+BULK_RETRIES = 2
+
+class BulkFetchStats:
+    """
+    Counters for the bulk fetcher
+
+    Attributes:
+
+     - requests: The number of requests sent, including retries (int)
+
+     - retries: The number of requests that were retries (int)
+
+     - failures: The number of (term, dept) pairs that couldn't be
+                 fetched after all retries (int)
+    """
+
+    def __init__( self ) -> None:
+        self.requests = 0
+        self.retries  = 0
+        self.failures = 0
+
+    def __str__( self ) -> str:
+        return f"{self.requests} requests, {self.retries} retries, {self.failures} failures"
+
+stats = BulkFetchStats()
+
 def bulk_populate() -> None:
     """Bulk populates our data that we've yet to add"""
 
@@ -36,36 +64,69 @@ def bulk_populate() -> None:
     bulk_populate_data( list( _data_to_add ) )
     _data_to_add = set()
 
+def _read_response( resp: Optional[ requests.Response ] ) -> Optional[dict]:
+    """
+    Returns the JSON data of a response, or None if the request failed
+    and should be retried
+    """
+
+    if ( resp is None ) or ( resp.status_code >= 500 ):
+        return None
+
+    try:
+        return cast( dict, json.loads( resp.text ) )
+    except ValueError:
+        return None
+
 def bulk_populate_data( req_list: List[ Tuple[ str, str ] ] ) -> None:
     """
     Populates the stored data from a large list of data
     
-    Each tuple in the provided list should be a (term, dept)
+    Each tuple in the provided list should be a (term, dept). Data that
+    is already cached isn't requested again, and failed requests are
+    retried (all at once) up to BULK_RETRIES times; any that still fail
+    are counted in stats.failures and left uncached. Offerings are
+    looked up without pinging the API, so the classes of a department
+    that failed are then reported as not offered that term
     """
 
-    req_urls = [ class_api.api_url( x[0], x[1] ) for x in req_list ]
+    to_fetch = [ x for x in req_list if not class_api.in_cache( x[0], x[1] ) ]
+
+    for attempt in range( BULK_RETRIES + 1 ):
+        if len( to_fetch ) == 0:
+            break
+
+        stats.requests += len( to_fetch )
+        if attempt > 0:
+            stats.retries += len( to_fetch )
+
+        # Create a set of unsent requests
+        rs = ( grequests.get( class_api.api_url( term, dept ), timeout = 10 )
+               for term, dept in to_fetch )
+
+        # Send all requests at the same time
+        resps = grequests.map( rs )
+
+        failed: List[ Tuple[ str, str ] ] = []
 
-    # Create a set of unsent requests
-    rs = ( grequests.get( u, timeout = 10 ) for u in req_urls )
+        # Cache the responses
+        for ( term, dept ), resp in zip( to_fetch, resps ):
+            json_object = _read_response( resp )
 
-    # Send all requests at the same time
-    resps = grequests.map( rs )
+            if json_object is None:
+                failed.append( ( term, dept ) )
+                continue
 
-    # Cache the responses
-    for req_tuple, resp in zip( req_list, resps ):
-        # Indicate the type to prevent "Any" propagation
-        typed_resp = cast( requests.Response, resp )
+            if json_object[ "status" ] != "success":
+                # The department wasn't found for this term - deal with later
+                continue
 
-        term = req_tuple[ 0 ]
-        dept = req_tuple[ 1 ]
+            # Store the data for that department and term
+            class_api.cache_data( dept, term, json_object )
 
-        json_object = json.loads( typed_resp.text )
-        if json_object[ "status" ] != "success":
-            # The department wasn't found for this term - deal with later
-            continue
+        to_fetch = failed
 
-        # Store the data for that department and term
-        class_api.cache_data( dept, term, json_object )
+    stats.failures += len( to_fetch )
 
 #---------------------------------------------------------------------
 # Add Data To Populate
@@ -12,55 +12,103 @@
 
 import json
 import copy
-from typing import List, Tuple, cast
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, cast
 
 import requests
 
 import exceptions as excp
-import ui
+from api.course_attrs import CourseAttrs, precompute_attrs
+from api.roster_registry import RosterRegistry
+from ui.parser import Term
 
 #---------------------------------------------------------------------
 # Primary API functions
 #---------------------------------------------------------------------
 
-# Cache get_rosters response in an external variable
-_CACHED_ROSTERS = None
+# The base URL of the API, which can be pointed elsewhere (such as at
+# a local stub server, in bench/stub_server.py) with the CLASSES_API_URL
+# environment variable or set_api_base_url
+DEFAULT_API_BASE_URL = "https://classes.cornell.edu/api/2.0"
+_API_BASE_URL = os.environ.get( "CLASSES_API_URL", DEFAULT_API_BASE_URL ).rstrip( "/" )
+
+def set_api_base_url( base_url: str ) -> None:
+    """Sets the base URL of the API (ex. http://localhost:8000/api/2.0)"""
+
+    global _API_BASE_URL
+    _API_BASE_URL = base_url.rstrip( "/" )
+
+def get_api_base_url() -> str:
+    """Returns the base URL of the API"""
+    return _API_BASE_URL
+
+# The rosters available from the API are stored in a registry, fetched
+# once per run on first use. The registry is only rebuilt when
+# explicitly requested with refresh_rosters (or replaced with
+# set_rosters), so that lookups never pay for the network request
+_ROSTER_REGISTRY: Optional[RosterRegistry] = None
 
 def api_url( term: str, dept: str ) -> str:
     """Returns the appropriate HTTP request URL"""
-    req_url = "https://classes.cornell.edu/api/2.0/search/classes.json?" + \
-             f"roster={ term }&subject={ dept }"
+    req_url = f"{_API_BASE_URL}/search/classes.json?" + \
+              f"roster={ term }&subject={ dept }"
     return req_url
 
-def get_rosters() -> List[str]:
+def fetch_rosters() -> List[Term]:
     """
-    Gets all of the rosters that the API has information for
+    Requests all of the rosters that the API has information for
 
-    Returns a list of strings for each term
+    Returns a list of Terms, one for each roster
     """
-    global _CACHED_ROSTERS
-
-    if _CACHED_ROSTERS is not None: # Use cached result
-        return _CACHED_ROSTERS.copy()
 
-    url = "https://classes.cornell.edu/api/2.0/config/rosters.json"
+    url = f"{_API_BASE_URL}/config/rosters.json"
     json_data   = requests.get( url, timeout = 10 ).text
     json_object = json.loads( json_data )
 
-    rosters      = ( json_object["data"] )[ "rosters" ]
-    roster_names = [ roster["slug"] for roster in rosters ]
+    rosters = ( json_object["data"] )[ "rosters" ]
+    return [ Term( roster["slug"] ) for roster in rosters ]
+
+def set_rosters( terms: Iterable[str] ) -> None:
+    """Replaces the roster registry with one for the given terms"""
+
+    global _ROSTER_REGISTRY
+    _ROSTER_REGISTRY = RosterRegistry( terms )
 
-    _CACHED_ROSTERS = roster_names # Cache the names for later
+def refresh_rosters() -> RosterRegistry:
+    """Rebuilds the roster registry from the API, returning the new registry"""
+
+    set_rosters( fetch_rosters() )
+    return cast( RosterRegistry, _ROSTER_REGISTRY )
+
+def get_roster_registry() -> RosterRegistry:
+    """Returns the roster registry, building it on first use"""
+
+    if _ROSTER_REGISTRY is None:
+        return refresh_rosters()
+    return _ROSTER_REGISTRY
+
+def get_rosters() -> List[Term]:
+    """
+    Gets all of the rosters that the API has information for
+
+    Returns a list of Terms, one for each roster, from least to most
+    recent
+    """
 
-    return roster_names.copy()
+    return get_roster_registry().terms()
 
 # Cache get_class responses in an external variable
 _cached_classes = {}
 
+# Attribute records for the cached classes, precomputed when a block
+# is cached (keyed by (dept, term), then by course number)
+_cached_attrs: Dict[ Tuple[ str, str ], Dict[ str, CourseAttrs ] ] = {}
+
 def cache_data( dept: str, term: str, json_object: dict ) -> None:
     """Caches data to be stored and used later"""
 
     _cached_classes[ ( dept, term ) ] = json_object[ "data" ][ "classes" ]
+    _cached_attrs  [ ( dept, term ) ] = precompute_attrs( dept, json_object[ "data" ][ "classes" ] )
 
 
 def populate_data( term: str, dept: str ) -> None:
@@ -106,7 +154,7 @@ def get_class( course_name: str, term: str, ping_source: bool = True,
     number = course_name_components[1]
     data_key = ( dept, term )
 
-    if term not in get_rosters(): # The requested term isn't one we have data for
+    if term not in get_roster_registry(): # The requested term isn't one we have data for
         raise excp.api_exceptions.TermNotFoundError( term )
 
     if data_key not in _cached_classes: # Need to populate with the relevant information
@@ -133,6 +181,34 @@ def get_class( course_name: str, term: str, ping_source: bool = True,
 
     return class_entry
 
+def get_class_attrs( course_name: str, term: str, ping_source: bool = True ) -> CourseAttrs:
+    """
+    Gets the precomputed attributes of a course for the given term
+
+    Args:
+     - course_name: Properly formatted course name (str)
+     - term: Properly formatted course term (str)
+
+    Possible Exceptions are the same as get_class
+    """
+
+    dept, number = course_name.split( " " )[:2]
+    data_key = ( dept, term )
+
+    if term not in get_roster_registry(): # The requested term isn't one we have data for
+        raise excp.api_exceptions.TermNotFoundError( term )
+
+    if data_key not in _cached_attrs: # Need to populate with the relevant information
+        if ping_source: # Ping the central API
+            populate_data( term, dept )
+        else:
+            raise excp.api_exceptions.DeptNotFoundError( dept, term )
+
+    if number not in _cached_attrs[ data_key ]:
+        raise excp.api_exceptions.ClassNotFoundError( course_name, term )
+
+    return _cached_attrs[ data_key ][ number ]
+
 #---------------------------------------------------------------------
 # Derived Functions
 #---------------------------------------------------------------------
@@ -145,6 +221,16 @@ def in_cache( term: str, dept: str ) -> bool:
 
     return ( dept, term ) in _cached_classes
 
+def cached_attrs( term: str ) -> List[CourseAttrs]:
+    """
+    Returns the precomputed attributes of every class cached for the
+    given term, ordered by name
+    """
+
+    all_attrs = [ attrs for ( _, cached_term ), dept_attrs in _cached_attrs.items()
+                  if cached_term == term for attrs in dept_attrs.values() ]
+    return sorted( all_attrs, key = lambda x: x.primary_name )
+
 def in_future( term: str ) -> bool:
     """
     Determines if a term is offered in the future (based on our available rosters)
@@ -153,11 +239,23 @@ def in_future( term: str ) -> bool:
     Args:
      - term (str): The relevant term we want to check
     """
-    for avail_roster in get_rosters():
-        if ui.parser.term_is_later( avail_roster, term ):
-            # The avail_roster occurs later than the given term
-            return False
-    return True
+    return get_roster_registry().in_future( term )
+
+ClassData = TypeVar( "ClassData" )
+
+def _most_recent( course_name: str, future_term: str,
+                  lookup: Callable[ [str, str], ClassData ] ) -> Tuple[ClassData, str]:
+    """Finds the most recent offering of a course, getting its data with lookup"""
+
+    # Go through the rosters, from most to least recent, until we get a match
+    for term in get_roster_registry().newest_first( up_to = future_term ):
+        try:
+            return lookup( course_name, term ), term
+        except ( excp.api_exceptions.ClassNotFoundError, excp.api_exceptions.DeptNotFoundError ):
+            continue # Didn't find it, so just move on to the next roster
+
+    # If we got here, we didn't find it in any rosters
+    raise excp.api_exceptions.NoClassInfoError( course_name, future_term )
 
 def most_recent_term( course_name: str, future_term: str ) -> Tuple[dict, str]:
     """
@@ -168,17 +266,31 @@ def most_recent_term( course_name: str, future_term: str ) -> Tuple[dict, str]:
     is therefore very API-intensive; calls to this should be sparse, even with JSON caching
     """
 
-    # Get the rosters, in order from most to least recent
-    rosters = get_rosters()
-    rosters.sort( key = ui.parser.term_index, reverse = True )
+    return _most_recent( course_name, future_term, get_class )
 
-    # Go through them until we get a match
-    for term in rosters:
-        try:
-            json_object = get_class( course_name, term )
-            return json_object, term
-        except ( excp.api_exceptions.ClassNotFoundError, excp.api_exceptions.DeptNotFoundError ):
-            continue # Didn't find it, so just move on to the next roster
+def most_recent_attrs( course_name: str, future_term: str ) -> Tuple[CourseAttrs, str]:
+    """
+    The same as most_recent_term, but returns the precomputed attributes of
+    the offering instead of its JSON data
+    """
 
-    # If we got here, we didn't find it in any rosters
-    raise excp.api_exceptions.NoClassInfoError( course_name, future_term )
+    return _most_recent( course_name, future_term, get_class_attrs )
+
+def offering_attrs( course_name: str, term: str,
+                    ping_source: bool = False ) -> Tuple[CourseAttrs, str]:
+    """
+    Gets the precomputed attributes of a course taken in the given term,
+    returning them along with the term they were sourced from; the term
+    itself, or the most recent offering's term if the term is in the
+    future (and not yet in the rosters)
+
+    Possible Exceptions are the same as get_class
+    """
+
+    try:
+        return get_class_attrs( course_name, term, ping_source = ping_source ), term
+
+    except excp.api_exceptions.TermNotFoundError as e:
+        if in_future( term ): # Find the next best term
+            return most_recent_attrs( course_name, term )
+        raise e # Not in the future, we just don't have info on it
@@ -0,0 +1,164 @@
+"""
+#=====================================================================
+# course_attrs.py
+#=====================================================================
+# Compact attribute records for course offerings, precomputed once
+# when a (term, dept) block of API data is cached
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+#---------------------------------------------------------------------
+# Constants
+#---------------------------------------------------------------------
+
+# Classes that count for FWS credit without being titled as an FWS
+FWS_EQUIVALENTS = frozenset( { "ENGL 2880", "ENGL 2890" } )
+
+# The text marking a class as a CDE in its catalog entry
+CDE_MARKER = "Culminating design experience (CDE)".upper()
+
+#---------------------------------------------------------------------
+# EnrollGroupAttrs Object
+#---------------------------------------------------------------------
+
+class EnrollGroupAttrs:
+    """
+    The attributes of one enroll group of an offering
+
+    Attributes:
+
+     - names: All names the enroll group goes by (frozenset of str)
+
+     - depts: All departments the enroll group is listed in
+              (frozenset of str)
+
+     - sections: The sections in the enroll group, in API order
+                 (tuple of str)
+
+     - min_credits: The minimum credits for the enroll group (float)
+
+     - max_credits: The maximum credits for the enroll group (float)
+
+     - is_FWS: Whether the enroll group counts as an FWS (bool)
+    """
+
+    __slots__ = ( "names", "depts", "sections", "min_credits", "max_credits", "is_FWS" )
+
+    def __init__( self, primary_name: str, group_json: dict, fws_title: bool ):
+        names = { primary_name }
+        for crosslist in group_json[ "simpleCombinations" ]:
+            names.add( f"{crosslist[ 'subject' ]} {crosslist[ 'catalogNbr' ]}" )
+
+        self.names: FrozenSet[str] = frozenset( names )
+        self.depts: FrozenSet[str] = frozenset( name.split( " " )[0] for name in names )
+
+        self.sections: Tuple[str, ...] = tuple( section[ "section" ]
+                                                for section in group_json[ "classSections" ] )
+
+        self.min_credits = float( group_json[ "unitsMinimum" ] )
+        self.max_credits = float( group_json[ "unitsMaximum" ] )
+
+        self.is_FWS = fws_title or not FWS_EQUIVALENTS.isdisjoint( self.names )
+
+#---------------------------------------------------------------------
+# CourseAttrs Object
+#---------------------------------------------------------------------
+
+class CourseAttrs:
+    """
+    The attributes of a course offering, derived from its API data
+
+    Attributes:
+
+     - primary_name: The name the offering is listed under (str)
+
+     - level: The course number, if numeric (int or None)
+
+     - title: The short title (str)
+
+     - titleLong: The long title (str)
+
+     - distributions: The distribution categories (tuple of str)
+
+     - acadGroup: The academic group (str)
+
+     - acadCareer: The nominal program affiliation (str)
+
+     - is_CDE: Whether the catalog marks the offering as a CDE (bool)
+
+     - groups: The offering's enroll groups, in API order
+               (tuple of EnrollGroupAttrs)
+
+     - section_groups: The index of the (first) enroll group each
+                       section is in (dict mapping str to int)
+
+     - crosslist_names: All names the offering goes by, if every enroll
+                        group goes by the same ones (so that they don't
+                        depend on the section taken), or otherwise None
+                        (frozenset of str, or None)
+    """
+
+    __slots__ = ( "primary_name", "level", "title", "titleLong", "distributions",
+                  "acadGroup", "acadCareer", "is_CDE", "groups", "section_groups",
+                  "crosslist_names" )
+
+    def __init__( self, dept: str, class_json: dict ):
+        number = class_json[ "catalogNbr" ]
+
+        self.primary_name = f"{dept} {number}"
+        self.level: Optional[int] = int( number ) if number.isdigit() else None
+
+        self.title      = class_json[ "titleShort" ]
+        self.titleLong  = class_json[ "titleLong" ]
+        self.acadGroup  = class_json[ "acadGroup" ]
+        self.acadCareer = class_json[ "acadCareer" ]
+
+        # Whole department blocks are precomputed, so tolerate missing text
+        # fields in classes that may never be looked at
+
+        distr_string = ( class_json.get( "catalogDistr" ) or "" ).strip( "()" )
+        self.distributions: Tuple[str, ...] = tuple( distr_string.split( ", " ) )
+
+        comments = class_json.get( "catalogComments"    ) or ""
+        prereqs  = class_json.get( "catalogPrereqCoreq" ) or ""
+        self.is_CDE = ( CDE_MARKER in comments.upper() ) or ( CDE_MARKER in prereqs.upper() )
+
+        fws_title = "FWS: " in self.titleLong
+        self.groups: Tuple[EnrollGroupAttrs, ...] = tuple(
+            EnrollGroupAttrs( self.primary_name, group, fws_title )
+            for group in class_json[ "enrollGroups" ] )
+
+        self.section_groups: Dict[ str, int ] = {}
+        for group_idx, group_attrs in enumerate( self.groups ):
+            for section in group_attrs.sections:
+                self.section_groups.setdefault( section, group_idx )
+
+        group_names = { group_attrs.names for group_attrs in self.groups }
+        self.crosslist_names: Optional[ FrozenSet[str] ] = ( group_names.pop()
+                                                             if len( group_names ) == 1 else None )
+
+    @property
+    def sections( self ) -> List[str]:
+        """Returns the sections of all enroll groups, in API order"""
+        return [ section for group in self.groups for section in group.sections ]
+
+#---------------------------------------------------------------------
+# Precomputation
+#---------------------------------------------------------------------
+
+def precompute_attrs( dept: str, classes_json: List[dict] ) -> Dict[ str, CourseAttrs ]:
+    """
+    Returns the attribute records for a block of API class data,
+    keyed by course number
+    """
+
+    attrs: Dict[ str, CourseAttrs ] = {}
+    for class_json in classes_json:
+        number = class_json[ "catalogNbr" ]
+        if number not in attrs: # Keep the first entry, as lookups did
+            attrs[ number ] = CourseAttrs( dept, class_json )
+    return attrs
@@ -0,0 +1,104 @@
+"""
+#=====================================================================
+# roster_registry.py
+#=====================================================================
+# A registry of the rosters (terms) that the API has information for,
+# supporting constant-time membership and bisect-based ordering
+# queries
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import bisect
+from typing import Iterable, List, Optional, Set
+
+from ui.parser import Term, as_term
+
+#---------------------------------------------------------------------
+# RosterRegistry Object
+#---------------------------------------------------------------------
+
+class RosterRegistry:
+    """
+    A Python representation of the rosters available from the API
+
+    The registry is built once from the list of available terms, and
+    afterwards only answers queries; it's up to the owner to replace it
+    when the available rosters should be refreshed
+
+    Attributes:
+
+     - _terms: All available terms (set of Term)
+
+     - _sorted_terms: All available terms, from least to most recent
+                      (list of Term)
+
+     - _ordinals: The ordinals of _sorted_terms, in the same order
+                  (list of int)
+    """
+
+    def __init__( self, terms: Iterable[str] ):
+        self._terms: Set[Term] = { as_term( term ) for term in terms }
+
+        self._sorted_terms: List[Term] = sorted( self._terms, key = lambda x: x.ordinal )
+        self._ordinals:     List[int]  = [ term.ordinal for term in self._sorted_terms ]
+
+    #---------------------------------------------------------------------
+    # Queries
+    #---------------------------------------------------------------------
+
+    def latest( self ) -> Optional[Term]:
+        """Returns the most recent available term (None if there are none)"""
+
+        if len( self._sorted_terms ) == 0:
+            return None
+        return self._sorted_terms[ -1 ]
+
+    def newest_at_or_before( self, term: str ) -> Optional[Term]:
+        """
+        Returns the most recent available term that isn't later than the
+        given term (None if there isn't one)
+        """
+
+        idx = bisect.bisect_right( self._ordinals, as_term( term ).ordinal )
+        if idx == 0:
+            return None
+        return self._sorted_terms[ idx - 1 ]
+
+    def in_future( self, term: str ) -> bool:
+        """
+        Returns whether the given term is at or after every available
+        term (i.e. no available term occurs later than it)
+        """
+
+        if len( self._ordinals ) == 0:
+            return True
+        return self._ordinals[ -1 ] <= as_term( term ).ordinal
+
+    def newest_first( self, up_to: Optional[str] = None ) -> List[Term]:
+        """
+        Returns the available terms from most to least recent, optionally
+        only including those that aren't later than up_to
+        """
+
+        if up_to is None:
+            end = len( self._sorted_terms )
+        else:
+            end = bisect.bisect_right( self._ordinals, as_term( up_to ).ordinal )
+
+        return self._sorted_terms[ end - 1::-1 ] if end > 0 else []
+
+    def terms( self ) -> List[Term]:
+        """Returns all available terms, from least to most recent"""
+        return self._sorted_terms.copy()
+
+    #---------------------------------------------------------------------
+    # Overloaded Operators
+    #---------------------------------------------------------------------
+
+    def __contains__( self, term: object ) -> bool:
+        return term in self._terms
+
+    def __len__( self ) -> int:
+        return len( self._terms )
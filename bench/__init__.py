@@ -0,0 +1 @@
+"""Import Benchmark Files"""
@@ -0,0 +1,84 @@
+"""
+#=====================================================================
+# api_bench.py
+#=====================================================================
+# A benchmark of the bulk API fetcher against a local stub server,
+# with configurable latency and failures
+#
+# The server runs in its own process, as grequests patches this one's
+# threads and sockets
+#
+# Run from the top-level directory with:
+#
+#   python -m bench.api_bench [--latency MS] [--error-rate P] ...
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from api import bulk_api, class_api
+from bench.synthetic_catalog import TERMS, catalog_responses, gen_catalog
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser( description = "Bulk API fetcher benchmark" )
+    parser.add_argument( "--latency", type = float, default = 200.0, metavar = "MS",
+                         help = "Mean delay before each response, in milliseconds (default: 200)" )
+    parser.add_argument( "--jitter", type = float, default = 100.0, metavar = "MS",
+                         help = "Maximum random variation of the delay, in milliseconds " +
+                                "(default: 100)" )
+    parser.add_argument( "--error-rate", type = float, default = 0.05, metavar = "P",
+                         help = "Fraction of requests failing with a server error (default: 0.05)" )
+    parser.add_argument( "--not-found-rate", type = float, default = 0.0, metavar = "P",
+                         help = "Fraction of class requests answered as not found (default: 0)" )
+    parser.add_argument( "-s", type = int, default = 0, dest = "seed",
+                         help = "Random seed for the server (default: 0)" )
+    args = parser.parse_args()
+
+    fixtures = catalog_responses( gen_catalog(), TERMS )
+    with tempfile.NamedTemporaryFile( "w", suffix = ".json", delete = False ) as fixture_file:
+        json.dump( fixtures, fixture_file )
+
+    with subprocess.Popen( [ sys.executable, "-m", "bench.stub_server", fixture_file.name,
+                             "-p", "0", "-s", str( args.seed ),
+                             "--latency", str( args.latency ), "--jitter", str( args.jitter ),
+                             "--error-rate", str( args.error_rate ),
+                             "--not-found-rate", str( args.not_found_rate ) ],
+                           stdout = subprocess.PIPE, text = True ) as server:
+        assert server.stdout is not None
+
+        # The server announces its URL once it's listening
+        class_api.set_api_base_url( server.stdout.readline().split()[-1] )
+
+        start = time.perf_counter()
+        class_api.refresh_rosters()
+        rosters_time = time.perf_counter() - start
+
+        req_list = [ ( key.split( "/" )[0], key.split( "/" )[1] ) for key in fixtures ]
+
+        start = time.perf_counter()
+        bulk_api.bulk_populate_data( req_list )
+        fetch_time = time.perf_counter() - start
+
+        cached = sum( class_api.in_cache( term, dept ) for term, dept in req_list )
+
+        # A second pass is served entirely from the cache
+        start = time.perf_counter()
+        bulk_api.bulk_populate_data( req_list )
+        cached_time = time.perf_counter() - start
+
+        server.terminate()
+
+    os.remove( fixture_file.name )
+
+    print( f"Departments: {len( req_list )} ({cached} cached)" )
+    print( f" - rosters:      {rosters_time * 1e3:10.1f} ms" )
+    print( f" - bulk fetch:   {fetch_time * 1e3:10.1f} ms ({bulk_api.stats})" )
+    print( f" - cached fetch: {cached_time * 1e3:10.1f} ms" )
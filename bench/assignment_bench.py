@@ -0,0 +1,55 @@
+"""
+#=====================================================================
+# assignment_bench.py
+#=====================================================================
+# A benchmark of the course-to-requirement assignment solver on
+# synthetic transcripts
+#
+# Run from the top-level directory with:
+#
+#   python -m bench.assignment_bench [-n NUM_STUDENTS] [-s SEED]
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from bench.synthetic_catalog import install_catalog, gen_transcript
+from checks.rules.ece_rules import ECE_CHECKS
+from checks.rules.rule_compiler import build_eligibility_index
+from checks.rules.assignment_solver import AssignmentSolver
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser( description = "Assignment solver benchmark" )
+    parser.add_argument( "-n", type = int, default = 1000, dest = "num_students",
+                         help = "Number of students to simulate (default: 1000)" )
+    parser.add_argument( "-s", type = int, default = 0, dest = "seed",
+                         help = "Random seed for the synthetic transcripts (default: 0)" )
+    args = parser.parse_args()
+
+    rng = random.Random( args.seed )
+    catalog = install_catalog()
+    transcripts = [ gen_transcript( f"st{idx}", catalog, rng )
+                    for idx in range( args.num_students ) ]
+
+    solver = AssignmentSolver( ECE_CHECKS, build_eligibility_index( ECE_CHECKS ) )
+
+    times: List[float] = []
+    feasible = 0
+    for transcript in transcripts:
+        start = time.perf_counter()
+        assignment = solver.solve( transcript )
+        times.append( time.perf_counter() - start )
+        feasible += assignment.feasible
+
+    times.sort()
+    total = sum( times )
+    print( f"Students: {args.num_students} ({feasible} with a complete assignment)" )
+    print( f" - total:  {total * 1e3:10.1f} ms" )
+    print( f" - mean:   {total / len( times ) * 1e6:10.1f} us per student" )
+    print( f" - median: {times[ len( times ) // 2 ] * 1e6:10.1f} us per student" )
+    print( f" - p99:    {times[ int( len( times ) * 0.99 ) ] * 1e6:10.1f} us per student" )
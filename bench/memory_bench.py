@@ -0,0 +1,119 @@
+"""
+#=====================================================================
+# memory_bench.py
+#=====================================================================
+# A benchmark of the memory used by roster entries, comparing the
+# compact (__slots__ and packed validity) representation against the
+# previous dictionary-based representation
+#
+# Run from the top-level directory with:
+#
+#   python -m bench.memory_bench [-n NUM_STUDENTS]
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List
+
+from obj.coordinates_obj import Coordinates
+from obj.roster_entry_obj import ReqEntry, UNCHECKED, VALID, WARNING
+from ui.parser import parse_class_name, parse_class_term, parse_grade
+
+# Number of requirement entries on a typical checklist
+ENTRIES_PER_STUDENT = 40
+
+#---------------------------------------------------------------------
+# Previous Representation
+#---------------------------------------------------------------------
+# A reproduction of the previous layout, kept only for comparison
+
+class _DictCoordinates:
+    """Coordinates with a per-instance __dict__"""
+
+    def __init__( self, y: int, x: int ):
+        self.y = y
+        self.x = x
+
+class _DictReqEntry:
+    """A requirement entry with a per-instance __dict__ and validity dict"""
+
+    def __init__( self, idx: int ):
+        self.req          = "4000+"
+        self.coord        = _DictCoordinates( idx, 6 )
+        self.course_used  = parse_class_name( "ECE 4750" )
+        self.cred_applied = int( "4" )
+        self.term         = parse_class_term( "FA23" )
+        self.grade        = parse_grade( "A-" )
+        self.cat          = ""
+        self.validity: Dict[str, int] = {
+            "req"    : UNCHECKED,
+            "course" : UNCHECKED,
+            "cred"   : UNCHECKED,
+            "term"   : UNCHECKED,
+            "grade"  : UNCHECKED,
+            "cat"    : UNCHECKED
+        }
+
+    def mark( self ) -> None:
+        """Applies the validity updates a typical run would"""
+        for component in ( "req", "course", "term", "grade" ):
+            self.validity[ component ] = max( self.validity[ component ], VALID )
+        self.validity[ "cred" ] = max( self.validity[ "cred" ], WARNING )
+
+#---------------------------------------------------------------------
+# Current Representation
+#---------------------------------------------------------------------
+
+def _make_req_entry( idx: int ) -> ReqEntry:
+    """Makes a requirement entry, applying typical validity updates"""
+
+    entry = ReqEntry( "4000+", "ECE 4750", Coordinates( idx, 6 ), "4", "FA23", "A-", "" )
+    for component in ( "req", "course", "term", "grade" ):
+        entry.valid( component )
+    entry.warn( "cred" )
+    return entry
+
+def _make_dict_entry( idx: int ) -> _DictReqEntry:
+    """Makes a dictionary-based entry, applying typical validity updates"""
+
+    entry = _DictReqEntry( idx )
+    entry.mark()
+    return entry
+
+#---------------------------------------------------------------------
+# Measurement
+#---------------------------------------------------------------------
+
+def measure( make_entry: Callable[[int], object], num_entries: int ) -> int:
+    """Returns the number of bytes held by num_entries entries"""
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    entries: List[object] = [ make_entry( idx ) for idx in range( num_entries ) ]
+
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del entries
+    return end - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser( description = "Roster entry memory benchmark" )
+    parser.add_argument( "-n", type = int, default = 1000, dest = "num_students",
+                         help = "Number of students to simulate (default: 1000)" )
+    args = parser.parse_args()
+
+    total_entries = args.num_students * ENTRIES_PER_STUDENT
+
+    dict_bytes    = measure( _make_dict_entry, total_entries )
+    compact_bytes = measure( _make_req_entry,  total_entries )
+
+    print( f"Entries: {total_entries} ({args.num_students} students)" )
+    print( f" - dict-based: {dict_bytes:>12,d} bytes ({dict_bytes / total_entries:.1f} per entry)" )
+    print( f" - compact:    {compact_bytes:>12,d} bytes " +
+           f"({compact_bytes / total_entries:.1f} per entry)" )
+    print( f" - savings:    {1 - compact_bytes / dict_bytes:.1%}" )
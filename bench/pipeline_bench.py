@@ -0,0 +1,289 @@
+"""
+#=====================================================================
+# pipeline_bench.py
+#=====================================================================
+# An end-to-end benchmark of each phase of grad_val.py on synthetic
+# cohorts of increasing size, saving the results as JSON so that they
+# can be compared between commits
+#
+# Run from the top-level directory with:
+#
+#   python -m bench.pipeline_bench [-n SIZE ...] [--rules] [--assign] [--window N]
+#                                  [--compare OLD_JSON]
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Union
+
+from bench.synthetic_cohort import gen_cohort
+from bench.synthetic_catalog import load_catalog
+from obj.grades_obj import Grades
+from obj import sections_obj
+from checks.checks_manager import ChecksManager
+from checks.pipeline import STAGES, StudentStream, add_checks
+from checks.results_sink import ResultsSink
+from checks.rules.execution_plan import ExecutionPlan
+from ui.ambiguities import set_batch
+from ui.logger import gen_file_logger
+from ui.results_export import ResultsWriter
+
+# The phases of grad_val.py, in the order they run; the phases of each
+# window of students (STAGES) are totalled across the windows, with the
+# API data fetched for each window counted in "api"
+PHASES = [ "grades", "setup", "api" ] + [ stage for stage in STAGES if stage != "api" ]
+
+REPO_DIR = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+# The results of a benchmark run
+Results = Dict[ str, Union[ str, bool, Dict[ str, Dict[ str, Union[ int, float, str ] ] ] ] ]
+
+#---------------------------------------------------------------------
+# Pipeline
+#---------------------------------------------------------------------
+# Runs the same phases as grad_val.py (with -g, -s, and --batch) on a
+# cohort, with the checks added and the students streamed through them
+# by the same code (checks/pipeline.py), and the offline catalog
+# standing in for the network requests. This runs in a fresh process
+# for each cohort, as the API and check caches last for a whole run
+
+class PipelineRun:
+    """
+    A run of grad_val.py's phases on a synthetic cohort
+
+    Attributes:
+
+     - cohort_dir: The directory of the cohort (str)
+
+     - rules: Whether to use the compiled rules engine (bool)
+
+     - assign: Whether to assign the grades to the requirements (bool)
+
+     - window: The number of students to stream through at a time (int)
+
+     - log_dir: The directory to log to (str)
+
+     - grades: The grades of the cohort (Grades)
+
+     - checks_mngr: The manager of the checks to run (ChecksManager)
+
+     - rules_plan: The compiled rules, if used (ExecutionPlan or None)
+    """
+
+    def __init__( self, cohort_dir: str, rules: bool, assign: bool, window: int ):
+        self.cohort_dir = cohort_dir
+        self.rules      = rules
+        self.assign     = assign
+        self.window     = window
+        self.log_dir    = os.path.join( cohort_dir, "logs" )
+
+        self.grades     = Grades()
+        self.rules_plan: Optional[ExecutionPlan] = None
+
+        os.makedirs( self.log_dir, exist_ok = True )
+        self.checks_mngr = ChecksManager( ResultsSink( os.path.join( self.log_dir,
+                                                                     "results.jsonl" ) ) )
+        self.summary_logger = gen_file_logger( os.path.join( self.log_dir, "summary.log" ) )
+
+        # Questions are deferred, as there's no one to answer them
+        set_batch( True )
+
+    def load_grades( self ) -> None:
+        """Loads the grades and sections"""
+
+        grades_path = os.path.join( self.cohort_dir, "grades.csv" )
+        self.grades += Grades( grades_path )
+        sections_obj.add_section_data( grades_path )
+
+    def populate_api( self ) -> None:
+        """Caches the API data, and populates the aliases that depend on it"""
+
+        load_catalog( os.path.join( self.cohort_dir, "catalog.json" ) )
+        self.grades.populate_aliases()
+        sections_obj.populate_aliases( self.grades.get_aliases() )
+
+    def add_checks( self ) -> None:
+        """Adds the checks, as grad_val.py does"""
+
+        self.rules_plan = add_checks( self.checks_mngr, self.grades, semantics = True,
+                                      rules = self.rules, assign = self.assign, batch = True )
+
+    def run( self ) -> Dict[ str, float ]:
+        """Runs each phase, returning the time taken by each"""
+
+        timings: Dict[ str, float ] = { phase: 0.0 for phase in PHASES }
+        start = time.perf_counter()
+
+        def end_phase( phase: str ) -> None:
+            nonlocal start
+            end = time.perf_counter()
+            timings[ phase ] += end - start
+            start = end
+
+        self.load_grades()
+        end_phase( "grades" )
+        self.add_checks()
+        end_phase( "setup" )
+        self.populate_api()
+        end_phase( "api" )
+
+        results_writer = ResultsWriter( os.path.join( self.log_dir, "results" ), "csv",
+                                        list( self.checks_mngr.checks ) )
+        stream = StudentStream( self.checks_mngr, results_writer,
+                                os.path.join( self.log_dir, "annotated-checklists" ),
+                                semantics = True, rules_plan = self.rules_plan )
+        self.checks_mngr.open_logs( self.log_dir, self.summary_logger )
+
+        checklist_paths = sorted( glob.glob( os.path.join( self.cohort_dir, "checklists",
+                                                           "*.xlsx" ) ) )
+        stream.run( checklist_paths, self.window, self.summary_logger,
+                    stage_hook = lambda window_idx, stage : end_phase( stage ) )
+
+        self.checks_mngr.summary( self.summary_logger )
+        results_writer.close()
+        end_phase( "export" )
+        return timings
+
+#---------------------------------------------------------------------
+# Benchmark Suite
+#---------------------------------------------------------------------
+
+def bench_size( num_students: int, work_dir: str, seed: int,
+                flags: List[str] ) -> Dict[ str, Union[ int, float, str ] ]:
+    """
+    Generates a cohort of the given size and times grad_val.py's phases
+    on it (run with the given flags), returning the time (in seconds) of
+    each phase. If the run fails, the error is recorded instead of the
+    phases
+    """
+
+    cohort_dir = os.path.join( work_dir, f"n{num_students}" )
+    result: Dict[ str, Union[ int, float, str ] ] = { "students": num_students }
+
+    start = time.perf_counter()
+    gen_cohort( num_students, cohort_dir, seed )
+    result[ "generate" ] = time.perf_counter() - start
+
+    timings_path = os.path.join( cohort_dir, "timings.json" )
+    command = [ sys.executable, "-m", "bench.pipeline_bench", "--run", cohort_dir, *flags ]
+
+    proc = subprocess.run( command, cwd = REPO_DIR, stdout = subprocess.DEVNULL,
+                           stderr = subprocess.PIPE, text = True, check = False )
+
+    if proc.returncode != 0:
+        result[ "error" ] = proc.stderr.strip().splitlines()[-1]
+        return result
+
+    with open( timings_path, "r", encoding = "utf-8" ) as timings_file:
+        timings: Dict[ str, float ] = json.load( timings_file )
+
+    result.update( timings )
+    result[ "total" ] = sum( timings.values() )
+    return result
+
+def current_commit() -> str:
+    """Returns the short hash of the current commit, if available"""
+
+    proc = subprocess.run( [ "git", "rev-parse", "--short", "HEAD" ], cwd = REPO_DIR,
+                           capture_output = True, text = True, check = False )
+    return proc.stdout.strip() if proc.returncode == 0 else "unknown"
+
+def print_results( results: Results, baseline: Optional[Results] = None ) -> None:
+    """Prints the results, with the ratio to a baseline's times if given"""
+
+    sizes     = results[ "sizes" ]
+    old_sizes = baseline[ "sizes" ] if baseline is not None else {}
+    assert isinstance( sizes, dict ) and isinstance( old_sizes, dict )
+
+    for size, result in sizes.items():
+        print( f"Students: {size}" )
+        if "error" in result:
+            print( f" - failed: {result[ 'error' ]}" )
+            continue
+
+        old_result = old_sizes.get( size, {} )
+        for phase in [ "generate" ] + PHASES + [ "total" ]:
+            line = f" - {phase + ':':10} {float( result[ phase ] ):10.3f} s"
+            if isinstance( old_result.get( phase ), float ):
+                line += f"  ({float( result[ phase ] ) / float( old_result[ phase ] ):5.2f}x " + \
+                        "baseline)"
+            print( line )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser( description = "End-to-end pipeline benchmark" )
+    parser.add_argument( "-n", type = int, nargs = "+", default = [ 10, 100, 1000, 10000 ],
+                         dest = "sizes", metavar = "SIZE",
+                         help = "Cohort sizes to benchmark (default: 10 100 1000 10000)" )
+    parser.add_argument( "-s", type = int, default = 0, dest = "seed",
+                         help = "Random seed for the synthetic cohorts (default: 0)" )
+    parser.add_argument( "--rules", action = "store_true",
+                         help = "Evaluate semantics checks with the compiled rules engine" )
+    parser.add_argument( "--assign", action = "store_true",
+                         help = "Assign the grades to the requirements" )
+    parser.add_argument( "--window", type = int, default = 64, metavar = "N",
+                         help = "Students to stream through at a time (default: 64)" )
+    parser.add_argument( "-o", dest = "out_path",
+                         help = "Where to save the results (default: " +
+                                "bench/results/pipeline-COMMIT.json)" )
+    parser.add_argument( "--compare", metavar = "OLD_JSON",
+                         help = "Previous results to compare against" )
+    parser.add_argument( "--keep", metavar = "DIR",
+                         help = "Generate the cohorts in DIR, and keep them afterwards" )
+    parser.add_argument( "--run", metavar = "COHORT_DIR", help = argparse.SUPPRESS )
+    args = parser.parse_args()
+
+    if args.run is not None: # A single run, in a fresh process
+        pipeline_timings = PipelineRun( args.run, args.rules, args.assign, args.window ).run()
+        with open( os.path.join( args.run, "timings.json" ), "w",
+                   encoding = "utf-8" ) as out_file:
+            json.dump( pipeline_timings, out_file )
+        sys.exit( 0 )
+
+    run_flags = [ "--window", str( args.window ) ]
+    if args.rules:
+        run_flags.append( "--rules" )
+    if args.assign:
+        run_flags.append( "--assign" )
+
+    commit = current_commit()
+    bench_results: Results = {
+        "commit" : commit,
+        "date"   : datetime.datetime.now().isoformat( timespec = "seconds" ),
+        "python" : platform.python_version(),
+        "rules"  : args.rules,
+        "assign" : args.assign,
+        "window" : args.window,
+        "sizes"  : {}
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num in args.sizes:
+            size_results = bench_results[ "sizes" ]
+            assert isinstance( size_results, dict )
+            size_results[ str( num ) ] = bench_size( num, args.keep or tmp_dir, args.seed,
+                                                     run_flags )
+
+    out_path = args.out_path or os.path.join( REPO_DIR, "bench", "results",
+                                              f"pipeline-{commit}.json" )
+    os.makedirs( os.path.dirname( os.path.abspath( out_path ) ), exist_ok = True )
+    with open( out_path, "w", encoding = "utf-8" ) as results_file:
+        json.dump( bench_results, results_file, indent = 2 )
+
+    baseline_results = None
+    if args.compare is not None:
+        with open( args.compare, "r", encoding = "utf-8" ) as baseline_file:
+            baseline_results = json.load( baseline_file )
+
+    print_results( bench_results, baseline_results )
+    print( f"Results saved to {os.path.relpath( out_path )}" )
@@ -0,0 +1,223 @@
+"""
+#=====================================================================
+# stub_server.py
+#=====================================================================
+# A local stand-in for the classes.cornell.edu API, serving rosters and
+# classes from fixture files with configurable latency and failures
+#
+# Run from the top-level directory with:
+#
+#   python -m bench.stub_server FIXTURES [-p PORT] [--latency MS] ...
+#
+# and point the API wrappers at it with the CLASSES_API_URL environment
+# variable (or grad_val.py's --api-url flag)
+#
+# This deliberately doesn't import the rest of the code, as importing
+# the api package has grequests patch the standard library's sockets
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple, cast
+from urllib.parse import urlparse, parse_qs
+
+# The path that the API is served under, as on classes.cornell.edu
+API_PREFIX = "/api/2.0"
+
+# The seasons of a year, in order (as in ui.parser)
+SEASONS = ( "WI", "SP", "SU", "FA" )
+
+#---------------------------------------------------------------------
+# Configuration
+#---------------------------------------------------------------------
+
+class StubConfig:
+    """
+    The behavior of the stub server
+
+    Attributes:
+
+     - latency: The mean delay before responding, in seconds (float)
+
+     - jitter: The maximum random variation of the delay, in seconds
+               (float)
+
+     - error_rate: The fraction of requests that fail with a server
+                   error (HTTP 500) (float)
+
+     - not_found_rate: The fraction of class requests answered with a
+                       "status" other than "success", even if the
+                       fixtures have data for them (float)
+
+     - rng: The source of randomness for delays and failures
+            (random.Random)
+    """
+
+    def __init__( self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                  not_found_rate: float = 0.0, seed: Optional[int] = None ):
+        self.latency        = latency
+        self.jitter         = jitter
+        self.error_rate     = error_rate
+        self.not_found_rate = not_found_rate
+        self.rng            = random.Random( seed )
+        self._lock          = threading.Lock()
+
+    def draw( self ) -> Tuple[ float, bool, bool ]:
+        """
+        Returns the delay for a request, and whether it should fail with a
+        server error or be answered as not found
+        """
+
+        with self._lock: # Handlers run on separate threads
+            delay = self.latency + self.rng.uniform( -self.jitter, self.jitter )
+            return ( max( delay, 0.0 ), self.rng.random() < self.error_rate,
+                     self.rng.random() < self.not_found_rate )
+
+#---------------------------------------------------------------------
+# Fixtures
+#---------------------------------------------------------------------
+
+def load_fixtures( path: str ) -> Dict[ str, dict ]:
+    """
+    Loads fixtures from a JSON file mapping "TERM/DEPT" to the API's
+    response for that department's classes (such as the catalog.json
+    written by bench.synthetic_cohort)
+    """
+
+    with open( path, "r", encoding = "utf-8" ) as fixture_file:
+        return cast( Dict[ str, dict ], json.load( fixture_file ) )
+
+def rosters_response( fixtures: Dict[ str, dict ] ) -> dict:
+    """Returns the rosters response for the terms in the fixtures"""
+
+    terms = sorted( { key.split( "/" )[0] for key in fixtures },
+                    key = lambda term: ( int( term[2:] ), SEASONS.index( term[:2] ) ) )
+    return { "status": "success", "data": { "rosters": [ { "slug": term } for term in terms ] } }
+
+def not_found_response( term: str, dept: str ) -> dict:
+    """Returns the API's response when it has no classes for a request"""
+
+    return { "status": "error", "data": None,
+             "message": f"No classes found for {dept} in {term}" }
+
+#---------------------------------------------------------------------
+# Server
+#---------------------------------------------------------------------
+
+class StubServer( ThreadingHTTPServer ):
+    """
+    A server answering API requests from fixtures
+
+    Attributes:
+
+     - fixtures: The response for each department in each term (dict
+                 mapping "TERM/DEPT" to dict)
+
+     - config: The behavior of the server (StubConfig)
+
+     - rosters: The response for the available rosters (dict)
+    """
+
+    daemon_threads     = True
+    request_queue_size = 1024 # The bulk fetcher connects all at once
+
+    def __init__( self, fixtures: Dict[ str, dict ], config: StubConfig,
+                  address: Tuple[ str, int ] = ( "localhost", 0 ) ):
+        self.fixtures = fixtures
+        self.config   = config
+        self.rosters  = rosters_response( fixtures )
+        super().__init__( address, StubHandler )
+
+    @property
+    def base_url( self ) -> str:
+        """The base URL to point the API wrappers at"""
+
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}{API_PREFIX}"
+
+class StubHandler( BaseHTTPRequestHandler ):
+    """A handler for a single API request"""
+
+    server: StubServer
+
+    def do_GET( self ) -> None: # pylint: disable=invalid-name
+        """Answers a GET request, after the configured delay"""
+
+        delay, server_error, not_found = self.server.config.draw()
+        time.sleep( delay )
+
+        if server_error:
+            self.respond( 500, { "status": "error", "message": "Internal server error" } )
+            return
+
+        url   = urlparse( self.path )
+        query = parse_qs( url.query )
+
+        if url.path == f"{API_PREFIX}/config/rosters.json":
+            self.respond( 200, self.server.rosters )
+
+        elif url.path == f"{API_PREFIX}/search/classes.json":
+            term = query.get( "roster",  [ "" ] )[0]
+            dept = query.get( "subject", [ "" ] )[0]
+            key  = f"{term}/{dept}"
+
+            if ( key in self.server.fixtures ) and not not_found:
+                self.respond( 200, self.server.fixtures[ key ] )
+            else:
+                self.respond( 200, not_found_response( term, dept ) )
+
+        else:
+            self.respond( 404, { "status": "error", "message": f"Unknown path {url.path}" } )
+
+    def respond( self, code: int, body: dict ) -> None:
+        """Sends a JSON response"""
+
+        content = json.dumps( body ).encode( "utf-8" )
+        self.send_response( code )
+        self.send_header( "Content-Type", "application/json" )
+        self.send_header( "Content-Length", str( len( content ) ) )
+        self.end_headers()
+        self.wfile.write( content )
+
+    def log_message( self, *_: object ) -> None: # pylint: disable=arguments-differ
+        """Silences the per-request logging"""
+
+#---------------------------------------------------------------------
+# Main Code
+#---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description = "Local stand-in for the classes.cornell.edu API" )
+    parser.add_argument( "fixtures", metavar = "FIXTURES",
+                         help = "JSON file mapping \"TERM/DEPT\" to the API's response" )
+    parser.add_argument( "--host", default = "localhost", help = "Host to serve on" )
+    parser.add_argument( "-p", "--port", type = int, default = 8000,
+                         help = "Port to serve on (default: 8000)" )
+    parser.add_argument( "--latency", type = float, default = 0.0, metavar = "MS",
+                         help = "Mean delay before each response, in milliseconds" )
+    parser.add_argument( "--jitter", type = float, default = 0.0, metavar = "MS",
+                         help = "Maximum random variation of the delay, in milliseconds" )
+    parser.add_argument( "--error-rate", type = float, default = 0.0, metavar = "P",
+                         help = "Fraction of requests failing with a server error" )
+    parser.add_argument( "--not-found-rate", type = float, default = 0.0, metavar = "P",
+                         help = "Fraction of class requests answered with \"status\": \"error\"" )
+    parser.add_argument( "-s", "--seed", type = int, help = "Random seed" )
+    args = parser.parse_args()
+
+    stub_config = StubConfig( args.latency / 1000, args.jitter / 1000, args.error_rate,
+                              args.not_found_rate, args.seed )
+    server = StubServer( load_fixtures( args.fixtures ), stub_config, ( args.host, args.port ) )
+
+    print( f"Serving the API at {server.base_url}", flush = True )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,207 @@
+"""
+#=====================================================================
+# synthetic_catalog.py
+#=====================================================================
+# A synthetic course catalog and transcripts, cached directly into the
+# API wrappers (or saved as an offline catalog) so that benchmarks can
+# run without network access
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import json
+import random
+from typing import Dict, Iterable, List, Tuple
+
+from api import class_api
+from obj.class_record_obj import ClassRecord
+
+# The term that the synthetic transcripts are taken in
+TERM = "FA23"
+
+# The terms that the synthetic courses are offered in, for synthetic
+# checklists spanning four years
+TERMS = ( "FA20", "SP21", "FA21", "SP22", "FA22", "SP23", "FA23", "SP24" )
+
+# The liberal studies category of the courses in each department
+LS_CATEGORIES: Dict[ str, str ] = {
+    "PHIL" : "ETM", "HIST" : "HA", "ECON" : "SBA", "ASIAN" : "GLC", "MUSIC" : "LA"
+}
+
+#---------------------------------------------------------------------
+# Catalog
+#---------------------------------------------------------------------
+
+# Courses that the requirements name specifically, with their num_cred
+NAMED_COURSES: Dict[ str, int ] = {
+    "MATH 1910" : 4, "MATH 1920" : 4, "MATH 2930" : 4, "MATH 2940" : 4,
+    "CS 1110"   : 4, "CS 1112"   : 4, "CHEM 2090" : 4,
+    "PHYS 1110" : 1, "PHYS 1112" : 4, "PHYS 1116" : 4,
+    "PHYS 2213" : 4, "PHYS 2217" : 4, "PHYS 2214" : 4, "PHYS 2218" : 4,
+    "ECE 2100"  : 4, "ECE 2200"  : 4, "ECE 2300"  : 4, "ECE 2400"  : 4, "ECE 2720" : 4,
+    "ECE 3030"  : 4, "ECE 3100"  : 4, "ECE 3140"  : 4, "ECE 3150"  : 4, "ECE 3250" : 4,
+    "ECE 4530"  : 4, "ECE 4670"  : 4, "ECE 4740"  : 4, "ECE 4750"  : 4, "ECE 4760" : 4,
+    "CS 2110"   : 3, "CS 3410"   : 4, "CS 4410"   : 4, "CS 4120"   : 4,
+    "COMM 3020" : 3
+}
+
+def _class_json( name: str, num_cred: int, fws: bool = False ) -> dict:
+    """Returns the API data for a synthetic class"""
+
+    dept, number = name.split( " " )
+    title = f"{name} Title"
+    distr = f"({LS_CATEGORIES[ dept ]}-AS)" if dept in LS_CATEGORIES else ""
+    return {
+        "subject"           : dept,
+        "catalogNbr"        : number,
+        "titleShort"        : title,
+        "titleLong"         : f"FWS: {title}" if fws else title,
+        "catalogDistr"      : distr,
+        "acadGroup"         : "EN",
+        "acadCareer"        : "UG",
+        "catalogComments"   : "",
+        "catalogPrereqCoreq": "",
+        "enrollGroups"      : [ {
+            "classSections"     : [ { "section": "001" } ],
+            "simpleCombinations": [],
+            "unitsMinimum"      : num_cred,
+            "unitsMaximum"      : num_cred
+        } ]
+    }
+
+def gen_catalog() -> Dict[ str, List[ Tuple[ str, int ] ] ]:
+    """
+    Returns the synthetic catalog, as a list of (course name, num_cred)
+    for each department
+    """
+
+    catalog: Dict[ str, List[ Tuple[ str, int ] ] ] = {}
+
+    def add( name: str, num_cred: int ) -> None:
+        catalog.setdefault( name.split( " " )[0], [] ).append( ( name, num_cred ) )
+
+    for name, num_cred in NAMED_COURSES.items():
+        add( name, num_cred )
+
+    for number in range( 3300, 6000, 50 ): # ECE technical electives
+        if f"ECE {number}" not in NAMED_COURSES:
+            add( f"ECE {number}", 3 if number % 200 == 0 else 4 )
+
+    for idx in range( 20 ):
+        add( f"PE {1100 + idx}", 1 )
+        add( f"ENGRD {2600 + idx}", 3 )
+        add( f"ENGRI {1100 + idx}", 3 )
+        add( f"ENGL {1100 + idx}", 3 ) # FWSs
+        add( f"HIST {1500 + idx * 10}", 3 )
+        add( f"ENGRC {3000 + idx * 10}", 3 )
+        add( f"PHIL {1100 + idx * 10}", 3 )
+        add( f"ECON {1100 + idx * 10}", 3 )
+        add( f"ASIAN {2200 + idx * 10}", 3 )
+        add( f"MUSIC {1300 + idx * 10}", 3 )
+
+    return catalog
+
+def catalog_credits( catalog: Dict[ str, List[ Tuple[ str, int ] ] ] ) -> Dict[ str, int ]:
+    """Returns the credits of each course in the catalog"""
+
+    return { name: num_cred for dept_courses in catalog.values()
+             for name, num_cred in dept_courses }
+
+def catalog_responses( catalog: Dict[ str, List[ Tuple[ str, int ] ] ],
+                       terms: Iterable[str] ) -> Dict[ str, dict ]:
+    """
+    Returns the API response for each department in each term, keyed by
+    "TERM/DEPT"
+    """
+
+    responses: Dict[ str, dict ] = {}
+
+    for dept, courses in catalog.items():
+        classes = [ _class_json( name, num_cred, fws = dept == "ENGL" )
+                    for name, num_cred in courses ]
+        for term in terms:
+            responses[ f"{term}/{dept}" ] = { "status": "success",
+                                              "data"  : { "classes": classes } }
+
+    return responses
+
+def _cache_responses( responses: Dict[ str, dict ] ) -> None:
+    """Caches API responses (keyed by "TERM/DEPT") in the API wrappers"""
+
+    class_api.set_rosters( sorted( { key.split( "/" )[0] for key in responses } ) )
+
+    for key, response in responses.items():
+        term, dept = key.split( "/" )
+        class_api.cache_data( dept, term, response )
+
+def install_catalog( terms: Iterable[str] = ( TERM, ) ) -> Dict[ str, List[ Tuple[ str, int ] ] ]:
+    """
+    Caches the synthetic catalog in the API wrappers for the given terms
+    (replacing the available rosters), returning the catalog
+    """
+
+    catalog = gen_catalog()
+    _cache_responses( catalog_responses( catalog, terms ) )
+    return catalog
+
+def save_catalog( path: str, terms: Iterable[str] = TERMS ) -> None:
+    """Saves the synthetic catalog as an offline catalog of API responses"""
+
+    with open( path, "w", encoding = "utf-8" ) as catalog_file:
+        json.dump( catalog_responses( gen_catalog(), terms ), catalog_file )
+
+def load_catalog( path: str ) -> None:
+    """Caches an offline catalog in the API wrappers"""
+
+    with open( path, "r", encoding = "utf-8" ) as catalog_file:
+        _cache_responses( json.load( catalog_file ) )
+
+#---------------------------------------------------------------------
+# Transcripts
+#---------------------------------------------------------------------
+
+def gen_transcript( netid: str, catalog: Dict[ str, List[ Tuple[ str, int ] ] ],
+                    rng: random.Random ) -> List[ClassRecord]:
+    """
+    Returns a synthetic transcript, usually (but not always) satisfying
+    the requirements
+    """
+
+    all_credits = catalog_credits( catalog )
+    courses: Dict[ str, int ] = {}
+
+    def take( choices: List[str] ) -> None:
+        name = rng.choice( choices )
+        courses[ name ] = all_credits[ name ]
+
+    for choices in ( [ "MATH 1910" ], [ "MATH 1920" ], [ "MATH 2930" ], [ "MATH 2940" ],
+                     [ "CS 1110", "CS 1112" ], [ "CHEM 2090" ], [ "PHYS 1116" ],
+                     [ "PHYS 2213", "PHYS 2217" ], [ "PHYS 2214", "PHYS 2218" ],
+                     [ "ECE 2300" ], [ "ECE 2100" ], [ "ECE 2200", "ECE 2720" ] ):
+        take( choices )
+
+    for dept, num in ( ( "PE", 2 ), ( "ENGRD", 1 ), ( "ENGRI", 1 ), ( "ENGL", 2 ), ( "HIST", 6 ) ):
+        for name, num_cred in rng.sample( catalog[ dept ], num ):
+            courses[ name ] = num_cred
+
+    foundations = [ rng.choice( [ "ECE 3030", "ECE 3150" ] ),
+                    rng.choice( [ "ECE 3100", "ECE 3250" ] ) ]
+    foundations.append( rng.choice( [ name for name in ( "ECE 3030", "ECE 3100", "ECE 3140",
+                                                         "ECE 3150", "ECE 3250" )
+                                      if name not in foundations ] ) )
+    for name in foundations:
+        courses[ name ] = all_credits[ name ]
+
+    take( [ "ECE 4530", "ECE 4670", "ECE 4740", "ECE 4750", "ECE 4760" ] )
+
+    electives = [ ( name, num_cred ) for name, num_cred in catalog[ "ECE" ]
+                  if name not in NAMED_COURSES ]
+    for name, num_cred in rng.sample( electives, 6 ):
+        courses[ name ] = num_cred
+
+    # Some students are missing a course
+    if rng.random() < 0.2:
+        del courses[ rng.choice( list( courses ) ) ]
+
+    return [ ClassRecord( netid, name, TERM, num_cred, "A" ) for name, num_cred in courses.items() ]
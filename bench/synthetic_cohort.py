@@ -0,0 +1,405 @@
+"""
+#=====================================================================
+# synthetic_cohort.py
+#=====================================================================
+# A generator of synthetic cohorts: checklists filled in from the
+# layout of a template checklist, along with matching registrar grades
+# and an offline catalog
+#
+# Run from the top-level directory with:
+#
+#   python -m bench.synthetic_cohort -n NUM_STUDENTS -o OUT_DIR [-s SEED]
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import csv
+import os
+import random
+from typing import Dict, List, Tuple, cast
+
+import openpyxl
+from openpyxl.worksheet.worksheet import Worksheet
+
+from bench.synthetic_catalog import NAMED_COURSES, LS_CATEGORIES, gen_catalog, catalog_credits, \
+                                    save_catalog
+from checks.ece_upper.tech_courses import nontech_courses
+from obj.checklist_obj import Checklist
+from obj.coordinates_obj import Coordinates
+
+# The template checklist that synthetic checklists are filled in from
+TEMPLATE_PATH = os.path.join( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ),
+                              "test_data", "checklist.xlsx" )
+
+# The columns of the registrar's grades CSV
+GRADES_FIELDS = [
+    "Academic Term Ldescr", "Academic Program", "Academic Plan Sdescr", "ClassTerm",
+    "Exp Grad Term Ldescr", "Employee Id", "Netid", "Effdt Primary Name", "Course Id",
+    "Academic Group", "Subject", "Catalog Nbr", "Ssr Component", "Class Section", "Class Descr",
+    "Unt Taken", "Official Grade", "Unt Taken Fa", "Unt Passd Prgrss", "Cur Gpa",
+    "Tot Passd Prgrss", "Cum Gpa", "GradeVal_FIXED2", "FailingGrade", "Below C Minus"
+]
+
+GRADES = [ "A+", "A", "A", "A-", "A-", "B+", "B+", "B", "B-", "C+", "C" ]
+
+SEASONS = { "FA": "Fall", "SP": "Spring", "SU": "Summer", "WI": "Winter" }
+
+# The fraction of checklists with a mistake in one of their entries
+MISTAKE_RATE = 0.1
+
+# The fraction of checklists with a course listed under a requirement
+# it doesn't satisfy (see misslot_pools)
+MISSLOT_RATE = 0.3
+
+# The fraction of checklists listing PHYS 1112 in a term after SU23
+# (which also needs PHYS 1110, which the template has no entry for)
+LATE_PHYS_1_RATE = 0.1
+LATE_PHYS_1_TERM = "FA23"
+
+# The fraction of checklists listing a course that doesn't exist
+NONEXISTENT_RATE = 0.1
+
+#---------------------------------------------------------------------
+# Requirement Pools
+#---------------------------------------------------------------------
+# The courses that a synthetic student may list under each requirement
+
+REQ_COURSES: Dict[ str, List[str] ] = {
+    "CALC."            : [ "MATH 1910" ],
+    "MULTI."           : [ "MATH 1920" ],
+    "DIFF. EQ."        : [ "MATH 2930" ],
+    "LIN. ALG."        : [ "MATH 2940" ],
+    "INTRO. PROG."     : [ "CS 1110", "CS 1112" ],
+    "GEN. CHEM."       : [ "CHEM 2090" ],
+    "PHYS. 1"          : [ "PHYS 1112", "PHYS 1116" ],
+    "EXP. PHYS."       : [ "PHYS 1110" ],
+    "PHYS. 2"          : [ "PHYS 2213", "PHYS 2217" ],
+    "PHYS. 3"          : [ "PHYS 2214", "PHYS 2218" ],
+    "DIG. LOGIC"       : [ "ECE 2300" ],
+    "CIRCUITS"         : [ "ECE 2100" ],
+    "DATA SCIENCE"     : [ "ECE 2200", "ECE 2720" ],
+    "ELECTROMAG."      : [ "ECE 3030" ],
+    "INTRO. PROB."     : [ "ECE 3100" ],
+    "EMBEDDED SYS."    : [ "ECE 3140" ],
+    "MICROELECTRONICS" : [ "ECE 3150" ],
+    "SIG. & SYS."      : [ "ECE 3250" ],
+    "CDE"              : [ "ECE 4530", "ECE 4670", "ECE 4740", "ECE 4750", "ECE 4760" ]
+}
+
+# Departments to draw from for the other requirements
+REQ_DEPTS: Dict[ str, List[str] ] = {
+    "PHYS. ED."      : [ "PE" ],
+    "ENGR. DIST."    : [ "ENGRD" ],
+    "ENGR. INTEREST" : [ "ENGRI" ],
+    "FWS"            : [ "ENGL" ],
+    "LS"             : sorted( LS_CATEGORIES ),
+    "AAE"            : [ "MUSIC", "HIST" ],
+    "OTE"            : [ "ENGRD", "CS" ],
+    "EXTRA-C"        : [ "ENGRC", "HIST" ]
+}
+
+def misslot_pools( pools: Dict[ str, List[str] ] ) -> Dict[ str, List[str] ]:
+    """
+    Returns the courses that may be mistakenly listed under some
+    requirements, which satisfy another requirement but not that one
+    """
+
+    foundations = REQ_COURSES[ "ELECTROMAG." ] + REQ_COURSES[ "INTRO. PROB." ] + \
+                  REQ_COURSES[ "EMBEDDED SYS." ] + REQ_COURSES[ "MICROELECTRONICS" ] + \
+                  REQ_COURSES[ "SIG. & SYS." ]
+    junior_electives = [ name for name in pools[ "3000+" ] if name not in pools[ "4000+" ] ]
+
+    # A non-CDE elective as the CDE, a 3000-level elective as a 4000+
+    # one, and another course as a foundation
+    return {
+        "CDE"           : pools[ "4000+" ],
+        "4000+"         : junior_electives,
+        "ELECTROMAG."   : [ name for name in foundations
+                            if name not in REQ_COURSES[ "ELECTROMAG." ] ],
+        "EMBEDDED SYS." : junior_electives
+    }
+
+def req_pools( catalog: Dict[ str, List[ Tuple[ str, int ] ] ] ) -> Dict[ str, List[str] ]:
+    """Returns the courses that may be listed under each requirement"""
+
+    pools = { req: list( names ) for req, names in REQ_COURSES.items() }
+
+    for req, depts in REQ_DEPTS.items():
+        pools[ req ] = [ name for dept in depts for name, _ in catalog[ dept ]
+                         if name not in NAMED_COURSES ]
+
+    electives = [ name for name, _ in catalog[ "ECE" ]
+                  if ( name not in NAMED_COURSES ) and ( name not in nontech_courses ) ]
+    pools[ "3000+" ] = electives
+    pools[ "4000+" ] = [ name for name in electives if int( name.split( " " )[1] ) >= 4000 ]
+
+    return pools
+
+#---------------------------------------------------------------------
+# ChecklistTemplate Object
+#---------------------------------------------------------------------
+
+class ChecklistTemplate:
+    """
+    The layout of a template checklist, as found by parsing it
+
+    Attributes:
+
+     - path: The path to the template (str)
+
+     - slots: The requirement entries, with the term the template lists
+              them in, by column and then row (list of (str,
+              Coordinates, str) tuples)
+
+     - attr_coords: The cell holding each student attribute (dict
+                    mapping the attribute's label to Coordinates)
+
+     - checkoff_coords: The cell holding the course for each checkoff
+                        (dict mapping str to Coordinates)
+    """
+
+    def __init__( self, path: str = TEMPLATE_PATH ):
+        self.path = path
+        checklist = Checklist( path )
+
+        # The entries are found in an arbitrary order, so they're sorted
+        # to generate the same cohort from the same seed
+        self.slots = sorted( ( ( entry.req, entry.coord, str( entry.term ) )
+                               for entry in checklist.req_entries ),
+                             key = lambda slot : ( slot[1].x, slot[1].y ) )
+
+        self.attr_coords: Dict[ str, Coordinates ] = {
+            label: checklist.find_cell( label )[0].right()
+            for label in ( "First Name:", "Last Name:", "NetID:", "CUID:" )
+        }
+
+        self.checkoff_coords: Dict[ str, Coordinates ] = {
+            entry.req: entry.coord.right().right() for entry in checklist.checkoff_entries
+        }
+
+#---------------------------------------------------------------------
+# Students
+#---------------------------------------------------------------------
+
+class SyntheticStudent:
+    """
+    A synthetic student, with their checklist and transcript
+
+    Attributes:
+
+     - netid: The student's NetID (str)
+
+     - cells: The values to write in the template's cells (dict
+              mapping (row, column) tuples, indexed from 0, to str)
+
+     - transcript: The courses the student took, as (course, term,
+                   num_cred, grade) tuples (list of tuples)
+    """
+
+    def __init__( self, netid: str ):
+        self.netid = netid
+        self.cells: Dict[ Tuple[ int, int ], str ] = {}
+        self.transcript: List[ Tuple[ str, str, int, str ] ] = []
+
+    def put( self, coord: Coordinates, offset: int, value: str ) -> None:
+        """Sets the value of the cell the given offset to the right of coord"""
+        self.cells[ ( coord.y, coord.x + offset ) ] = value
+
+def checkoff_courses( pools: Dict[ str, List[str] ], rng: random.Random ) -> Dict[ str, str ]:
+    """
+    Returns the courses to list under the first entry of some
+    requirements, so that the checkoffs are satisfied by a listed
+    course: a technical writing course under EXTRA-C, and an advanced
+    programming course under OTE (unless the CDE is one)
+    """
+
+    forced = { "EXTRA-C": rng.choice( [ name for name in pools[ "EXTRA-C" ]
+                                         if name.startswith( "ENGRC " ) ] ),
+               "CDE"    : rng.choice( pools[ "CDE" ] ) }
+    if forced[ "CDE" ] not in ( "ECE 4740", "ECE 4750" ):
+        forced[ "OTE" ] = "CS 2110"
+    return forced
+
+def gen_student( idx: int, template: ChecklistTemplate, pools: Dict[ str, List[str] ],
+                 all_credits: Dict[ str, int ], rng: random.Random ) -> SyntheticStudent:
+    """
+    Returns a synthetic student, listing a course for each of the
+    template's requirements in the term the template lists it in
+    """
+
+    student = SyntheticStudent( f"syn{idx}" )
+
+    student.put( template.attr_coords[ "First Name:" ], 0, "Synthetic" )
+    student.put( template.attr_coords[ "Last Name:" ],  0, f"Student {idx}" )
+    student.put( template.attr_coords[ "NetID:" ],      0, student.netid )
+    student.put( template.attr_coords[ "CUID:" ],       0, str( 1000000 + idx ) )
+
+    forced = checkoff_courses( pools, rng )
+    student.put( template.checkoff_coords[ "ADV. PROGRAMMING" ], 0,
+                 forced.get( "OTE", forced[ "CDE" ] ) )
+    student.put( template.checkoff_coords[ "TECH. WRITING" ],    0, forced[ "EXTRA-C" ] )
+
+    taken: List[str] = []
+
+    for req, coord, term in template.slots:
+        if req in forced:
+            course = forced.pop( req )
+        else:
+            choices = [ name for name in pools[ req ]
+                        if ( name not in taken ) and ( name not in forced.values() ) ]
+            course  = rng.choice( choices or pools[ req ] )
+        grade = rng.choice( GRADES )
+        taken.append( course )
+
+        student.transcript.append( ( course, term, all_credits[ course ], grade ) )
+
+        student.put( coord, 1, course )
+        student.put( coord, 2, str( all_credits[ course ] ) )
+        student.put( coord, 3, term )
+        student.put( coord, 4, grade )
+        if req == "LS":
+            student.put( coord, 5, LS_CATEGORIES[ course.split( " " )[0] ] )
+
+    # Some checklists have a mistake in one entry
+
+    if rng.random() < MISTAKE_RATE:
+        slot_idx = rng.randrange( len( template.slots ) )
+        _, coord, _ = template.slots[ slot_idx ]
+        if rng.random() < 0.5:
+            student.put( coord, 4, rng.choice( GRADES ) )
+        else:
+            student.put( coord, 2, str( student.transcript[ slot_idx ][2] + 1 ) )
+
+    # Some checklists have courses that don't satisfy the requirement
+    # they're listed under, or that don't exist
+
+    if rng.random() < MISSLOT_RATE:
+        misslot( student, template, misslot_pools( pools ), all_credits, rng )
+    if rng.random() < LATE_PHYS_1_RATE:
+        take_phys_1_late( student, template )
+    if rng.random() < NONEXISTENT_RATE:
+        list_nonexistent( student, template, rng )
+
+    return student
+
+def misslot( student: SyntheticStudent, template: ChecklistTemplate,
+             misslotted: Dict[ str, List[str] ], all_credits: Dict[ str, int ],
+             rng: random.Random ) -> None:
+    """
+    Has the student take a course from misslotted, and list it under
+    the requirement that it doesn't satisfy
+    """
+
+    req = rng.choice( sorted( misslotted ) )
+    slot_idx = rng.choice( [ idx for idx, ( slot_req, _, _ ) in enumerate( template.slots )
+                             if slot_req == req ] )
+    _, coord, _ = template.slots[ slot_idx ]
+    _, term, _, grade = student.transcript[ slot_idx ]
+
+    taken  = [ course for course, _, _, _ in student.transcript ]
+    course = rng.choice( [ name for name in misslotted[ req ] if name not in taken ] )
+
+    student.transcript[ slot_idx ] = ( course, term, all_credits[ course ], grade )
+    student.put( coord, 1, course )
+    student.put( coord, 2, str( all_credits[ course ] ) )
+
+def list_nonexistent( student: SyntheticStudent, template: ChecklistTemplate,
+                      rng: random.Random ) -> None:
+    """
+    Lists a course that doesn't exist (in the department of the course
+    the student took) in one of the student's entries
+    """
+
+    slot_idx = rng.randrange( len( template.slots ) )
+    _, coord, _ = template.slots[ slot_idx ]
+    dept = student.transcript[ slot_idx ][0].split( " " )[0]
+    student.put( coord, 1, f"{dept} {rng.randrange( 9000, 10000 )}" )
+
+def take_phys_1_late( student: SyntheticStudent, template: ChecklistTemplate ) -> None:
+    """Has the student take PHYS 1112 in LATE_PHYS_1_TERM for PHYS. 1"""
+
+    slot_idx = next( idx for idx, ( req, _, _ ) in enumerate( template.slots )
+                     if req == "PHYS. 1" )
+    _, coord, _ = template.slots[ slot_idx ]
+    _, _, num_cred, grade = student.transcript[ slot_idx ]
+
+    student.transcript[ slot_idx ] = ( "PHYS 1112", LATE_PHYS_1_TERM, num_cred, grade )
+    student.put( coord, 1, "PHYS 1112" )
+    student.put( coord, 3, LATE_PHYS_1_TERM )
+
+#---------------------------------------------------------------------
+# Output
+#---------------------------------------------------------------------
+
+def write_checklist( worksheet: Worksheet, student: SyntheticStudent ) -> None:
+    """Writes the student's values into a worksheet of the template"""
+
+    for ( row, column ), value in student.cells.items():
+        worksheet.cell( row = row + 1, column = column + 1, value = value )
+
+def grades_rows( student: SyntheticStudent ) -> List[ List[str] ]:
+    """Returns the student's rows in the registrar's grades CSV"""
+
+    rows = []
+    for course, term, num_cred, grade in student.transcript:
+        fields = dict.fromkeys( GRADES_FIELDS, "" )
+        dept, number = course.split( " " )
+        fields[ "Academic Term Ldescr" ] = f"{SEASONS[ term[:2] ]} 20{term[2:]}"
+        fields[ "Academic Program" ]     = "EN"
+        fields[ "Netid" ]                = student.netid
+        fields[ "Subject" ]              = dept
+        fields[ "Catalog Nbr" ]          = number
+        fields[ "Class Section" ]        = "001"
+        fields[ "Unt Taken" ]            = str( num_cred )
+        fields[ "Official Grade" ]       = grade
+        rows.append( [ fields[ field ] for field in GRADES_FIELDS ] )
+    return rows
+
+def gen_cohort( num_students: int, out_dir: str, seed: int = 0,
+                template_path: str = TEMPLATE_PATH ) -> None:
+    """
+    Generates a synthetic cohort in the output directory:
+
+     - checklists/: A checklist for each student
+     - grades.csv: The students' grades, in the registrar's format
+     - catalog.json: An offline catalog with all of the courses taken
+    """
+
+    rng         = random.Random( seed )
+    template    = ChecklistTemplate( template_path )
+    pools       = req_pools( gen_catalog() )
+    all_credits = catalog_credits( gen_catalog() )
+
+    os.makedirs( os.path.join( out_dir, "checklists" ), exist_ok = True )
+
+    workbook  = openpyxl.load_workbook( template_path )
+    worksheet = cast( Worksheet, workbook.active )
+
+    with open( os.path.join( out_dir, "grades.csv" ), "w", encoding = "utf-8",
+               newline = "" ) as grades_file:
+        writer = csv.writer( grades_file )
+        writer.writerow( GRADES_FIELDS )
+
+        for idx in range( num_students ):
+            student = gen_student( idx, template, pools, all_credits, rng )
+            write_checklist( worksheet, student )
+            workbook.save( os.path.join( out_dir, "checklists", f"{student.netid}.xlsx" ) )
+            writer.writerows( grades_rows( student ) )
+
+    save_catalog( os.path.join( out_dir, "catalog.json" ) )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser( description = "Synthetic cohort generator" )
+    parser.add_argument( "-n", type = int, default = 100, dest = "num_students",
+                         help = "Number of students to generate (default: 100)" )
+    parser.add_argument( "-o", required = True, dest = "out_dir",
+                         help = "Directory to generate the cohort in" )
+    parser.add_argument( "-s", type = int, default = 0, dest = "seed",
+                         help = "Random seed (default: 0)" )
+    parser.add_argument( "-t", default = TEMPLATE_PATH, dest = "template",
+                         help = "Template checklist (default: test_data/checklist.xlsx)" )
+    args = parser.parse_args()
+
+    gen_cohort( args.num_students, args.out_dir, args.seed, args.template )
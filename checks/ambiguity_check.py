@@ -0,0 +1,48 @@
+"""
+#=====================================================================
+# ambiguity_check.py
+#=====================================================================
+# Warning about the entries that were checked with a provisional
+# answer to a deferred question (in batch mode)
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from logging import Logger
+from typing import Tuple
+
+from obj.roster_obj import Roster
+from ui.ambiguities import QUESTIONS_FILE_NAME, get_queue
+from ui.event_log import at_entry
+from ui.logger import SUCCESS
+
+def ambiguity_check( roster: Roster, logger: Logger ) -> Tuple[int, int]:
+    """
+    Warns about each of the student's entries whose class was resolved
+    with a provisional answer (such as the first of multiple sections),
+    as the other checks' results for it may change once the question is
+    answered. Must be run after the other checks, which ask the
+    questions
+    """
+
+    warnings = 0
+
+    logger.info( "Ambiguity Check for %s:", roster.netid )
+
+    questions = get_queue().open_questions( roster.netid )
+
+    for entry in roster.req_entries:
+        for question in questions:
+            if ( question.term == entry.term ) and ( entry.course_used in question.names ):
+                logger.warning( " - Checked %s (%s) assuming section %s of %s; answer \"%s\" " +
+                                "in %s and re-run to confirm", entry.course_used, entry.term,
+                                question.provisional, ", ".join( question.options ),
+                                question.key, QUESTIONS_FILE_NAME, extra = at_entry( entry ) )
+                entry.warn( "course" )
+                warnings += 1
+
+    if warnings == 0:
+        logger.log( SUCCESS, "No ambiguities" )
+
+    return 0, warnings
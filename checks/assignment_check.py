@@ -0,0 +1,68 @@
+"""
+#=====================================================================
+# assignment_check.py
+#=====================================================================
+# Checking whether a student's courses can be assigned to satisfy all
+# of the requirements, and whether the checklist matches such an
+# assignment
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from logging import Logger
+from typing import Dict, List, Tuple
+
+from obj.roster_obj import Roster
+from obj.grades_obj import Grades
+from checks.rules.assignment_solver import AssignmentSolver
+from ui.logger import SUCCESS
+
+def assignment_check( roster: Roster, grades: Grades, solver: AssignmentSolver,
+                      logger: Logger ) -> Tuple[int, int]:
+    """
+    Finds an assignment of the student's courses (from their grades)
+    to the requirements, logging it alongside any differences from the
+    checklist. Each requirement that can't be satisfied is a warning,
+    as the checklist itself is validated by the other checks
+    """
+
+    warnings = 0
+
+    logger.info( "Assignment Check for %s:", roster.netid )
+
+    # Prefer the requirements that the checklist lists courses under
+
+    listed: Dict[ Tuple[str, str], List[str] ] = {}
+    for entry in roster.req_entries:
+        if solver.index.indexes( entry.req ):
+            listed.setdefault( ( entry.course_used, entry.term ), [] ).append( entry.req )
+
+    assignment = solver.solve( grades.gen_records( roster.netid ), listed )
+
+    for req, records in assignment.assigned.items():
+        for record in records:
+            listed_reqs = listed.get( ( record.class_name, record.term ), [] )
+
+            if ( len( listed_reqs ) > 0 ) and ( req not in listed_reqs ):
+                logger.info( " - %s (%s) can be used for %s (listed under %s)",
+                             record.class_name, record.term, req, ", ".join( listed_reqs ) )
+            else:
+                logger.info( " - %s (%s) can be used for %s", record.class_name, record.term, req )
+
+    for record in assignment.unassigned:
+        logger.info( " - %s (%s) isn't needed for any requirement", record.class_name, record.term )
+
+    for record in assignment.unknown:
+        logger.warning( " - No data for %s (%s), so it wasn't assigned",
+                        record.class_name, record.term )
+        warnings += 1
+
+    for conflict in assignment.conflicts:
+        logger.warning( " - %s", conflict )
+        warnings += 1
+
+    if assignment.feasible:
+        logger.log( SUCCESS, "All requirements can be satisfied" )
+
+    return 0, warnings
@@ -30,7 +30,7 @@ def is_adv_prog( class_obj: Class ) -> bool:
     """
     A ucheck to determine whether a checkoff is an advanced programming course
     """
-    return any( name in class_obj.all_names for name in valid_classes )
+    return not class_obj.all_names.isdisjoint( valid_classes )
 
 uchecks_to_run: List[UcheckType] = [ is_adv_prog ]
 
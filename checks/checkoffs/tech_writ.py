@@ -29,7 +29,7 @@ def is_tech_writ( class_obj: Class ) -> bool:
     if "ENGRC" in class_obj.all_departments:
         return True
 
-    return any( name in class_obj.all_names for name in valid_classes )
+    return not class_obj.all_names.isdisjoint( valid_classes )
 
 uchecks_to_run: List[UcheckType] = [ is_tech_writ ]
 
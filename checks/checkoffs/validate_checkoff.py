@@ -11,11 +11,13 @@
 from logging import Logger
 from typing import Tuple, List, cast
 
-from obj.class_obj import Class
 from obj.roster_obj import Roster
 from obj.roster_entry_obj import ReqEntry
 from checks.utils.uchecks import UcheckType
 from checks.checkoffs.course_in_reqs import course_in_reqs, req_course
+from checks.utils.offerings import get_offering
+from checks.utils.ucheck_cache import run_ucheck
+from ui.event_log import at_entry
 
 import exceptions as excp
 
@@ -44,10 +46,12 @@ def validate_checkoff( roster: Roster, logger: Logger, checkoff: str,
     # Check that the entry appears in the roster
 
     if course_in_reqs( roster, entry.course_used ):
-        logger.info( "%s found in the checklists' requirements", entry.course_used )
+        logger.info( "%s found in the checklists' requirements", entry.course_used,
+                     extra = at_entry( entry ) )
         entry.valid( "course" )
     else:
-        logger.error( "%s not found in the checklists' requirements", entry.course_used )
+        logger.error( "%s not found in the checklists' requirements", entry.course_used,
+                      extra = at_entry( entry ) )
         entry.error( "course" )
         entry.error( "req" )
         errors += 1
@@ -58,21 +62,25 @@ def validate_checkoff( roster: Roster, logger: Logger, checkoff: str,
     req_entry = cast( ReqEntry, req_course( roster, entry.course_used ) )
 
     try:
-        class_obj = Class( req_entry.course_used, req_entry.term, netid = roster.netid )
+        offering_key, class_obj = get_offering( req_entry.course_used, req_entry.term,
+                                                roster.netid )
     except ( excp.api_exceptions.TermNotFoundError,
              excp.api_exceptions.DeptNotFoundError,
              excp.api_exceptions.ClassNotFoundError ):
-        logger.error( "%s wasn't offered during %s", req_entry.course_used, req_entry.term )
+        logger.error( "%s wasn't offered during %s", req_entry.course_used, req_entry.term,
+                      extra = at_entry( entry ) )
         entry.error( "course" )
         entry.error( "req" )
         errors += 1
         return errors, warnings
 
-    if all( check( class_obj ) for check in uchecks ):
-        logger.info( "%s checkoff fully satisfied by %s", checkoff, entry.course_used )
+    if all( run_ucheck( check, offering_key, class_obj ) for check in uchecks ):
+        logger.info( "%s checkoff fully satisfied by %s", checkoff, entry.course_used,
+                     extra = at_entry( entry ) )
         entry.valid( "req" )
     else:
-        logger.error( "%s checkoff not satisfied by %s", checkoff, entry.course_used )
+        logger.error( "%s checkoff not satisfied by %s", checkoff, entry.course_used,
+                      extra = at_entry( entry ) )
         entry.error( "req" )
         errors += 1
 
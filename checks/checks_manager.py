@@ -10,9 +10,12 @@
 
 from logging import Logger
 import os
-from typing import Dict, List, Callable, Tuple
+from typing import Dict, List, Callable, Optional, Tuple
 
+from checks.results_sink import ResultsSink
 from obj.roster_obj import Roster
+from ui.ambiguities import get_queue
+from ui.event_log import EventLog, EVENT_LOG_NAME
 from ui.logger import gen_v_file_logger, SUCCESS
 
 #---------------------------------------------------------------------
@@ -38,27 +41,26 @@ class ChecksManager:
                (dictionary mapping str (name of check) to a 
                 "check", as defined above)
 
-     - results: The results of running the checks
-                (dictionary mapping str (netid) to a dict mapping
-                 str (name of check) to an int (number of errors) )
-
-                {
-                  netid1: {
-                    check1: 2,
-                    check2: 0,
-                    check3: 1,
-                    ...
-                  },
-                  netid2: {
-                    ...
-                  },
-                  ...
-                }
+     - sink: Where the results of running the checks are recorded, as
+             each check completes (ResultsSink)
+
+     - per_file_logs: Whether each check logs to a separate file per
+                      student, rather than to a single event log (bool)
+
+     - log_dir: The directory that checks log to, once the logs are
+                opened (str, or None)
+
+     - event_log: The event log that checks log to, once the logs are
+                  opened without per_file_logs (EventLog, or None)
     """
 
-    def __init__( self ) -> None:
-        self.checks:  Dict[str, Callable[[Roster, Logger], Tuple[int, int]]] = {}
-        self.results: Dict[str, Dict[str,Tuple[int, int]]] = {}
+    def __init__( self, sink: ResultsSink, per_file_logs: bool = False ) -> None:
+        self.checks: Dict[str, Callable[[Roster, Logger], Tuple[int, int]]] = {}
+        self.sink = sink
+        self.per_file_logs = per_file_logs
+
+        self.log_dir: Optional[str] = None
+        self.event_log: Optional[EventLog] = None
 
     def add_check( self, check_name: str,
                    check_func: Callable[[Roster, Logger], Tuple[int, int]] ) -> None:
@@ -72,33 +74,86 @@ class ChecksManager:
         Logger)
         """
 
-        for check_name, check_func in self.checks.items():
-            result_dir = os.path.join( log_dir, check_name )
-            os.makedirs( result_dir, exist_ok = True )
+        self.open_logs( log_dir, logger )
+        self.check_rosters( rosters )
+
+    def open_logs( self, log_dir: str, logger: Logger ) -> None:
+        """
+        Prepares for checks to log in the specified directory, before any
+        rosters are checked (as well as logging general info with the
+        provided Logger). Checks log to a single event log in the
+        directory, or to a file per check and student (ex.
+        common-core/ec1.log) with per_file_logs
+        """
+
+        self.log_dir = log_dir
+        if self.per_file_logs:
+            for check_name in self.checks:
+                os.makedirs( os.path.join( log_dir, check_name ), exist_ok = True )
+        else:
+            self.event_log = EventLog( os.path.join( log_dir, EVENT_LOG_NAME ) )
 
-            logger.info( "Running %s...", check_name )
+        logger.info( "Running %s...", ", ".join( self.checks ) )
 
-            for roster in rosters:
-                netid = roster.netid
-                log_file = os.path.join( result_dir, f"{netid}.log" )
-                check_logger = gen_v_file_logger( log_file )
+    def check_rosters( self,
+                       rosters: List[ Roster ] ) -> Dict[ str, Dict[ str, Tuple[ int, int ] ] ]:
+        """
+        Runs the checks on the specified list of Roster, once the logs are
+        opened. All checks are run on a student before moving on to the
+        next, with each result recorded in the sink as it completes
 
-                if netid not in self.results:
-                    self.results[ netid ] = {}
+        Returns the results, mapping each student's NetID to a dict
+        mapping check names to their (errors, warnings)
+        """
 
-                self.results[ netid ][ check_name ] = check_func( roster, check_logger )
+        assert self.log_dir is not None, "Logs must be opened before checking rosters"
+        results: Dict[ str, Dict[ str, Tuple[ int, int ] ] ] = {}
+
+        for roster in rosters:
+            netid = roster.netid
+            netid_results = results.setdefault( netid, {} )
+
+            for check_name, check_func in self.checks.items():
+                if self.event_log is not None:
+                    self.event_log.set_context( netid, check_name )
+                    check_logger = self.event_log.logger
+                else:
+                    check_logger = self.file_logger( self.log_dir, check_name, netid )
+
+                netid_results[ check_name ] = check_func( roster, check_logger )
+                self.sink.record( netid, check_name, netid_results[ check_name ] )
+
+            # The student's questions are saved first, so that a resumed
+            # run keeps them
+            get_queue().save()
+            self.sink.mark_done( netid, roster.packed_validity() )
+
+        return results
+
+    @staticmethod
+    def file_logger( log_dir: str, check_name: str, netid: str ) -> Logger:
+        """Returns a Logger for a check to log to a separate file for the student"""
+
+        log_file = os.path.join( log_dir, check_name, f"{netid}.log" )
+
+        # Start afresh if an interrupted run got part-way through
+        if os.path.exists( log_file ):
+            os.remove( log_file )
+        return gen_v_file_logger( log_file )
 
     def summary( self, logger: Logger ) -> None:
-        """Logs a summary of all checks run"""
+        """Logs a summary of all checks run, from the results in the sink"""
+
+        results = self.sink.results()
 
-        if len( self.results ) > 0:
+        if len( results ) > 0:
 
             logger.info( "Summary:" )
 
             total_errors   = 0
             total_warnings = 0
 
-            for netid, error_logs in self.results.items():
+            for netid, error_logs in results.items():
                 netid_errors   = sum( x[0] for x in error_logs.values() )
                 netid_warnings = sum( x[1] for x in error_logs.values() )
                 total_errors += netid_errors
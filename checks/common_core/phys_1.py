@@ -42,7 +42,8 @@ def phys_1_check( roster: Roster, logger: Logger ) -> Tuple[int, int]:
     errors, warnings, entry = basic_check( roster, logger, "PHYS. 1", phys_1_uchecks,
                                            full_creds = True )
 
-    if ( entry.course_used == "PHYS 1112" ) and term_is_later( entry.term, "SU23" ):
+    if ( entry is not None ) and ( entry.course_used == "PHYS 1112" ) and \
+       term_is_later( entry.term, "SU23" ):
         # If so, they also need to take PHYS 1110
         phys_1110_result = exp_phys_check( roster, logger )
         errors   += phys_1110_result[0]
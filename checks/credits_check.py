@@ -10,66 +10,94 @@
 """
 
 from logging import Logger
-from typing import Tuple
-
-from exceptions.class_records_exceptions import RecordNotFoundError
-from exceptions.class_records_exceptions import InsufficientCreditsError
+from typing import List, Tuple
 
 from obj.roster_obj import Roster
+from obj.roster_entry_obj import ReqEntry
 from obj.grades_obj import Grades
-from obj.class_records_obj import ClassRecords
+from obj.class_records_obj import ClassRecords, CreditClaim
+from ui.event_log import at_entry
 from ui.logger import SUCCESS
 
-def credits_check( roster: Roster, grades: Grades, logger: Logger ) -> Tuple[int, int]:
+def gather_claims( roster: Roster,
+                   logger: Logger ) -> Tuple[ List[ReqEntry], List[CreditClaim], int ]:
     """
-    Validates all of the credits reported in a Roster, verifying
-    against the given Grades. The results are outputted to the given
-    log_path, and the function returns the number of mismatches
-    (0 if no mismatches)
+    Gathers the credit claims of a Roster's requirement entries, warning
+    about entries without enough information. Returns the entries with
+    claims, their (parallel) claims, and the number of warnings
     """
 
-    netid  = roster.netid
-    errors = 0
+    claimed: List[ReqEntry]    = []
+    claims:  List[CreditClaim] = []
     warnings = 0
 
-    logger.info( "Credits Check for %s:", netid )
-
-    records = ClassRecords( netid, grades )
-
     for entry in roster.req_entries:
 
-        term             = entry.term
-        course           = entry.course_used
-        proposed_credits = entry.cred_applied
-
-        if ( term == "" ) or ( course == "" ):
+        if ( entry.term == "" ) or ( entry.course_used == "" ):
             logger.warning( " - Not enough information provided for %s to locate credit record",
-                            entry.req )
+                            entry.req, extra = at_entry( entry ) )
             warnings += 1
             # Grade check will already warn the appropriate term/course entries
             entry.warn( "cred" )
             continue
 
-        if proposed_credits == -1:
-            logger.warning( " - No credits supplied for %s", course )
+        if entry.cred_applied == -1:
+            logger.warning( " - No credits supplied for %s", entry.course_used,
+                            extra = at_entry( entry ) )
             warnings += 1
             entry.warn( "cred" )
             continue
 
-        try:
-            records.use_cred( course, term, proposed_credits )
-            logger.info( " - Credits match for %s", course )
-            entry.valid( "cred" )
+        claimed.append( entry )
+        claims.append( ( entry.course_used, entry.term, entry.cred_applied ) )
+
+    return claimed, claims, warnings
 
-        except ( RecordNotFoundError, InsufficientCreditsError ) as e:
-            logger.error( e.err_msg )
+def credits_check( roster: Roster, grades: Grades, logger: Logger ) -> Tuple[int, int]:
+    """
+    Validates all of the credits reported in a Roster, verifying
+    against the given Grades. The results are outputted to the given
+    log_path, and the function returns the number of mismatches
+    (0 if no mismatches)
+
+    All credits claimed from a class are allocated together, so the
+    results don't depend on the order of the checklist
+    """
+
+    netid  = roster.netid
+    errors = 0
+
+    logger.info( "Credits Check for %s:", netid )
+
+    claimed, claims, warnings = gather_claims( roster, logger )
+    allocation = ClassRecords( netid, grades ).allocate_cred( claims )
+
+    missing      = set( allocation.missing )
+    conflict_for = allocation.conflicts_by_claim()
+
+    for idx, entry in enumerate( claimed ):
+
+        if idx in missing:
+            logger.error( "No record found of %s taking %s in %s",
+                          netid, entry.course_used, entry.term, extra = at_entry( entry ) )
             entry.error( "cred" )
             errors += 1
 
-            actually_taken = grades.when_taken( netid, course )
-            if ( isinstance( e, RecordNotFoundError ) ) and ( len( actually_taken ) > 0 ):
+            actually_taken = grades.when_taken( netid, entry.course_used )
+            if len( actually_taken ) > 0:
                 logger.info( " - Reported taking in %s, but appears to have actually taken in %s",
-                             term, ", ".join( actually_taken ) )
+                             entry.term, ", ".join( actually_taken ), extra = at_entry( entry ) )
+
+        elif idx in conflict_for:
+            conflict = conflict_for[ idx ]
+            if idx == conflict.claims[0]: # Only report each conflict once
+                logger.error( conflict.err_msg, extra = at_entry( entry ) )
+                errors += 1
+            entry.error( "cred" )
+
+        else:
+            logger.info( " - Credits match for %s", entry.course_used, extra = at_entry( entry ) )
+            entry.valid( "cred" )
 
     if errors == 0:
         logger.log( SUCCESS, "All credits match" )
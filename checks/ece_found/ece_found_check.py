@@ -11,6 +11,7 @@ from logging import Logger
 from typing import Tuple
 
 from obj.roster_obj import Roster
+from ui.event_log import at_entry
 
 from checks.ece_found.electromag       import electromag_check
 from checks.ece_found.intro_prob       import intro_prob_check
@@ -62,7 +63,8 @@ def ece_found_check( roster: Roster, logger: Logger ) -> Tuple[int, int]:
     found_reqs = set()
     for entry in ece_found_req_list:
         if entry.req in found_reqs:
-            logger.error( "Found multiple instances of the %s requirement", entry.req )
+            logger.error( "Found multiple instances of the %s requirement", entry.req,
+                          extra = at_entry( entry ) )
             entry.error( "req" )
         else:
             found_reqs.add( entry.req )
@@ -29,8 +29,8 @@ def is_CDE( class_obj: Class ) -> bool:
     """Checks whether the given class is a valid CDE"""
 
     if ( "ECE" in class_obj.all_departments ) and \
-       ( int( class_obj.course_number ) >= 4000 ) and \
-       ( any( name in class_obj.all_names for name in valid_ece_classes ) or class_obj.is_CDE ):
+       ( ( class_obj.level or 0 ) >= 4000 ) and \
+       ( not class_obj.all_names.isdisjoint( valid_ece_classes ) or class_obj.is_CDE ):
         return True
 
     return False
@@ -28,11 +28,11 @@ valid_cs_courses = [
 def is_junior_level( class_obj: Class ) -> bool:
     """Checks whether the given class is a valid CDE"""
 
-    if any( name in class_obj.all_names for name in valid_cs_courses ):
+    if not class_obj.all_names.isdisjoint( valid_cs_courses ):
         return True
 
     if ( "ECE" in class_obj.all_departments ) and \
-       ( int( class_obj.course_number ) >= 4000 ) and \
+       ( ( class_obj.level or 0 ) >= 4000 ) and \
        ( is_technical( class_obj ) ):
         return True
 
@@ -25,4 +25,4 @@ def is_technical( class_obj: Class ) -> bool:
     """
 
     return ( "ECE" in class_obj.all_departments ) and \
-           not any( name in class_obj.all_names for name in nontech_courses )
+           class_obj.all_names.isdisjoint( nontech_courses )
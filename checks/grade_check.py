@@ -14,6 +14,7 @@ from typing import Tuple
 import exceptions as excp
 from obj.roster_obj import Roster
 from obj.grades_obj import Grades
+from ui.event_log import at_entry
 from ui.logger import SUCCESS
 
 def grade_check( roster: Roster, grades: Grades, logger: Logger ) -> Tuple[int, int]:
@@ -38,7 +39,7 @@ def grade_check( roster: Roster, grades: Grades, logger: Logger ) -> Tuple[int,
 
         if ( term == "" ) or ( course == "" ):
             logger.warning( " - Not enough information provided for %s to locate grade record",
-                            entry.req )
+                            entry.req, extra = at_entry( entry ) )
             warnings += 1
             if term == "":
                 entry.warn( "term" )
@@ -48,7 +49,7 @@ def grade_check( roster: Roster, grades: Grades, logger: Logger ) -> Tuple[int,
             continue
 
         if proposed_grade == "":
-            logger.warning( " - No grade supplied for %s", course )
+            logger.warning( " - No grade supplied for %s", course, extra = at_entry( entry ) )
             warnings += 1
             entry.warn( "grade" )
             continue
@@ -61,16 +62,16 @@ def grade_check( roster: Roster, grades: Grades, logger: Logger ) -> Tuple[int,
 
         if real_grade != proposed_grade: # The student lied :(
             logger.error( "Proposed grade for %s (%s) doesn't match our records (%s)",
-                          course, proposed_grade, real_grade )
+                          course, proposed_grade, real_grade, extra = at_entry( entry ) )
             entry.error( "grade" )
             errors += 1
 
             actually_taken = grades.when_taken( netid, course )
             if ( real_grade == "No Entry" ) and ( len( actually_taken ) > 0 ):
                 logger.info( " - Reported taking in %s, but appears to have actually taken in %s",
-                             term, ", ".join( actually_taken ) )
+                             term, ", ".join( actually_taken ), extra = at_entry( entry ) )
         else:
-            logger.info( " - Grade match for %s", course )
+            logger.info( " - Grade match for %s", course, extra = at_entry( entry ) )
             entry.valid( "grade" )
 
     if errors == 0:
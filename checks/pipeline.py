@@ -0,0 +1,285 @@
+"""
+#=====================================================================
+# pipeline.py
+#=====================================================================
+# The checks run on each student, and the loop that streams students
+# through them a window at a time, shared by grad_val.py and the
+# pipeline benchmark
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import os
+from logging import Logger
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from api.bulk_api import bulk_add_roster_data, bulk_populate
+from obj.checklist_cache import ChecklistCache
+from obj.checklist_obj import Checklist
+from obj.grades_obj import Grades
+from obj.roster_obj import Roster
+from obj import checklist_sources
+from ui.annotate import annotation_groups, annotation_name, update_annotated_workbook
+from ui.results_export import ResultsWriter, results_frame
+
+from checks.checks_manager import ChecksManager
+from checks.grade_check import grade_check
+from checks.credits_check import credits_check
+from checks.common_core.common_core_check import common_core_check
+from checks.fws.fws_check                 import fws_check
+from checks.ece_core.ece_core_check       import ece_core_check
+from checks.ece_found.ece_found_check     import ece_found_check
+from checks.ece_upper.ece_upper_check     import ece_upper_check
+from checks.extra.extra_check             import extra_check
+from checks.checkoffs.checkoffs_check     import checkoffs_check
+from checks.rules.execution_plan          import ExecutionPlan
+from checks.rules.rule_compiler           import compile_checks, build_eligibility_index
+from checks.utils.eligibility             import set_eligibility_index
+from checks.rules.ece_rules               import ECE_CHECKS
+from checks.rules.assignment_solver       import AssignmentSolver
+from checks.assignment_check              import assignment_check
+from checks.ambiguity_check               import ambiguity_check
+
+# The stages of each window, in the order they run
+STAGES = [ "parse", "api", "checks", "export", "annotate" ]
+
+# Called at the end of each stage, with the index of the window
+StageHook = Callable[ [ int, str ], None ]
+
+#---------------------------------------------------------------------
+# Adding the Checks
+#---------------------------------------------------------------------
+
+def add_checks( checks_mngr: ChecksManager, grades: Optional[Grades], *, semantics: bool,
+                rules: bool = False, assign: bool = False,
+                batch: bool = False ) -> Optional[ExecutionPlan]:
+    """
+    Adds the checks that grad_val.py runs to a ChecksManager:
+
+     - the grades and credits checks, if grades are given (-g)
+
+     - the semantics checks, or their compiled rules (-s, --rules); the
+       eligibility index that the semantics checks test offerings
+       against first is made active
+
+     - the assignment of the grades to the requirements (--assign)
+
+     - the deferred questions, last, as they're asked while the other
+       checks run (--batch)
+
+    Returns the compiled rules, which must be evaluated on each window
+    of rosters before they're checked, or None without rules
+    """
+
+    rules_plan = None
+
+    if grades is not None:
+        checks_mngr.add_check( "grade-validation",
+                               lambda x, y : grade_check( x, grades, y ) )
+        checks_mngr.add_check( "credits-validation",
+                               lambda x, y : credits_check( x, grades, y ) )
+
+    if semantics:
+        eligibility_index = build_eligibility_index( ECE_CHECKS )
+        set_eligibility_index( eligibility_index )
+
+        if rules:
+            rules_plan = compile_checks( ECE_CHECKS )
+            for check_name in rules_plan.check_names():
+                checks_mngr.add_check( check_name, rules_plan.check( check_name ) )
+
+        else:
+            checks_mngr.add_check( "common-core",   common_core_check )
+            checks_mngr.add_check( "fws-check",     fws_check         )
+            checks_mngr.add_check( "ece-core",      ece_core_check    )
+            checks_mngr.add_check( "ece-found",     ece_found_check   )
+            checks_mngr.add_check( "ece-upper",     ece_upper_check   )
+            checks_mngr.add_check( "extra-classes", extra_check       )
+            checks_mngr.add_check( "checkoffs",     checkoffs_check   )
+
+        if assign and grades is not None:
+            solver = AssignmentSolver( ECE_CHECKS, eligibility_index )
+            checks_mngr.add_check( "assignment",
+                                   lambda x, y : assignment_check( x, grades, solver, y ) )
+
+    if batch:
+        checks_mngr.add_check( "ambiguities", ambiguity_check )
+
+    return rules_plan
+
+#---------------------------------------------------------------------
+# StudentStream Object
+#---------------------------------------------------------------------
+
+class StudentStream:
+    """
+    Streams students through the checks a window at a time: each
+    window's checklists are parsed, the API data for their classes is
+    fetched, they're checked, and their results and annotated
+    checklists are written, before the next window is read. Across
+    windows, only the NetIDs seen (to find duplicates) and the names of
+    the annotated workbooks (to prune stale ones) are kept
+
+    Attributes:
+
+     - checks_mngr: The manager of the checks to run, with its logs
+                    opened (ChecksManager)
+
+     - results_writer: The writer of the results table (ResultsWriter)
+
+     - annotated_dir: The directory to write annotated checklists to (str)
+
+     - semantics: Whether to fetch the API data for the students'
+                  classes (bool)
+
+     - rules_plan: The compiled rules to evaluate on each window, if any
+                   (ExecutionPlan or None)
+
+     - completed: The students checked by an interrupted run, mapping
+                  their NetIDs to their recorded validity (dict mapping
+                  str to list of int)
+
+     - completed_results: The results of the students checked by an
+                          interrupted run (dict mapping str to dict
+                          mapping str to (int, int))
+
+     - netids_found: The NetIDs seen so far (set of str)
+
+     - annotation_names: The names of the annotated workbooks for the
+                         students seen so far (set of str)
+
+     - num_duplicates: The number of checklists skipped for having a
+                       duplicate NetID (int)
+
+     - num_restored: The number of students restored from an interrupted
+                     run rather than checked (int)
+
+     - num_workbooks: The number of annotated workbooks written or kept (int)
+
+     - num_annotated: The number of annotated workbooks written (int)
+    """
+
+    def __init__( self, checks_mngr: ChecksManager, results_writer: ResultsWriter,
+                  annotated_dir: str, *, semantics: bool,
+                  rules_plan: Optional[ExecutionPlan] = None, resume: bool = False ) -> None:
+        self.checks_mngr    = checks_mngr
+        self.results_writer = results_writer
+        self.annotated_dir  = annotated_dir
+        self.semantics      = semantics
+        self.rules_plan     = rules_plan
+
+        self.completed: Dict[ str, List[int] ] = {}
+        self.completed_results: Dict[ str, Dict[ str, Tuple[ int, int ] ] ] = {}
+        if resume:
+            self.completed         = checks_mngr.sink.completed()
+            self.completed_results = checks_mngr.sink.results()
+
+        self.netids_found: Set[str]     = set()
+        self.annotation_names: Set[str] = set()
+        self.num_duplicates = 0
+        self.num_restored   = 0
+        self.num_workbooks  = 0
+        self.num_annotated  = 0
+
+        os.makedirs( annotated_dir, exist_ok = True )
+
+    def run( self, checklist_paths: List[str], window: int, logger: Logger, *,
+             per_sheet: bool = False, checklist_cache: Optional[ChecklistCache] = None,
+             stage_hook: Optional[StageHook] = None ) -> None:
+        """
+        Streams the checklists in the given files through the checks, a
+        window of (at least) the given number at a time, calling the hook
+        (if any) at the end of each of a window's STAGES
+        """
+
+        def end_stage( window_idx: int, stage: str ) -> None:
+            if stage_hook is not None:
+                stage_hook( window_idx, stage )
+
+        for window_idx, checklists in enumerate( checklist_sources.checklist_windows(
+                checklist_paths, window, per_sheet, checklist_cache ) ):
+
+            rosters = self.parse_window( checklists, checklist_paths, per_sheet,
+                                         checklist_cache, logger )
+            end_stage( window_idx, "parse" )
+
+            to_check = self.restore_completed( rosters )
+
+            # Prefetch the window's API data
+
+            if self.semantics:
+                for roster in to_check:
+                    bulk_add_roster_data( roster.req_entries )
+                bulk_populate()
+
+                if self.rules_plan is not None:
+                    self.rules_plan.evaluate( to_check )
+
+            end_stage( window_idx, "api" )
+
+            # Check the window, and output its results
+
+            window_results = self.checks_mngr.check_rosters( to_check )
+            for roster in rosters:
+                window_results.setdefault( roster.netid,
+                                           self.completed_results.get( roster.netid, {} ) )
+            end_stage( window_idx, "checks" )
+
+            self.results_writer.write( results_frame( rosters, window_results,
+                                                      list( self.checks_mngr.checks ) ) )
+            end_stage( window_idx, "export" )
+
+            for group in annotation_groups( rosters ):
+                self.num_workbooks += 1
+                if update_annotated_workbook( group, self.annotated_dir ):
+                    self.num_annotated += 1
+            end_stage( window_idx, "annotate" )
+
+    def parse_window( self, checklists: List[Checklist], checklist_paths: List[str],
+                      per_sheet: bool, checklist_cache: Optional[ChecklistCache],
+                      logger: Logger ) -> List[Roster]:
+        """
+        Returns the Rosters of a window's checklists, skipping (and
+        reporting) any with a NetID that was already seen
+        """
+
+        rosters = []
+        for checklist in checklists:
+            roster = Roster( checklist )
+
+            # Duplicates are skipped, so that the run still finishes
+            # cleanly with the rest of the students
+            if roster.netid in self.netids_found:
+                logger.error( "NetID %s (in %s) is a duplicate (previously found in %s); " +
+                              "skipping it",
+                              roster.netid, checklist_sources.source_name( roster ),
+                              checklist_sources.find_netid( checklist_paths, roster.netid,
+                                                            per_sheet, checklist_cache ) )
+                self.num_duplicates += 1
+                continue
+
+            self.netids_found.add( roster.netid )
+            rosters.append( roster )
+
+        # Annotated workbooks to keep from earlier runs
+        self.annotation_names.update( annotation_name( group )
+                                      for group in annotation_groups( rosters ) )
+        return rosters
+
+    def restore_completed( self, rosters: List[Roster] ) -> List[Roster]:
+        """
+        Restores the validity of the students already checked by an
+        interrupted run from the sink, rather than checking them again
+        (they're still exported and annotated along with the rest of the
+        window), returning the rest of the Rosters to check
+        """
+
+        to_check = []
+        for roster in rosters:
+            if roster.netid in self.completed and \
+               roster.restore_validity( self.completed[ roster.netid ] ):
+                self.num_restored += 1
+            else:
+                to_check.append( roster )
+        return to_check
@@ -0,0 +1,133 @@
+"""
+#=====================================================================
+# results_sink.py
+#=====================================================================
+# An append-only record of check results, written as each check
+# completes so that an interrupted run can be resumed
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, Tuple
+
+# A single record, as written to the sink
+SinkRecord = Dict[ str, Any ]
+
+#---------------------------------------------------------------------
+# ResultsSink Object
+#---------------------------------------------------------------------
+
+class ResultsSink:
+    """
+    An append-only JSON Lines file of check results. Each line is one of:
+
+     - a result: {"netid": NETID, "check": CHECK, "errors": N, "warnings": M}
+
+     - a completion marker, written once every check has run on a
+       student, with the packed validity of each of their entries (from
+       Roster.packed_validity): {"netid": NETID, "done": true,
+       "validity": [V1, V2, ...]}
+
+    Each line is flushed as it's written, so a run that dies part-way
+    through loses at most the student it was checking. If a student's
+    checks are run again (such as when resuming), the later results
+    replace the earlier ones
+
+    Attributes:
+
+     - path: The path of the JSON Lines file (str)
+
+     - sink_file: The file being appended to (TextIO)
+    """
+
+    def __init__( self, path: str ) -> None:
+        self.path = path
+
+        # Terminate any line left partially written by a previous run
+        partial_line = False
+        if os.path.exists( path ) and os.path.getsize( path ) > 0:
+            with open( path, "rb" ) as old_file:
+                old_file.seek( -1, os.SEEK_END )
+                partial_line = old_file.read( 1 ) != b"\n"
+
+        self.sink_file = open( path, "a", encoding = "utf-8" ) # pylint: disable=consider-using-with
+        if partial_line:
+            self.sink_file.write( "\n" )
+
+    def _write( self, record: SinkRecord ) -> None:
+        """Appends a record to the sink"""
+
+        self.sink_file.write( json.dumps( record ) + "\n" )
+        self.sink_file.flush()
+
+    def record( self, netid: str, check_name: str, result: Tuple[ int, int ] ) -> None:
+        """Records the (errors, warnings) of a check on a student"""
+
+        self._write( { "netid"    : netid,
+                       "check"    : check_name,
+                       "errors"   : result[0],
+                       "warnings" : result[1] } )
+
+    def mark_done( self, netid: str, validity: List[int] ) -> None:
+        """
+        Records that every check has been run on a student, along with the
+        resulting validity of their entries
+        """
+
+        self._write( { "netid": netid, "done": True, "validity": validity } )
+
+    def close( self ) -> None:
+        """Closes the sink"""
+
+        self.sink_file.close()
+
+    #-------------------------------------------------------------------
+    # Reading
+    #-------------------------------------------------------------------
+
+    def records( self ) -> Iterator[SinkRecord]:
+        """
+        Iterates over the records written so far, skipping any line that
+        was only partially written
+        """
+
+        if not self.sink_file.closed:
+            self.sink_file.flush()
+
+        with open( self.path, "r", encoding = "utf-8" ) as sink_file:
+            for line in sink_file:
+                try:
+                    record = json.loads( line )
+                except json.JSONDecodeError:
+                    continue
+                if isinstance( record, dict ) and "netid" in record:
+                    yield record
+
+    def completed( self ) -> Dict[ str, List[int] ]:
+        """
+        Returns the students that every check has run on, mapping their
+        NetIDs to the latest recorded validity of their entries
+        """
+
+        return { record[ "netid" ]: record[ "validity" ] for record in self.records()
+                 if record.get( "done" ) and "validity" in record }
+
+    def results( self ) -> Dict[ str, Dict[ str, Tuple[ int, int ] ] ]:
+        """
+        Returns the latest result of each check on each student, mapping
+        NetIDs (in the order they were first recorded) to a dict mapping
+        check names to their (errors, warnings)
+        """
+
+        results: Dict[ str, Dict[ str, Tuple[ int, int ] ] ] = {}
+
+        for record in self.records():
+            if "check" not in record:
+                continue
+            netid_results = results.setdefault( record[ "netid" ], {} )
+            netid_results[ record[ "check" ] ] = ( record[ "errors" ], record[ "warnings" ] )
+
+        return results
@@ -0,0 +1,6 @@
+"""Import Rules Files"""
+
+import checks.rules.rule_specs
+import checks.rules.execution_plan
+import checks.rules.rule_compiler
+import checks.rules.ece_rules
@@ -0,0 +1,414 @@
+"""
+#=====================================================================
+# assignment_solver.py
+#=====================================================================
+# Finds an assignment of the courses a student took to the
+# requirements, using bipartite matching on the requirement rules
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from obj.class_obj import Class
+from obj.class_record_obj import ClassRecord
+from checks.rules.rule_specs import ReqRule, GroupRule, CreditTotalRule, CheckSpec
+from checks.utils.eligibility import EligibilityIndex, req_bits
+from checks.utils.offerings import OfferingKey, get_offering
+import exceptions as excp
+
+OfferingLookup = Callable[ [ClassRecord], Tuple[ OfferingKey, Class ] ]
+
+#---------------------------------------------------------------------
+# Slots
+#---------------------------------------------------------------------
+
+class Slot:
+    """
+    A single course's worth of a requirement, to be filled by one course
+
+    Attributes:
+
+     - label: A description of the slot, for reporting (str)
+
+     - reqs: The requirements that a course can satisfy to fill the
+             slot, in order of preference (tuple of str)
+
+     - mask: The bits of reqs (int)
+    """
+
+    __slots__ = ( "label", "reqs", "mask" )
+
+    def __init__( self, label: str, reqs: Tuple[str, ...] ):
+        self.label = label
+        self.reqs  = reqs
+        self.mask  = 0
+        for req in reqs:
+            self.mask |= req_bits[ req ]
+
+class SlotLayout:
+    """
+    The slots to fill for a set of checks
+
+    Attributes:
+
+     - slots: The slots that must all be filled (list of Slot)
+
+     - open_reqs: Requirements that take any number of courses, in
+                  order of preference (list of str)
+
+     - full_creds: The requirements that need all of a course's credits
+                   (set of str)
+
+     - full_creds_mask: The bits of full_creds (int)
+
+     - credit_totals: Minimum credit totals across requirements
+                      (list of CreditTotalRule)
+    """
+
+    def __init__( self, check_specs: Sequence[CheckSpec] ):
+        self.slots:         List[Slot]            = []
+        self.open_reqs:     List[str]             = []
+        self.full_creds:    Set[str]              = set()
+        self.credit_totals: List[CreditTotalRule] = []
+
+        for spec in check_specs:
+            for rule in spec.rules:
+                if isinstance( rule, ReqRule ):
+                    self.add_req_rule( rule )
+                elif isinstance( rule, GroupRule ):
+                    self.add_group_rule( rule )
+                elif isinstance( rule, CreditTotalRule ):
+                    self.credit_totals.append( rule )
+
+        self.full_creds_mask = 0
+        for req in self.full_creds:
+            self.full_creds_mask |= req_bits[ req ]
+
+    def add_req_rule( self, rule: ReqRule ) -> None:
+        """Adds the slots for a requirement rule"""
+
+        if rule.full_creds:
+            self.full_creds.add( rule.req )
+
+        if rule.count == -1:
+            self.open_reqs.append( rule.req )
+            return
+
+        for idx in range( rule.count ):
+            label = rule.req if rule.count == 1 else f"{rule.req} #{idx + 1}"
+            self.slots.append( Slot( label, ( rule.req, ) ) )
+
+    def add_group_rule( self, rule: GroupRule ) -> None:
+        """
+        Adds the slots for a group rule; each "one of" constraint gets its
+        own slot, and the rest can be filled by any requirement in the
+        group
+        """
+
+        group_reqs = tuple( req_rule.req for req_rule in rule.rules )
+        for req_rule in rule.rules:
+            if req_rule.full_creds:
+                self.full_creds.add( req_rule.req )
+
+        for reqs, description in rule.one_of:
+            self.slots.append( Slot( f"{rule.label} ({description})", reqs ) )
+
+        for idx in range( rule.count - len( rule.one_of ) ):
+            self.slots.append( Slot( f"{rule.label} #{idx + 1}", group_reqs ) )
+
+#---------------------------------------------------------------------
+# Assignment Object
+#---------------------------------------------------------------------
+
+class Assignment:
+    """
+    The result of assigning a student's courses to requirements
+
+    Attributes:
+
+     - assigned: The courses assigned to each requirement
+                 (dict mapping str to list of ClassRecord)
+
+     - unassigned: Courses that weren't needed for any requirement
+                   (list of ClassRecord)
+
+     - unknown: Courses with no API data, which couldn't be assigned
+                (list of ClassRecord)
+
+     - conflicts: Explanations of why no complete assignment exists,
+                  if any (list of str)
+    """
+
+    def __init__( self ) -> None:
+        self.assigned:   Dict[ str, List[ClassRecord] ] = {}
+        self.unassigned: List[ClassRecord]              = []
+        self.unknown:    List[ClassRecord]              = []
+        self.conflicts:  List[str]                      = []
+
+    @property
+    def feasible( self ) -> bool:
+        """Whether every requirement could be satisfied"""
+        return len( self.conflicts ) == 0
+
+    def assign( self, req: str, record: ClassRecord ) -> None:
+        """Assigns a course to a requirement"""
+
+        if req not in self.assigned:
+            self.assigned[ req ] = []
+        self.assigned[ req ].append( record )
+
+#---------------------------------------------------------------------
+# Solver
+#---------------------------------------------------------------------
+
+def default_lookup( record: ClassRecord ) -> Tuple[ OfferingKey, Class ]:
+    """Looks up the offering of a course a student took"""
+    return get_offering( record.class_name, record.term, record.netid )
+
+class AssignmentSolver:
+    """
+    Assigns courses to requirement slots with maximum bipartite matching
+    (augmenting paths), and explains any slot left unfilled with the set
+    of slots that compete for too few courses
+
+    Conditional rules (such as EXP. PHYS.) and checkoffs aren't part of
+    the assignment, as they depend on or reuse other courses
+
+    Attributes:
+
+     - layout: The slots to fill (SlotLayout)
+
+     - index: The index of requirements each offering can satisfy
+              (EligibilityIndex)
+
+     - lookup: The function used to find each course's offering
+    """
+
+    def __init__( self, check_specs: Sequence[CheckSpec], index: EligibilityIndex,
+                  lookup: OfferingLookup = default_lookup ):
+        self.layout = SlotLayout( check_specs )
+        self.index  = index
+        self.lookup = lookup
+
+    def usable_mask( self, record: ClassRecord, key: OfferingKey, offering: Class ) -> int:
+        """Returns the bits of the requirements that the course can be used for"""
+
+        mask = self.index.mask( key, offering )
+        if record.cred_taken != offering.max_credits: # Can't apply all of the credits
+            mask &= ~self.layout.full_creds_mask
+        return mask
+
+    def solve( self, records: List[ClassRecord],
+               preferred: Optional[ Dict[ Tuple[str, str], List[str] ] ] = None ) -> Assignment:
+        """
+        Finds an assignment of the given courses to the requirements
+
+        Optionally, preferred requirements can be given for courses (keyed
+        by (course name, term)), such as where a checklist lists them;
+        these are used wherever they don't prevent a complete assignment
+        """
+
+        if preferred is None:
+            preferred = {}
+
+        assignment = Assignment()
+        matching = self._build_matching( records, assignment )
+
+        # Start from the preferred requirements, then fill the rest of the
+        # slots with the fewest options first, for shorter searches
+
+        matching.match_preferred( preferred )
+        for slot_idx in sorted( range( len( matching.slots ) ),
+                                key = lambda x: len( matching.slot_courses[ x ] ) ):
+            if matching.matched_course[ slot_idx ] is None:
+                matching.augment( slot_idx, set() )
+
+        for slot_idx, slot_course in enumerate( matching.matched_course ):
+            if slot_course is None:
+                assignment.conflicts.append( matching.explain( slot_idx ) )
+            else:
+                assignment.assign( matching.fills[ slot_course ][ slot_idx ],
+                                   matching.courses[ slot_course ] )
+
+        self._assign_leftovers( matching, preferred, assignment )
+
+        # Check credit totals
+
+        for credit_total in self.layout.credit_totals:
+            total = sum( record.cred_taken for req in credit_total.reqs
+                         for record in assignment.assigned.get( req, [] ) )
+            if total < credit_total.min_credits:
+                assignment.conflicts.append(
+                    f"{credit_total.label} only reach {total} of the " +
+                    f"{credit_total.min_credits} required credits" )
+
+        return assignment
+
+    def _build_matching( self, records: List[ClassRecord], assignment: Assignment ) -> "Matching":
+        """
+        Returns a matching between the slots and the records' courses,
+        noting any courses without data in the assignment
+        """
+
+        matching = Matching( self.layout.slots )
+
+        for record in records:
+            try:
+                key, offering = self.lookup( record )
+            except ( excp.api_exceptions.TermNotFoundError,
+                     excp.api_exceptions.DeptNotFoundError,
+                     excp.api_exceptions.ClassNotFoundError,
+                     excp.api_exceptions.NoClassInfoError ):
+                assignment.unknown.append( record )
+                continue
+
+            matching.add_course( record, self.usable_mask( record, key, offering ) )
+
+        return matching
+
+    def _assign_leftovers( self, matching: "Matching",
+                           preferred: Dict[ Tuple[str, str], List[str] ],
+                           assignment: Assignment ) -> None:
+        """
+        Assigns courses that don't fill a slot to the first open
+        requirement they can be used for (preferred ones first)
+        """
+
+        for course_idx, record in enumerate( matching.courses ):
+            if matching.matched_slot[ course_idx ] is not None:
+                continue
+
+            course_prefs = preferred.get( ( record.class_name, record.term ), [] )
+            open_reqs = [ req for req in self.layout.open_reqs if req in course_prefs ] + \
+                        self.layout.open_reqs
+            for req in open_reqs:
+                if matching.masks[ course_idx ] & req_bits[ req ]:
+                    assignment.assign( req, record )
+                    break
+            else:
+                assignment.unassigned.append( record )
+
+#---------------------------------------------------------------------
+# Matching Object
+#---------------------------------------------------------------------
+
+class Matching:
+    """
+    A bipartite matching between slots and courses
+
+    Attributes:
+
+     - slots: The slots to fill (list of Slot)
+
+     - courses: The courses that can be used (list of ClassRecord)
+
+     - masks: The bits of the requirements each course can be used for
+              (list of int, parallel to courses)
+
+     - fills: The slots each course can fill, with the requirement it
+              would fill them with (list of dict mapping int (slot index)
+              to str, parallel to courses)
+
+     - slot_courses: The courses that can fill each slot
+                     (list of list of int (course index))
+
+     - matched_course: The course filling each slot, if any
+                       (list of int or None)
+
+     - matched_slot: The slot each course fills, if any
+                     (list of int or None)
+    """
+
+    def __init__( self, slots: List[Slot] ):
+        self.slots = slots
+        self.courses: List[ClassRecord]       = []
+        self.masks:   List[int]               = []
+        self.fills:   List[ Dict[ int, str ] ] = []
+
+        self.slot_courses:   List[ List[int] ]     = [ [] for _ in slots ]
+        self.matched_course: List[ Optional[int] ] = [ None ] * len( slots )
+        self.matched_slot:   List[ Optional[int] ] = []
+
+    def add_course( self, record: ClassRecord, mask: int ) -> None:
+        """Adds a course that can be used for the requirements in mask"""
+
+        course_idx = len( self.courses )
+        course_fills: Dict[ int, str ] = {}
+
+        for slot_idx, slot in enumerate( self.slots ):
+            if mask & slot.mask:
+                course_fills[ slot_idx ] = next( req for req in slot.reqs
+                                                 if mask & req_bits[ req ] )
+                self.slot_courses[ slot_idx ].append( course_idx )
+
+        self.courses.append( record )
+        self.masks.append( mask )
+        self.fills.append( course_fills )
+        self.matched_slot.append( None )
+
+    def match( self, slot_idx: int, course_idx: int ) -> None:
+        """Fills a slot with a course"""
+
+        self.matched_course[ slot_idx ]   = course_idx
+        self.matched_slot  [ course_idx ] = slot_idx
+
+    def match_preferred( self, preferred: Dict[ Tuple[str, str], List[str] ] ) -> None:
+        """Fills slots with courses whose preferred requirements they'd use"""
+
+        for slot_idx, course_idxs in enumerate( self.slot_courses ):
+            for course_idx in course_idxs:
+                record = self.courses[ course_idx ]
+                course_prefs = preferred.get( ( record.class_name, record.term ), [] )
+                if ( self.matched_slot[ course_idx ] is None ) and \
+                   ( self.fills[ course_idx ][ slot_idx ] in course_prefs ):
+                    self.match( slot_idx, course_idx )
+                    break
+
+    def augment( self, slot_idx: int, visited: Set[int] ) -> bool:
+        """
+        Tries to fill a slot along an augmenting path (reassigning other
+        slots' courses as needed), returning whether it succeeded
+        """
+
+        for course_idx in self.slot_courses[ slot_idx ]:
+            if course_idx in visited:
+                continue
+            visited.add( course_idx )
+            other_slot = self.matched_slot[ course_idx ]
+            if ( other_slot is None ) or self.augment( other_slot, visited ):
+                self.match( slot_idx, course_idx )
+                return True
+        return False
+
+    def explain( self, slot_idx: int ) -> str:
+        """
+        Explains why a slot couldn't be filled, by finding the slots
+        reachable from it through alternating paths; together, they can
+        only be filled by fewer courses than there are slots (a Hall's
+        theorem witness)
+        """
+
+        competing_slots = { slot_idx }
+        usable_courses: Set[int] = set()
+        to_visit = [ slot_idx ]
+
+        while len( to_visit ) > 0:
+            for course_idx in self.slot_courses[ to_visit.pop() ]:
+                if course_idx in usable_courses:
+                    continue
+                usable_courses.add( course_idx )
+                other_slot = self.matched_slot[ course_idx ]
+                if ( other_slot is not None ) and ( other_slot not in competing_slots ):
+                    competing_slots.add( other_slot )
+                    to_visit.append( other_slot )
+
+        slot_labels = ", ".join( self.slots[ idx ].label for idx in sorted( competing_slots ) )
+        if len( usable_courses ) == 0:
+            return f"No course taken can be used for {slot_labels}"
+
+        course_names = ", ".join( sorted( self.courses[ idx ].class_name
+                                          for idx in usable_courses ) )
+        return f"{slot_labels} need {len( competing_slots )} courses, but only " + \
+               f"{len( usable_courses )} can be used ({course_names})"
@@ -0,0 +1,153 @@
+"""
+#=====================================================================
+# ece_rules.py
+#=====================================================================
+# Declarative specifications of the ECE graduation requirements
+#
+# These mirror the hand-written checks in the other checks folders,
+# which remain the reference for the expected behavior
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import List
+
+from checks.rules.rule_specs import Criteria, ReqRule, ConditionalRule, CreditTotalRule, \
+                                    GroupRule, CheckoffRule, CheckSpec
+
+from checks.ece_upper.CDE          import valid_ece_classes as valid_cde_classes
+from checks.ece_upper.junior_level import valid_cs_courses
+from checks.ece_upper.tech_courses import nontech_courses
+from checks.checkoffs.adv_prog     import valid_classes as adv_prog_classes
+from checks.checkoffs.tech_writ    import valid_classes as tech_writ_classes
+
+#---------------------------------------------------------------------
+# Helpers
+#---------------------------------------------------------------------
+
+def named( req: str, names: List[str], count: int = 1 ) -> ReqRule:
+    """A full-credit rule for a requirement satisfied by specific classes"""
+
+    return ReqRule( req, [ Criteria( names = names ) ], f"Class isn't {' or '.join( names )}",
+                    count = count, full_creds = True )
+
+def in_dept( req: str, dept: str, article: str, count: int = 1 ) -> ReqRule:
+    """A full-credit rule for a requirement satisfied by any class in a department"""
+
+    return ReqRule( req, [ Criteria( depts = [ dept ] ) ], f"Class isn't {article} {dept}",
+                    count = count, full_creds = True )
+
+def ece_technical( level: int ) -> List[Criteria]:
+    """Criteria for an ECE technical elective at the given level"""
+
+    return [ Criteria( names = valid_cs_courses ),
+             Criteria( depts = [ "ECE" ], min_level = level, excluded_names = nontech_courses ) ]
+
+#---------------------------------------------------------------------
+# Common Core
+#---------------------------------------------------------------------
+
+exp_phys_rule = named( "EXP. PHYS.", [ "PHYS 1110" ] )
+
+common_core = CheckSpec( "common-core", [
+    named  ( "CALC.",          [ "MATH 1910" ] ),
+    named  ( "MULTI.",         [ "MATH 1920" ] ),
+    named  ( "DIFF. EQ.",      [ "MATH 2930" ] ),
+    named  ( "LIN. ALG.",      [ "MATH 2940" ] ),
+    named  ( "INTRO. PROG.",   [ "CS 1110", "CS 1112" ] ),
+    named  ( "GEN. CHEM.",     [ "CHEM 2090" ] ),
+    ReqRule( "PHYS. 1", [ Criteria( names = [ "PHYS 1112", "PHYS 1116" ] ) ],
+             "Class isn't PHYS 1112 or PHYS 1116", full_creds = True,
+             conditionals = [ ConditionalRule( "PHYS 1112", "SU23", exp_phys_rule ) ] ),
+    named  ( "PHYS. 2",        [ "PHYS 2213", "PHYS 2217" ] ),
+    named  ( "PHYS. 3",        [ "PHYS 2214", "PHYS 2218" ] ),
+    named  ( "DIG. LOGIC",     [ "ECE 2300" ] ),
+    in_dept( "PHYS. ED.",      "PE", "a", count = 2 ),
+    in_dept( "ENGR. DIST.",    "ENGRD", "an" ),
+    in_dept( "ENGR. INTEREST", "ENGRI", "an" )
+] )
+
+#---------------------------------------------------------------------
+# FWS
+#---------------------------------------------------------------------
+
+fws = CheckSpec( "fws-check", [
+    ReqRule( "FWS", [ Criteria( fws = True ) ], "Class isn't an FWS", count = 2 )
+] )
+
+#---------------------------------------------------------------------
+# ECE Core
+#---------------------------------------------------------------------
+
+ece_core = CheckSpec( "ece-core", [
+    named( "CIRCUITS",     [ "ECE 2100" ] ),
+    named( "DATA SCIENCE", [ "ECE 2200", "ECE 2720" ] )
+] )
+
+#---------------------------------------------------------------------
+# ECE Foundation
+#---------------------------------------------------------------------
+
+ece_found = CheckSpec( "ece-found", [
+    GroupRule( "Foundation", [
+        named( "ELECTROMAG.",      [ "ECE 3030" ] ),
+        named( "INTRO. PROB.",     [ "ECE 3100" ] ),
+        named( "EMBEDDED SYS.",    [ "ECE 3140" ] ),
+        named( "MICROELECTRONICS", [ "ECE 3150" ] ),
+        named( "SIG. & SYS.",      [ "ECE 3250" ] )
+    ], count = 3, one_of = [
+        ( ( "ELECTROMAG.", "MICROELECTRONICS" ),
+          "Electromagnetism (ECE 3030) or Microelectronics (ECE 3150)" ),
+        ( ( "INTRO. PROB.", "SIG. & SYS." ),
+          "Probability (ECE 3100) or Signals & Systems (ECE 3250)" )
+    ] )
+] )
+
+#---------------------------------------------------------------------
+# ECE Upper-Level Electives
+#---------------------------------------------------------------------
+
+ece_upper = CheckSpec( "ece-upper", [
+    CreditTotalRule( "ECE Upper-Level Electives", [ "3000+", "4000+", "CDE" ], 21 ),
+    ReqRule( "3000+", ece_technical( 3000 ), "Class isn't a valid 3000+ ECE technical elective",
+             count = -1 ),
+    ReqRule( "4000+", ece_technical( 4000 ), "Class isn't a valid 4000+ ECE technical elective",
+             count = 2 ),
+    ReqRule( "CDE", [ Criteria( depts = [ "ECE" ], min_level = 4000, names = valid_cde_classes ),
+                      Criteria( depts = [ "ECE" ], min_level = 4000, cde = True ) ],
+             "Class isn't a valid CDE" )
+] )
+
+#---------------------------------------------------------------------
+# Extra Classes
+#---------------------------------------------------------------------
+
+extra = CheckSpec( "extra-classes", [
+    ReqRule( "EXTRA-C", count = -1 )
+] )
+
+#---------------------------------------------------------------------
+# Checkoffs
+#---------------------------------------------------------------------
+
+checkoffs = CheckSpec( "checkoffs", [
+    CheckoffRule( "ADV. PROGRAMMING", [ Criteria( names = adv_prog_classes ) ] ),
+    CheckoffRule( "TECH. WRITING",    [ Criteria( depts = [ "ENGRC" ] ),
+                                        Criteria( names = tech_writ_classes ) ] )
+] )
+
+#---------------------------------------------------------------------
+# All Checks
+#---------------------------------------------------------------------
+# In the same order as the semantics checks are added in grad_val.py
+
+ECE_CHECKS: List[CheckSpec] = [
+    common_core,
+    fws,
+    ece_core,
+    ece_found,
+    ece_upper,
+    extra,
+    checkoffs
+]
@@ -0,0 +1,513 @@
+"""
+#=====================================================================
+# execution_plan.py
+#=====================================================================
+# The compiled form of requirement rules, evaluated in batch across
+# all rosters
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from logging import Logger
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
+
+from obj.class_obj import Class
+from obj.roster_obj import Roster
+from obj.roster_entry_obj import ReqEntry
+from checks.checkoffs.course_in_reqs import course_in_reqs, req_course
+from checks.rules.rule_specs import CreditTotalRule
+from checks.utils.offerings import OfferingKey, get_offering
+from checks.utils.ucheck_cache import run_ucheck
+from ui.event_log import at_entry
+from ui.parser import Term, term_is_later
+import exceptions as excp
+
+_API_EXCEPTIONS = ( excp.api_exceptions.TermNotFoundError,
+                    excp.api_exceptions.DeptNotFoundError,
+                    excp.api_exceptions.ClassNotFoundError )
+
+#---------------------------------------------------------------------
+# Compiled Rules
+#---------------------------------------------------------------------
+
+class CompiledPredicate:
+    """
+    A test on a course offering, shared by every rule with the same
+    criteria
+
+    Attributes:
+
+     - idx: A unique index for the predicate within its plan (int)
+
+     - test: The test to run on an offering (function from Class to bool)
+    """
+
+    __slots__ = ( "idx", "test" )
+
+    def __init__( self, idx: int, test: Callable[[Class], bool] ):
+        self.idx  = idx
+        self.test = test
+
+class CompiledRule:
+    """
+    A compiled ReqRule
+
+    Attributes:
+
+     - req: The requirement the rule applies to (str)
+
+     - predicate: The test that each entry's offering must pass, if any
+                  (CompiledPredicate or None)
+
+     - message: The error message when the predicate fails (str)
+
+     - count: The number of entries expected (-1 for any) (int)
+
+     - full_creds: Whether all of the offering's credits must be
+                   applied (bool)
+
+     - conditionals: Rules that apply when the first entry uses a
+                     course after a term
+                     (list of tuples of (str, Term, CompiledRule))
+    """
+
+    def __init__( self, req: str, predicate: Optional[CompiledPredicate], message: str, *,
+                  count: int, full_creds: bool,
+                  conditionals: List[ Tuple[ str, Term, 'CompiledRule' ] ] ):
+        self.req          = req
+        self.predicate    = predicate
+        self.message      = message
+        self.count        = count
+        self.full_creds   = full_creds
+        self.conditionals = conditionals
+
+class CompiledGroup:
+    """
+    A compiled GroupRule
+
+    Attributes:
+
+     - label: A description of the group, for logging (str)
+
+     - rules: The rules for each requirement, keyed by requirement
+              (dict mapping str to CompiledRule)
+
+     - count: The number of entries expected across the group (int)
+
+     - one_of: Collections of requirements that must have an entry,
+               with a description (list of tuples of (tuple of str, str))
+    """
+
+    def __init__( self, label: str, rules: Dict[ str, CompiledRule ], count: int,
+                  one_of: List[ Tuple[ Tuple[str, ...], str ] ] ):
+        self.label  = label
+        self.rules  = rules
+        self.count  = count
+        self.one_of = one_of
+
+class CompiledCheckoff:
+    """
+    A compiled CheckoffRule
+
+    Attributes:
+
+     - checkoff: The checkoff the rule applies to (str)
+
+     - predicate: The test that the course's offering must pass
+                  (CompiledPredicate)
+    """
+
+    def __init__( self, checkoff: str, predicate: CompiledPredicate ):
+        self.checkoff  = checkoff
+        self.predicate = predicate
+
+CompiledOp = Union[ CompiledRule, CompiledGroup, CompiledCheckoff, CreditTotalRule ]
+
+#---------------------------------------------------------------------
+# Recorded Logs
+#---------------------------------------------------------------------
+# Rules are evaluated before the ChecksManager hands out each check's
+# Logger, so messages are recorded and replayed later
+
+class RecordedLog:
+    """
+    A stand-in for a Logger that records messages for later replay
+
+    Attributes:
+
+     - events: The recorded messages
+               (list of tuples of (int (level), str, tuple of arguments,
+                dict of extra logging information or None))
+    """
+
+    def __init__( self ) -> None:
+        self.events: List[ Tuple[ int, str, Tuple[Any, ...], Optional[Dict[str, Any]] ] ] = []
+
+    def info( self, msg: str, *args: Any, extra: Optional[Dict[str, Any]] = None ) -> None:
+        """Records an info message"""
+        self.events.append( ( 20, msg, args, extra ) )
+
+    def warning( self, msg: str, *args: Any, extra: Optional[Dict[str, Any]] = None ) -> None:
+        """Records a warning message"""
+        self.events.append( ( 30, msg, args, extra ) )
+
+    def error( self, msg: str, *args: Any, extra: Optional[Dict[str, Any]] = None ) -> None:
+        """Records an error message"""
+        self.events.append( ( 40, msg, args, extra ) )
+
+    def replay( self, logger: Logger ) -> None:
+        """Logs all of the recorded messages to the given logger"""
+        for level, msg, args, extra in self.events:
+            logger.log( level, msg, *args, extra = extra )
+
+#---------------------------------------------------------------------
+# ExecutionPlan Object
+#---------------------------------------------------------------------
+
+class ExecutionPlan:
+    """
+    The compiled form of a collection of checks
+
+    Evaluation happens in two phases across all rosters at once. First,
+    every offering that the rules will look at is resolved, and each
+    compiled predicate is run once per distinct offering (with results
+    stored in the shared ucheck cache). Then, each
+    roster's entries are marked and its messages recorded using those
+    shared results. The checks returned by check() replay the results
+    for a ChecksManager, releasing each outcome once it's replayed
+
+    Attributes:
+
+     - ops: The compiled rules for each check, in order
+            (dict mapping str (check name) to list of compiled rules)
+
+     - num_predicates: The number of distinct compiled predicates (int)
+
+     - _outcomes: The outcome of each check on each roster
+                  (dict mapping (str, str) (NetID, check name) to
+                   tuple of (int, int, RecordedLog))
+    """
+
+    def __init__( self, ops: Dict[ str, List[CompiledOp] ], num_predicates: int ):
+        self.ops            = ops
+        self.num_predicates = num_predicates
+
+        self._outcomes: Dict[ Tuple[ str, str ], Tuple[ int, int, RecordedLog ] ] = {}
+
+    def check_names( self ) -> List[str]:
+        """Returns the names of the compiled checks, in order"""
+        return list( self.ops.keys() )
+
+    #---------------------------------------------------------------------
+    # Batch Evaluation
+    #---------------------------------------------------------------------
+
+    def evaluate( self, rosters: List[Roster] ) -> None:
+        """Evaluates all compiled checks on all of the given rosters"""
+
+        # Phase 1: Run each predicate once per distinct offering
+
+        pending: Dict[ int, Tuple[ CompiledPredicate, Dict[ OfferingKey, Class ] ] ] = {}
+
+        for roster in rosters:
+            for entry, predicate in self._targets( roster ):
+                try:
+                    key, offering = get_offering( entry.course_used, entry.term, roster.netid )
+                except _API_EXCEPTIONS:
+                    continue # Reported when the roster is evaluated
+
+                if predicate.idx not in pending:
+                    pending[ predicate.idx ] = ( predicate, {} )
+                pending[ predicate.idx ][ 1 ][ key ] = offering
+
+        for predicate, offerings in pending.values():
+            for key, offering in offerings.items():
+                run_ucheck( predicate.test, key, offering )
+
+        # Phase 2: Evaluate each roster
+
+        for roster in rosters:
+            for check_name, ops in self.ops.items():
+                log = RecordedLog()
+                errors, warnings = self._run_ops( ops, roster, log )
+                self._outcomes[ ( roster.netid, check_name ) ] = ( errors, warnings, log )
+
+    def _targets( self, roster: Roster ) -> Iterator[ Tuple[ ReqEntry, CompiledPredicate ] ]:
+        """Yields every entry that a predicate will be run on, with the predicate"""
+
+        rules: List[CompiledRule] = []
+        for ops in self.ops.values():
+            for op in ops:
+                if isinstance( op, CompiledRule ):
+                    rules.append( op )
+                elif isinstance( op, CompiledGroup ):
+                    rules += op.rules.values()
+                elif isinstance( op, CompiledCheckoff ):
+                    for checkoff_entry in roster.get_checkoff( op.checkoff ):
+                        req_entry = req_course( roster, checkoff_entry.course_used )
+                        if req_entry is not None:
+                            yield req_entry, op.predicate
+
+        while len( rules ) > 0:
+            rule = rules.pop()
+            entries = roster.get_req( rule.req )
+
+            if rule.predicate is not None:
+                for entry in entries:
+                    if entry.course_used != "":
+                        yield entry, rule.predicate
+
+            rules += self._conditionals( rule, entries )
+
+    @staticmethod
+    def _conditionals( rule: CompiledRule, entries: List[ReqEntry] ) -> List[CompiledRule]:
+        """Returns the conditional rules that apply, based on the first entry"""
+
+        if ( len( entries ) == 0 ) or ( entries[0].term == "" ):
+            return []
+
+        return [ conditional_rule for course, after, conditional_rule in rule.conditionals
+                 if ( entries[0].course_used == course ) and
+                    term_is_later( entries[0].term, after ) ]
+
+    @staticmethod
+    def _test( predicate: CompiledPredicate, key: OfferingKey, offering: Class ) -> bool:
+        """Returns the (shared) result of a predicate on an offering"""
+
+        return run_ucheck( predicate.test, key, offering )
+
+    #---------------------------------------------------------------------
+    # Per-Roster Evaluation
+    #---------------------------------------------------------------------
+
+    def _run_ops( self, ops: List[CompiledOp], roster: Roster,
+                  log: RecordedLog ) -> Tuple[int, int]:
+        """Runs compiled rules on a roster, returning the errors and warnings"""
+
+        errors   = 0
+        warnings = 0
+
+        for op in ops:
+            if isinstance( op, CompiledRule ):
+                result = self._run_rule( op, roster, log )
+            elif isinstance( op, CompiledGroup ):
+                result = self._run_group( op, roster, log )
+            elif isinstance( op, CompiledCheckoff ):
+                result = self._run_checkoff( op, roster, log )
+            else:
+                result = self._run_credit_total( op, roster, log )
+
+            errors   += result[0]
+            warnings += result[1]
+
+        return errors, warnings
+
+    def _run_rule( self, rule: CompiledRule, roster: Roster,
+                   log: RecordedLog ) -> Tuple[int, int]:
+        """Evaluates a requirement rule (the compiled form of basic_check)"""
+
+        errors   = 0
+        warnings = 0
+
+        entry_list = roster.get_req( rule.req )
+        if ( rule.count != -1 ) and ( len( entry_list ) != rule.count ):
+            log.error( "Expected %d entry for the %s requirement, found %d",
+                       rule.count, rule.req, len( entry_list ) )
+            for entry in entry_list:
+                entry.error( "req" )
+            errors += 1
+
+        for entry in entry_list:
+
+            if entry.course_used == "":
+                log.error( "No course indicated for %s requirement", rule.req,
+                           extra = at_entry( entry ) )
+                errors += 1
+                entry.error( "req" )
+                entry.error( "course" )
+                entry.error( "term" )
+                continue
+
+            entry.valid( "course" )
+
+            try:
+                key, offering = get_offering( entry.course_used, entry.term, roster.netid )
+                entry.valid( "term" )
+            except excp.api_exceptions.TermNotFoundError:
+                log.warning( "No data for the term %s, so can't check %s",
+                             entry.term, entry.course_used, extra = at_entry( entry ) )
+                warnings += 1
+                entry.warn( "term" )
+                entry.warn( "req" )
+                continue
+            except ( excp.api_exceptions.DeptNotFoundError,
+                     excp.api_exceptions.ClassNotFoundError ):
+                log.error( "%s wasn't offered during %s", entry.course_used, entry.term,
+                           extra = at_entry( entry ) )
+                errors += 1
+                entry.error( "term" )
+                entry.error( "req" )
+                continue
+
+            class_is_valid = True
+
+            if ( rule.predicate is not None ) and \
+               not self._test( rule.predicate, key, offering ):
+                log.error( "%s check failed by %s: " + rule.message, rule.req, entry.course_used,
+                           extra = at_entry( entry ) )
+                class_is_valid = False
+                errors += 1
+
+            if rule.full_creds and offering.max_credits != entry.cred_applied:
+                log.error( "Reported taking %s for different credits (%d) than the full " +
+                           "number of credits (%d) for the %s requirement",
+                           entry.course_used, entry.cred_applied, offering.max_credits, rule.req,
+                           extra = at_entry( entry ) )
+                errors += 1
+                class_is_valid = False
+
+            if class_is_valid:
+                log.info( "%s requirement fully satisfied by %s", rule.req, entry.course_used,
+                          extra = at_entry( entry ) )
+                entry.valid( "req" )
+            else:
+                entry.error( "req" )
+
+        for conditional_rule in self._conditionals( rule, entry_list ):
+            result = self._run_rule( conditional_rule, roster, log )
+            errors   += result[0]
+            warnings += result[1]
+
+        return errors, warnings
+
+    def _run_group( self, group: CompiledGroup, roster: Roster,
+                    log: RecordedLog ) -> Tuple[int, int]:
+        """Evaluates a group rule (the compiled form of ece_found_check)"""
+
+        errors   = 0
+        warnings = 0
+
+        group_list: List[ReqEntry] = []
+        for req in group.rules:
+            group_list += [ x for x in roster.get_req( req ) if x.course_used != "" ]
+
+        if len( group_list ) != group.count:
+            log.error( " - Expected %d %s entries, but got %d",
+                       group.count, group.label, len( group_list ) )
+            log.error( " - Extra %s courses should be listed as EXTRA-C courses", group.label )
+            errors += 1
+            for entry in group_list:
+                entry.error( "req" )
+
+        found_reqs: Set[str] = set()
+        for entry in group_list:
+            if entry.req in found_reqs:
+                log.error( "Found multiple instances of the %s requirement", entry.req,
+                           extra = at_entry( entry ) )
+                entry.error( "req" )
+            else:
+                found_reqs.add( entry.req )
+
+        log.info( "%s Requirements found: %s", group.label, ", ".join( found_reqs ) )
+
+        for reqs, description in group.one_of:
+            if not any( req in found_reqs for req in reqs ):
+                log.error( "%ss don't include either %s", group.label, description )
+                errors += 1
+                for entry in group_list:
+                    entry.error( "req" )
+
+        for req in found_reqs:
+            result = self._run_rule( group.rules[ req ], roster, log )
+            errors   += result[0]
+            warnings += result[1]
+
+        return errors, warnings
+
+    def _run_checkoff( self, checkoff: CompiledCheckoff, roster: Roster,
+                       log: RecordedLog ) -> Tuple[int, int]:
+        """Evaluates a checkoff rule (the compiled form of validate_checkoff)"""
+
+        entry_list = roster.get_checkoff( checkoff.checkoff )
+        if len( entry_list ) != 1:
+            log.error( "Expected 1 entry for the %s checkoff, found %d",
+                       checkoff.checkoff, len( entry_list ) )
+            for entry in entry_list:
+                entry.error( "req" )
+            return 1, 0
+
+        entry = entry_list[0]
+
+        if course_in_reqs( roster, entry.course_used ):
+            log.info( "%s found in the checklists' requirements", entry.course_used,
+                      extra = at_entry( entry ) )
+            entry.valid( "course" )
+        else:
+            log.error( "%s not found in the checklists' requirements", entry.course_used,
+                       extra = at_entry( entry ) )
+            entry.error( "course" )
+            entry.error( "req" )
+            return 1, 0
+
+        req_entry = cast( ReqEntry, req_course( roster, entry.course_used ) )
+
+        try:
+            key, offering = get_offering( req_entry.course_used, req_entry.term, roster.netid )
+        except _API_EXCEPTIONS:
+            log.error( "%s wasn't offered during %s", req_entry.course_used, req_entry.term,
+                       extra = at_entry( entry ) )
+            entry.error( "course" )
+            entry.error( "req" )
+            return 1, 0
+
+        if self._test( checkoff.predicate, key, offering ):
+            log.info( "%s checkoff fully satisfied by %s", checkoff.checkoff, entry.course_used,
+                      extra = at_entry( entry ) )
+            entry.valid( "req" )
+            return 0, 0
+
+        log.error( "%s checkoff not satisfied by %s", checkoff.checkoff, entry.course_used,
+                   extra = at_entry( entry ) )
+        entry.error( "req" )
+        return 1, 0
+
+    def _run_credit_total( self, rule: CreditTotalRule, roster: Roster,
+                           log: RecordedLog ) -> Tuple[int, int]:
+        """Evaluates a credit total rule"""
+
+        entry_list: List[ReqEntry] = []
+        for req in rule.reqs:
+            entry_list += roster.get_req( req )
+
+        cred_taken = sum( x.cred_applied for x in entry_list )
+        if cred_taken < rule.min_credits:
+            log.error( "%s sum to %d (<%d) credits", rule.label, cred_taken, rule.min_credits )
+            for entry in entry_list:
+                entry.error( "req" )
+            return 1, 0
+
+        return 0, 0
+
+    #---------------------------------------------------------------------
+    # Checks
+    #---------------------------------------------------------------------
+
+    def check( self, check_name: str ) -> Callable[ [Roster, Logger], Tuple[int, int] ]:
+        """
+        Returns a check function (as used by a ChecksManager) for the
+        given compiled check
+
+        Rosters that weren't part of a batch evaluation are evaluated
+        on their own when first checked
+        """
+
+        def compiled_check( roster: Roster, logger: Logger ) -> Tuple[int, int]:
+            if ( roster.netid, check_name ) not in self._outcomes:
+                self.evaluate( [ roster ] )
+
+            errors, warnings, log = self._outcomes.pop( ( roster.netid, check_name ) )
+            log.replay( logger )
+            return errors, warnings
+
+        return compiled_check
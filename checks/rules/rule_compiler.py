@@ -0,0 +1,186 @@
+"""
+#=====================================================================
+# rule_compiler.py
+#=====================================================================
+# Compiles declarative requirement rules into an ExecutionPlan
+#
+# Criteria with the same conditions compile to the same predicate, so
+# that each distinct test is only ever run once per offering, no
+# matter how many requirements or students share it
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple
+
+from checks.rules.rule_specs import Criteria, ReqRule, CreditTotalRule, GroupRule, \
+                                    CheckoffRule, CheckSpec
+from checks.rules.execution_plan import CompiledPredicate, CompiledRule, CompiledGroup, \
+                                        CompiledCheckoff, CompiledOp, ExecutionPlan
+from checks.utils.uchecks import UcheckType, is_dept, is_FWS, is_level
+from checks.utils.eligibility import EligibilityIndex
+from ui.parser import parse_class_term
+
+#---------------------------------------------------------------------
+# Compiling Criteria
+#---------------------------------------------------------------------
+
+def compile_criteria( criteria: Criteria ) -> UcheckType:
+    """Returns a ucheck testing whether a Class meets all of the criteria"""
+
+    tests: List[UcheckType] = []
+
+    if criteria.depts:
+        dept_tests = [ is_dept( dept ) for dept in sorted( criteria.depts ) ]
+        tests.append( lambda x : any( test( x ) for test in dept_tests ) )
+
+    if criteria.min_level is not None:
+        tests.append( is_level( criteria.min_level ) )
+
+    if criteria.excluded_names:
+        excluded_names = criteria.excluded_names
+        tests.append( lambda x : excluded_names.isdisjoint( x.all_names ) )
+
+    if criteria.names:
+        names = criteria.names
+        tests.append( lambda x : not names.isdisjoint( x.all_names ) )
+
+    if criteria.fws:
+        tests.append( is_FWS() )
+
+    if criteria.cde:
+        tests.append( lambda x : x.is_CDE )
+
+    return lambda x : all( test( x ) for test in tests )
+
+#---------------------------------------------------------------------
+# RuleCompiler Object
+#---------------------------------------------------------------------
+
+class RuleCompiler:
+    """
+    Compiles CheckSpecs, sharing predicates between rules
+
+    Attributes:
+
+     - _predicates: The compiled predicates, keyed by the criteria they
+                    test (dict mapping frozenset of criteria keys to
+                    CompiledPredicate)
+    """
+
+    def __init__( self ) -> None:
+        self._predicates: Dict[ FrozenSet[ Tuple ], CompiledPredicate ] = {}
+
+    def predicate( self, any_of: Sequence[Criteria] ) -> Optional[CompiledPredicate]:
+        """
+        Returns the shared predicate for meeting any of the criteria
+        (None if no criteria are given)
+        """
+
+        if len( any_of ) == 0:
+            return None
+
+        key = frozenset( criteria.key for criteria in any_of )
+        if key not in self._predicates:
+            tests = [ compile_criteria( criteria ) for criteria in any_of ]
+            self._predicates[ key ] = CompiledPredicate(
+                len( self._predicates ), lambda x : any( test( x ) for test in tests ) )
+        return self._predicates[ key ]
+
+    def compile_rule( self, rule: ReqRule ) -> CompiledRule:
+        """Compiles a ReqRule"""
+
+        conditionals = [ ( cond.course, parse_class_term( cond.after ),
+                           self.compile_rule( cond.rule ) ) for cond in rule.conditionals ]
+
+        return CompiledRule( rule.req, self.predicate( rule.any_of ), rule.message,
+                             count = rule.count, full_creds = rule.full_creds,
+                             conditionals = conditionals )
+
+    def compile_op( self, rule: object ) -> CompiledOp:
+        """Compiles any kind of rule"""
+
+        if isinstance( rule, ReqRule ):
+            return self.compile_rule( rule )
+
+        if isinstance( rule, GroupRule ):
+            rules = { req_rule.req: self.compile_rule( req_rule ) for req_rule in rule.rules }
+            return CompiledGroup( rule.label, rules, rule.count, rule.one_of )
+
+        if isinstance( rule, CheckoffRule ):
+            predicate = self.predicate( rule.any_of )
+            if predicate is None:
+                raise ValueError( f"Checkoff rule for {rule.checkoff} has no criteria" )
+            return CompiledCheckoff( rule.checkoff, predicate )
+
+        if isinstance( rule, CreditTotalRule ):
+            return rule
+
+        raise TypeError( f"Can't compile rule of type {type( rule ).__name__}" )
+
+    def compile( self, check_specs: Sequence[CheckSpec] ) -> ExecutionPlan:
+        """Compiles all of the given checks into one ExecutionPlan"""
+
+        ops: Dict[ str, List[CompiledOp] ] = {}
+        for spec in check_specs:
+            ops[ spec.name ] = [ self.compile_op( rule ) for rule in spec.rules ]
+
+        return ExecutionPlan( ops, len( self._predicates ) )
+
+def compile_checks( check_specs: Sequence[CheckSpec] ) -> ExecutionPlan:
+    """Compiles the given checks into an ExecutionPlan"""
+
+    return RuleCompiler().compile( check_specs )
+
+#---------------------------------------------------------------------
+# Eligibility Index
+#---------------------------------------------------------------------
+
+def req_rules( check_specs: Sequence[CheckSpec] ) -> Iterator[ReqRule]:
+    """Yields every requirement rule in the given checks (including nested ones)"""
+
+    to_visit: List[ReqRule] = []
+    for spec in check_specs:
+        for rule in spec.rules:
+            if isinstance( rule, ReqRule ):
+                to_visit.append( rule )
+            elif isinstance( rule, GroupRule ):
+                to_visit += rule.rules
+
+    while len( to_visit ) > 0:
+        rule = to_visit.pop( 0 )
+        yield rule
+        to_visit += [ cond.rule for cond in rule.conditionals ]
+
+def build_eligibility_index( check_specs: Sequence[CheckSpec] ) -> EligibilityIndex:
+    """
+    Builds an index of the requirements each offering can satisfy, based
+    on the criteria of the requirement rules in the given checks
+
+    Requirements whose rules have no criteria can be satisfied by any
+    offering
+    """
+
+    compiler = RuleCompiler()
+    tests: Dict[ str, UcheckType ] = {}
+
+    for rule in req_rules( check_specs ):
+        predicate = compiler.predicate( rule.any_of )
+        tests[ rule.req ] = ( lambda x : True ) if predicate is None else predicate.test
+
+    return EligibilityIndex( tests )
+
+def req_departments( check_specs: Sequence[CheckSpec], req: str ) -> Set[str]:
+    """
+    Returns the departments that offerings satisfying the requirement
+    can come from, based on its criteria (empty if it has none)
+    """
+
+    depts: Set[str] = set()
+    for rule in req_rules( check_specs ):
+        if rule.req == req:
+            for criteria in rule.any_of:
+                depts |= criteria.depts
+                depts |= { name.split( " " )[0] for name in criteria.names }
+    return depts
@@ -0,0 +1,198 @@
+"""
+#=====================================================================
+# rule_specs.py
+#=====================================================================
+# Declarative specifications of requirement rules, to be compiled
+# into an ExecutionPlan by the rule compiler
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+#---------------------------------------------------------------------
+# Criteria
+#---------------------------------------------------------------------
+
+class Criteria:
+    """
+    A set of conditions that a course offering must all meet
+
+    Attributes:
+
+     - names: The offering must go by at least one of these names, if
+              any are given (frozenset of str)
+
+     - depts: The offering must be listed in at least one of these
+              departments, if any are given (frozenset of str)
+
+     - min_level: The offering's course number must be at least this
+                  level, if given (int or None)
+
+     - excluded_names: The offering must not go by any of these names
+                       (frozenset of str)
+
+     - fws: Whether the offering must be an FWS (bool)
+
+     - cde: Whether the offering must be marked as a CDE in the course
+            catalog (bool)
+    """
+
+    def __init__( self, *, names: Iterable[str] = (), depts: Iterable[str] = (),
+                  min_level: Optional[int] = None, excluded_names: Iterable[str] = (),
+                  fws: bool = False, cde: bool = False ):
+        self.names          = frozenset( names )
+        self.depts          = frozenset( depts )
+        self.min_level      = min_level
+        self.excluded_names = frozenset( excluded_names )
+        self.fws            = fws
+        self.cde            = cde
+
+    @property
+    def key( self ) -> Tuple[ FrozenSet[str], FrozenSet[str], Optional[int],
+                              FrozenSet[str], bool, bool ]:
+        """A hashable key, equal for criteria with the same conditions"""
+        return ( self.names, self.depts, self.min_level, self.excluded_names,
+                 self.fws, self.cde )
+
+#---------------------------------------------------------------------
+# Requirement Rules
+#---------------------------------------------------------------------
+
+class ConditionalRule:
+    """
+    A rule that only applies when the first entry of a requirement uses
+    a given course after a given term
+
+    Attributes:
+
+     - course: The course listed for the requirement (str)
+
+     - after: The term that the course must be taken after (str)
+
+     - rule: The rule that must additionally be satisfied (ReqRule)
+    """
+
+    def __init__( self, course: str, after: str, rule: 'ReqRule' ):
+        self.course = course
+        self.after  = after
+        self.rule   = rule
+
+class ReqRule:
+    """
+    A rule that each entry for a requirement must satisfy
+
+    Attributes:
+
+     - req: The requirement the rule applies to (str)
+
+     - any_of: The entry's offering must meet at least one of these
+               Criteria; if empty, any offering is allowed
+               (list of Criteria)
+
+     - message: The error message when no Criteria are met (str)
+
+     - count: The number of entries expected for the requirement (-1
+              allows any number) (int)
+
+     - full_creds: Whether the entry must apply all of the offering's
+                   credits (bool)
+
+     - conditionals: Rules that conditionally also apply
+                     (list of ConditionalRule)
+    """
+
+    def __init__( self, req: str, any_of: Sequence[Criteria] = (), message: str = "", *,
+                  count: int = 1, full_creds: bool = False,
+                  conditionals: Sequence[ConditionalRule] = () ):
+        self.req          = req
+        self.any_of       = list( any_of )
+        self.message      = message
+        self.count        = count
+        self.full_creds   = full_creds
+        self.conditionals = list( conditionals )
+
+class CreditTotalRule:
+    """
+    A rule that the credits applied across some requirements must sum
+    to a minimum
+
+    Attributes:
+
+     - label: A description of the requirements, for logging (str)
+
+     - reqs: The requirements whose credits are summed (list of str)
+
+     - min_credits: The minimum number of credits (int)
+    """
+
+    def __init__( self, label: str, reqs: Sequence[str], min_credits: int ):
+        self.label       = label
+        self.reqs        = list( reqs )
+        self.min_credits = min_credits
+
+class GroupRule:
+    """
+    A rule that a number of requirements must be chosen from a group,
+    each of which must then satisfy its own rule
+
+    Attributes:
+
+     - label: A description of the group, for logging (str)
+
+     - rules: The rules for each requirement in the group
+              (list of ReqRule)
+
+     - count: The number of (non-blank) entries expected across the
+              group (int)
+
+     - one_of: Collections of requirements that must have at least one
+               entry present, with a description for logging
+               (list of tuples of (tuple of str, str))
+    """
+
+    def __init__( self, label: str, rules: Sequence[ReqRule], count: int,
+                  one_of: Sequence[ Tuple[ Tuple[str, ...], str ] ] = () ):
+        self.label  = label
+        self.rules  = list( rules )
+        self.count  = count
+        self.one_of = list( one_of )
+
+class CheckoffRule:
+    """
+    A rule that a checkoff is satisfied by a course listed in the
+    requirements
+
+    Attributes:
+
+     - checkoff: The checkoff the rule applies to (str)
+
+     - any_of: The course's offering must meet at least one of these
+               Criteria (list of Criteria)
+    """
+
+    def __init__( self, checkoff: str, any_of: Sequence[Criteria] ):
+        self.checkoff = checkoff
+        self.any_of   = list( any_of )
+
+RuleType = Union[ ReqRule, CreditTotalRule, GroupRule, CheckoffRule ]
+
+#---------------------------------------------------------------------
+# Check Specifications
+#---------------------------------------------------------------------
+
+class CheckSpec:
+    """
+    A named collection of rules, run as one check by a ChecksManager
+
+    Attributes:
+
+     - name: The name of the check (str)
+
+     - rules: The rules to evaluate, in order (list of rules)
+    """
+
+    def __init__( self, name: str, rules: List[RuleType] ):
+        self.name  = name
+        self.rules = rules
@@ -1,3 +1,5 @@
 """Import Checks Utilities"""
 
 import checks.utils.basic_check
+import checks.utils.offerings
+import checks.utils.ucheck_cache
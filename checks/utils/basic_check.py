@@ -10,17 +10,35 @@
 """
 
 from logging import Logger
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 from obj.roster_obj import Roster
 from obj.roster_entry_obj import ReqEntry
 from obj.class_obj import Class
 from checks.utils.uchecks import UcheckType
+from checks.utils.offerings import OfferingKey, get_offering
+from checks.utils.ucheck_cache import run_ucheck
+from checks.utils.eligibility import get_eligibility_index
+from ui.event_log import at_entry
 
 import exceptions as excp
 
+def uchecks_needed( req: str, uchecks: Dict[UcheckType, str], offering_key: OfferingKey,
+                    class_obj: Class ) -> Dict[UcheckType, str]:
+    """
+    Returns the uchecks that need to be run on an offering for the
+    requirement (none if the active eligibility index marks it eligible)
+    """
+
+    index = get_eligibility_index()
+    if ( index is not None ) and index.indexes( req ) and \
+       index.satisfies( req, offering_key, class_obj ):
+        return {}
+    return uchecks
+
 def basic_check( roster: Roster, logger: Logger, req: str, uchecks: Dict[UcheckType, str],
-                 req_num_expected: int = 1, full_creds: bool = False ) -> Tuple[int, int, ReqEntry]:
+                 req_num_expected: int = 1,
+                 full_creds: bool = False ) -> Tuple[int, int, Optional[ReqEntry]]:
     """
     Checks that the student satisfies a requirement with a valid class.
 
@@ -33,11 +51,20 @@ def basic_check( roster: Roster, logger: Logger, req: str, uchecks: Dict[UcheckT
        req_num_expected; use -1 to disable)
      - Checking that all of the credits for the course were applied (set by full_creds)
 
+    Offerings and ucheck results are shared with other students who took
+    the same offering (see offerings.py and ucheck_cache.py). If an
+    eligibility index is active and indexes the requirement, the
+    offering's bit is tested first; the individual uchecks are only run
+    on offerings it marks as ineligible, to report why
+
     The function returns the number of errors and warnings encountered (respectively), as well as 
-    the first entry found for the given requirement (useful for some checks expecting only one 
-    entry, and which take action based on it). Finally, you can optionally specify if you expect 
-    more than one requirement to be found
+    the first entry found for the given requirement, or None if there are none (useful for some
+    checks expecting only one entry, and which take action based on it). Finally, you can
+    optionally specify if you expect more than one requirement to be found
     """
+
+    # pylint: disable=too-many-locals
+
     errors   = 0
     warnings = 0
 
@@ -49,13 +76,15 @@ def basic_check( roster: Roster, logger: Logger, req: str, uchecks: Dict[UcheckT
             entry.error( "req" )
         errors += 1
 
-    entry_to_return = entry_list[0]
+    # There's no entry to return if the requirement wasn't listed
+    entry_to_return = entry_list[0] if len( entry_list ) > 0 else None
 
     for entry in entry_list:
 
         # Check that a course was supplied
         if entry.course_used == "":
-            logger.error( "No course indicated for %s requirement", req )
+            logger.error( "No course indicated for %s requirement", req,
+                          extra = at_entry( entry ) )
             errors += 1
             entry.error( "req" )
             entry.error( "course" )
@@ -66,17 +95,18 @@ def basic_check( roster: Roster, logger: Logger, req: str, uchecks: Dict[UcheckT
 
         # Check that it was offered during the reported term
         try:
-            class_obj = Class( entry.course_used, entry.term, netid = roster.netid )
+            offering_key, class_obj = get_offering( entry.course_used, entry.term, roster.netid )
             entry.valid( "term" )
         except excp.api_exceptions.TermNotFoundError:
             logger.warning( "No data for the term %s, so can't check %s",
-                            entry.term, entry.course_used )
+                            entry.term, entry.course_used, extra = at_entry( entry ) )
             warnings += 1
             entry.warn( "term" )
             entry.warn( "req" )
             continue
         except ( excp.api_exceptions.DeptNotFoundError, excp.api_exceptions.ClassNotFoundError ):
-            logger.error( "%s wasn't offered during %s", entry.course_used, entry.term )
+            logger.error( "%s wasn't offered during %s", entry.course_used, entry.term,
+                          extra = at_entry( entry ) )
             errors += 1
             entry.error( "term" )
             entry.error( "req" )
@@ -85,9 +115,10 @@ def basic_check( roster: Roster, logger: Logger, req: str, uchecks: Dict[UcheckT
         # Finally, check that a valid class was supplied
         class_is_valid = True
 
-        for ucheck, error_msg in uchecks.items():
-            if not ucheck( class_obj ):
-                logger.error( "%s check failed by %s: " + error_msg, req, entry.course_used )
+        for ucheck, error_msg in uchecks_needed( req, uchecks, offering_key, class_obj ).items():
+            if not run_ucheck( ucheck, offering_key, class_obj ):
+                logger.error( "%s check failed by %s: " + error_msg, req, entry.course_used,
+                              extra = at_entry( entry ) )
                 class_is_valid = False
                 errors += 1
 
@@ -95,12 +126,14 @@ def basic_check( roster: Roster, logger: Logger, req: str, uchecks: Dict[UcheckT
         if full_creds and class_obj.max_credits != entry.cred_applied:
             logger.error( "Reported taking %s for different credits (%d) than the full " +
                           "number of credits (%d) for the %s requirement", 
-                          entry.course_used, entry.cred_applied, class_obj.max_credits, req )
+                          entry.course_used, entry.cred_applied, class_obj.max_credits, req,
+                          extra = at_entry( entry ) )
             errors += 1
             class_is_valid = False
 
         if class_is_valid:
-            logger.info( "%s requirement fully satisfied by %s", req, entry.course_used )
+            logger.info( "%s requirement fully satisfied by %s", req, entry.course_used,
+                         extra = at_entry( entry ) )
             entry.valid( "req" )
         else:
             entry.error( "req" )
@@ -0,0 +1,141 @@
+"""
+#=====================================================================
+# eligibility.py
+#=====================================================================
+# An index of which requirements each course offering can satisfy,
+# stored as a bitmask per offering
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from api import class_api
+from obj.class_obj import Class
+from obj.roster_entry_obj import req_types
+from checks.utils.offerings import OfferingKey
+from checks.utils.ucheck_cache import run_ucheck
+from checks.utils.uchecks import UcheckType
+
+#---------------------------------------------------------------------
+# Requirement Bits
+#---------------------------------------------------------------------
+# Each requirement is assigned a bit, in alphabetical order
+
+req_bits: Dict[ str, int ] = { req: 1 << idx for idx, req in enumerate( sorted( req_types ) ) }
+
+#---------------------------------------------------------------------
+# EligibilityIndex Object
+#---------------------------------------------------------------------
+
+class EligibilityIndex:
+    """
+    An index of the requirements that course offerings can satisfy
+
+    Only requirements with a test are indexed; the bits of other
+    requirements are never set. A requirement's bit is only computed for
+    an offering once it's asked about, so offerings are only tested
+    against the requirements they're queried for
+
+    Attributes:
+
+     - tests: The test for each indexed requirement
+              (dict mapping str to ucheck)
+
+     - indexed_mask: The bits of all indexed requirements (int)
+
+     - _known: The bits computed so far for each offering
+               (dict mapping OfferingKey to int)
+
+     - _masks: The bits set so far for each offering (a subset of its
+               known bits) (dict mapping OfferingKey to int)
+    """
+
+    def __init__( self, tests: Dict[ str, UcheckType ] ):
+        self.tests = tests
+        self.indexed_mask = 0
+        for req in tests:
+            self.indexed_mask |= req_bits[ req ]
+
+        self._known: Dict[ OfferingKey, int ] = {}
+        self._masks: Dict[ OfferingKey, int ] = {}
+
+    #---------------------------------------------------------------------
+    # Forward Queries
+    #---------------------------------------------------------------------
+
+    def _compute( self, reqs: Iterable[str], key: OfferingKey, offering: Class ) -> None:
+        """Computes the offering's bits for the given (indexed) requirements"""
+
+        known = self._known.get( key, 0 )
+        mask  = self._masks.get( key, 0 )
+
+        for req in reqs:
+            if ( known & req_bits[ req ] ) == 0:
+                known |= req_bits[ req ]
+                if run_ucheck( self.tests[ req ], key, offering ):
+                    mask |= req_bits[ req ]
+
+        self._known[ key ] = known
+        self._masks[ key ] = mask
+
+    def mask( self, key: OfferingKey, offering: Class ) -> int:
+        """Returns the bitmask of all requirements that the offering can satisfy"""
+
+        if self._known.get( key, 0 ) != self.indexed_mask:
+            self._compute( self.tests, key, offering )
+        return self._masks[ key ]
+
+    def indexes( self, req: str ) -> bool:
+        """Returns whether the requirement is indexed"""
+        return ( self.indexed_mask & req_bits[ req ] ) != 0
+
+    def satisfies( self, req: str, key: OfferingKey, offering: Class ) -> bool:
+        """Returns whether the offering can satisfy the (indexed) requirement"""
+
+        if ( self._known.get( key, 0 ) & req_bits[ req ] ) == 0:
+            self._compute( [ req ], key, offering )
+        return ( self._masks[ key ] & req_bits[ req ] ) != 0
+
+    #---------------------------------------------------------------------
+    # Reverse Queries
+    #---------------------------------------------------------------------
+
+    def offerings_for( self, term: str, req: str ) -> List[ Tuple[ str, str ] ]:
+        """
+        Returns the cached offerings during the term that can satisfy the
+        requirement, as (course name, section) tuples
+
+        The section is empty for classes with a single enroll group;
+        otherwise, it's the first section of each satisfying enroll group
+        """
+
+        found: List[ Tuple[ str, str ] ] = []
+
+        for attrs in class_api.cached_attrs( term ):
+            for enrl_idx, group in enumerate( attrs.groups ):
+                section = group.sections[0] if len( attrs.groups ) > 1 else ""
+                key = ( attrs.primary_name, term, enrl_idx )
+
+                if self.satisfies( req, key, Class.from_attrs( attrs, term, enrl_idx ) ):
+                    found.append( ( attrs.primary_name, section ) )
+
+        return found
+
+#---------------------------------------------------------------------
+# Active Index
+#---------------------------------------------------------------------
+# The index consulted by basic_check, if any
+
+_ACTIVE_INDEX: Optional[EligibilityIndex] = None
+
+def set_eligibility_index( index: Optional[EligibilityIndex] ) -> None:
+    """Sets the index that basic_check tests offerings against first"""
+
+    global _ACTIVE_INDEX
+    _ACTIVE_INDEX = index
+
+def get_eligibility_index() -> Optional[EligibilityIndex]:
+    """Returns the index that basic_check tests offerings against first, if any"""
+    return _ACTIVE_INDEX
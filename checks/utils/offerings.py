@@ -0,0 +1,105 @@
+"""
+#=====================================================================
+# offerings.py
+#=====================================================================
+# A per-run cache of the Class objects for the course offerings that
+# students list, shared across all students who took the same
+# offering
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import Dict, Tuple, Union
+
+from api import class_api
+from api.course_attrs import CourseAttrs
+from obj.class_obj import Class
+from obj.sections_obj import get_section
+
+import exceptions as excp
+
+#---------------------------------------------------------------------
+# Offering Keys
+#---------------------------------------------------------------------
+# An offering is identified by the course, the term, and the index of
+# the enroll group the student took it in, so that students in any of
+# a group's sections share the offering.
+#
+# The enroll group is found from the section the student was recorded
+# in. If no section was recorded and the class has multiple enroll
+# groups, the group is chosen for that student specifically (once per
+# run), and the student then shares the chosen group's offering
+
+OfferingKey = Tuple[ str, str, int ]
+
+_offerings: Dict[ OfferingKey, Class ] = {}
+
+# The attributes of each course in each term, or the exception from
+# looking them up
+_attrs: Dict[ Tuple[ str, str ], Union[ CourseAttrs, Exception ] ] = {}
+
+# The enroll group chosen for each student without a recorded section
+_chosen_groups: Dict[ Tuple[ str, str, str ], int ] = {}
+
+# Exceptions that don't depend on the student, and can be shared
+_SHARED_EXCEPTIONS = ( excp.api_exceptions.TermNotFoundError,
+                       excp.api_exceptions.DeptNotFoundError,
+                       excp.api_exceptions.ClassNotFoundError )
+
+def course_attrs( course_name: str, term: str ) -> CourseAttrs:
+    """
+    Returns the attributes of a course taken in the given term, looking
+    them up only once per run
+
+    Raises the same exceptions as looking them up would
+    """
+
+    if ( course_name, term ) not in _attrs:
+        try:
+            _attrs[ ( course_name, term ) ], _ = class_api.offering_attrs( course_name, term )
+        except _SHARED_EXCEPTIONS as e:
+            _attrs[ ( course_name, term ) ] = e
+
+    attrs = _attrs[ ( course_name, term ) ]
+    if isinstance( attrs, Exception ):
+        raise attrs
+    return attrs
+
+def get_offering( course_name: str, term: str, netid: str ) -> Tuple[ OfferingKey, Class ]:
+    """
+    Returns the key and Class object of the offering that the given
+    student took, constructing the Class only if no student has needed
+    the same offering before
+
+    Raises the same exceptions as constructing the Class would
+    """
+
+    attrs = course_attrs( course_name, term )
+
+    if len( attrs.groups ) == 1:
+        enrl_idx = 0
+    else:
+        section  = get_section( netid, term, course_name )
+        enrl_idx = attrs.section_groups.get( section, -1 )
+
+        if enrl_idx == -1: # No section recorded (or an unknown one), so the Class resolves it
+            student = ( course_name, term, netid )
+            if student not in _chosen_groups:
+                class_obj = Class( course_name, term, netid = netid )
+                _chosen_groups[ student ] = class_obj.enrl_idx
+                _offerings.setdefault( ( course_name, term, class_obj.enrl_idx ), class_obj )
+            enrl_idx = _chosen_groups[ student ]
+
+    key = ( course_name, term, enrl_idx )
+    if key not in _offerings:
+        _offerings[ key ] = Class( course_name, term, netid = netid )
+
+    return key, _offerings[ key ]
+
+def clear_offerings() -> None:
+    """Removes all cached offerings"""
+
+    _offerings.clear()
+    _attrs.clear()
+    _chosen_groups.clear()
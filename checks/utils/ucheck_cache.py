@@ -0,0 +1,74 @@
+"""
+#=====================================================================
+# ucheck_cache.py
+#=====================================================================
+# A per-run cache of ucheck results for course offerings
+#
+# A ucheck's result only depends on the offering it's run on, so
+# results are shared across all students who took the same offering
+# (as identified by checks.utils.offerings)
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+from typing import Dict, Tuple
+
+from obj.class_obj import Class
+from checks.utils.offerings import OfferingKey
+from checks.utils.uchecks import UcheckType
+
+#---------------------------------------------------------------------
+# Cache Storage
+#---------------------------------------------------------------------
+# uchecks are keyed by identity; they're created once when their check
+# module is imported, so each keeps the same identity for the run
+
+_results: Dict[ Tuple[ UcheckType, OfferingKey ], bool ] = {}
+
+class UcheckCacheStats:
+    """
+    Counters for the ucheck cache
+
+    Attributes:
+
+     - hits: The number of results served from the cache (int)
+
+     - misses: The number of results that had to be computed (int)
+    """
+
+    def __init__( self ) -> None:
+        self.hits   = 0
+        self.misses = 0
+
+    def __str__( self ) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+stats = UcheckCacheStats()
+
+#---------------------------------------------------------------------
+# Accessor Functions
+#---------------------------------------------------------------------
+
+def run_ucheck( ucheck: UcheckType, key: OfferingKey, offering: Class ) -> bool:
+    """
+    Returns the result of the ucheck on the offering with the given key,
+    only running the ucheck if it hasn't been run on the offering before
+    """
+
+    result_key = ( ucheck, key )
+    if result_key in _results:
+        stats.hits += 1
+        return _results[ result_key ]
+
+    stats.misses += 1
+    result = ucheck( offering )
+    _results[ result_key ] = result
+    return result
+
+def clear_ucheck_cache() -> None:
+    """Removes all cached results, and resets the counters"""
+
+    _results.clear()
+    stats.hits   = 0
+    stats.misses = 0
@@ -51,7 +51,7 @@ def is_level( level: int ) -> UcheckType:
     or above the given level
     """
 
-    return lambda x : int( x.course_number ) >= level
+    return lambda x : ( x.level or 0 ) >= level
 
 #---------------------------------------------------------------------
 # is_name
@@ -75,4 +75,4 @@ def is_names( class_names: List[str] ) -> UcheckType:
     of the possible names
     """
 
-    return lambda x : any( name in x.all_names for name in class_names )
+    return lambda x : not x.all_names.isdisjoint( class_names )
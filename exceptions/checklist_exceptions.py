@@ -22,7 +22,7 @@ class UnsupportedFileTypeError( Exception ):
         self.file = os.path.basename( file )
 
         err_msg = f"{self.file} isn't a supported checklist file format. "
-        err_msg += "Please use a file ending in .xlsx"
+        err_msg += "Please use a file ending in .xlsx (or a .zip file of them)"
         super().__init__( err_msg )
 
 class MultipleAttributeError( Exception ):
@@ -40,3 +40,20 @@ class MultipleAttributeError( Exception ):
         err_msg = f"The attributs {self.attr} is found {self.num} times in your checklist. "
         err_msg += "Please ensure that this text only occurs once"
         super().__init__( err_msg )
+
+class UnpatchableChecklistError( Exception ):
+    """
+    Indicates that a checklist's workbook isn't laid out in a way that we
+    can annotate by directly patching its styles
+
+    Attributes:
+     - file: The checklist file
+     - reason: What we couldn't find or patch
+    """
+
+    def __init__( self, file: str, reason: str ):
+        self.file   = os.path.basename( file )
+        self.reason = reason
+
+        err_msg = f"Can't directly annotate {self.file}: {self.reason}"
+        super().__init__( err_msg )
@@ -36,6 +36,21 @@ class InvalidTermError( Exception ):
         err_msg = f"{term} is not a valid term"
         super().__init__( err_msg )
 
+class UnansweredQuestionError( Exception ):
+    """
+    Indicates that a question needed to continue was deferred (in batch
+    mode) without a provisional answer
+
+    Attributes:
+     - question: The question that wasn't answered (str)
+    """
+
+    def __init__( self, question: str ):
+        self.question = question
+
+        err_msg = f"Unanswered question (see the questions file): {question}"
+        super().__init__( err_msg )
+
 class InvalidGradeError( Exception ):
     """
     Indicates that the provided grade isn't a valid grade
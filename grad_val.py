@@ -11,23 +11,25 @@
 
 import argparse
 import os
-from typing import NoReturn, Dict
+from typing import NoReturn, Optional
 import shutil
 import sys
 
-from api.bulk_api import bulk_add_roster_data, bulk_add_grades_data, bulk_populate
+from api import bulk_api
+from api.bulk_api import bulk_add_grades_data, bulk_populate
+from api.class_api import set_api_base_url
 import obj
 import checks
 from ui.logger import gen_file_logger, set_verbosity, SUCCESS
-from ui.annotate import make_annotated_checklist
+from ui.ambiguities import QUESTIONS_FILE_NAME, get_queue, set_batch, set_questions_file
+from ui.annotate import prune_annotated_checklists
+from ui.memprofile import MemProfiler
+from ui.event_log import show_logs
+from ui.results_export import EXPORT_FORMATS, ResultsWriter, export_format
 
-from checks.common_core.common_core_check import common_core_check
-from checks.fws.fws_check                 import fws_check
-from checks.ece_core.ece_core_check       import ece_core_check
-from checks.ece_found.ece_found_check     import ece_found_check
-from checks.ece_upper.ece_upper_check     import ece_upper_check
-from checks.extra.extra_check             import extra_check
-from checks.checkoffs.checkoffs_check     import checkoffs_check
+from checks.pipeline                      import STAGES, StudentStream, add_checks
+from checks.utils                         import ucheck_cache
+from checks.results_sink                  import ResultsSink
 
 __author__  = "Aidan McNay '24"
 __email__   = "acm289@cornell.edu"
@@ -59,14 +61,26 @@ class DefaultHelpParser( argparse.ArgumentParser ):
         sys.exit( 2 )
 
 parser = DefaultHelpParser( description = description,
-                            usage = "%(prog)s CHECKLIST(S)",
+                            usage = "%(prog)s CHECKLIST(S)\n" +
+                                    "       %(prog)s --dir DIR\n" +
+                                    "       %(prog)s logs show NETID [CHECK]",
                             formatter_class = argparse.RawTextHelpFormatter )
 
 # Mandatory arguments
-parser.add_argument( "checklists", help = "The checklist(s) to validate",
-                     metavar = "CHECKLIST(S)", action = "append" )
+parser.add_argument( "checklists",
+                     help = "The checklist(s) to validate (a workbook, or a .zip file\n" +
+                            "of workbooks), or glob patterns matching them",
+                     metavar = "CHECKLIST(S)", nargs = "*" )
 
 # Optional arguments
+parser.add_argument( "--dir", metavar = "DIR", dest = "checklist_dir",
+                     help = "Validate every checklist (.xlsx or .zip file) in the given\n" +
+                            "directory" )
+
+parser.add_argument( "--window", type = int, default = 64, metavar = "N",
+                     help = "Read, check, and annotate N students at a time, releasing\n" +
+                            "each window before reading the next (default: 64)" )
+
 parser.add_argument( "-g", "--grades",
                      help = "Verify the checklist against the given grades/credits",
                      action = "append",
@@ -78,9 +92,68 @@ parser.add_argument( "-l", default = "logs", help = "Set the location of the log
 parser.add_argument( "-s", action="store_true", dest="semantics",
                      help = "Run semantics checks (the requirement is satisfied by the class)" )
 
+parser.add_argument( "--assign", action="store_true",
+                     help = "With -g and -s, find an assignment of each student's courses\n" +
+                            "to the requirements" )
+
+parser.add_argument( "--rules", action="store_true",
+                     help = "Evaluate semantics checks with the compiled rules engine" )
+
+parser.add_argument( "--api-url", metavar = "URL", dest = "api_url",
+                     help = "Use the classes API at the given base URL\n" +
+                            "(ex. a local bench/stub_server.py at http://localhost:8000/api/2.0)" )
+
+parser.add_argument( "--per-sheet", action="store_true", dest="per_sheet",
+                     help = "Read a checklist from every sheet of each workbook, rather\n" +
+                            "than only the first" )
+
+parser.add_argument( "--per-file-logs", action="store_true", dest="per_file_logs",
+                     help = "Log each check to a separate file per student\n" +
+                            "(ex. LOGS_DIR/common-core/NETID.log), rather than to\n" +
+                            "LOGS_DIR/events.jsonl" )
+
+parser.add_argument( "--resume", action="store_true",
+                     help = "Resume an interrupted run in the logs directory, skipping\n" +
+                            "students whose checks already completed" )
+
+parser.add_argument( "--batch", action="store_true",
+                     help = "Never prompt; questions (such as which section a student\n" +
+                            "took) are given a provisional answer and written to\n" +
+                            f"LOGS_DIR/{QUESTIONS_FILE_NAME}, and their entries are warned about" )
+
+parser.add_argument( "--answers", metavar = "QUESTIONS-JSON",
+                     help = "Use the answers filled in to an earlier run's questions file" )
+
+parser.add_argument( "--export-format", choices = list( EXPORT_FORMATS ), default = "parquet",
+                     dest = "export_format",
+                     help = "Format of the results table in the logs directory\n" +
+                            "(default: parquet, or csv if pyarrow isn't installed)" )
+
+parser.add_argument( "--memprofile", metavar = "JSON",
+                     help = "Profile the memory used by each phase, saving the report\n" +
+                            "to the given JSON file" )
+
 parser.add_argument( "-v", "--verbose", action="store_true",
                      help = "Provide verbose output" )
 
+# Viewing a student's logs from a previous run, with
+# "grad_val.py logs show NETID [CHECK]"
+
+logs_parser = DefaultHelpParser( prog = "grad_val.py logs",
+                                 description = "Shows a student's logs from a previous run",
+                                 usage = "%(prog)s show NETID [CHECK]",
+                                 formatter_class = argparse.RawTextHelpFormatter )
+
+logs_parser.add_argument( "command", choices = [ "show" ], help = "The action to take" )
+
+logs_parser.add_argument( "netid", metavar = "NETID", help = "The student to show the logs of" )
+
+logs_parser.add_argument( "check", metavar = "CHECK", nargs = "?",
+                          help = "Only show the logs of the given check" )
+
+logs_parser.add_argument( "-l", default = "logs", dest = "logs", metavar = "LOGS_DIR",
+                          help = "The logs directory of the run (default: logs)" )
+
 #---------------------------------------------------------------------
 # Logging
 #---------------------------------------------------------------------
@@ -110,21 +183,53 @@ def makelogdir() -> str:
     os.makedirs( LOG_DIR, exist_ok = True )
     return LOG_DIR
 
+# Outputs in the logging directory that are kept between runs, as
+# they're only regenerated when they'd change
+KEPT_OUTPUTS = [ "annotated-checklists", "checklist-cache" ]
+
 def removelogdir() -> None:
-    """Removes the logging directory, if it's there"""
+    """
+    Removes the contents of the logging directory (other than the outputs
+    kept between runs), if it's there
+    """
 
     if os.path.exists( LOG_DIR ) and os.path.isdir( LOG_DIR ):
-        shutil.rmtree( LOG_DIR )
+        for name in os.listdir( LOG_DIR ):
+            path = os.path.join( LOG_DIR, name )
+            if name in KEPT_OUTPUTS:
+                continue
+            if os.path.isdir( path ) and not os.path.islink( path ):
+                shutil.rmtree( path )
+            else:
+                os.remove( path )
 
 #---------------------------------------------------------------------
 # Main Code
 #---------------------------------------------------------------------
 
 if __name__ == "__main__":
+    if len( sys.argv ) > 1 and sys.argv[1] == "logs":
+        logs_args = logs_parser.parse_args( sys.argv[2:] )
+        sys.exit( show_logs( get_abs_path( logs_args.logs ), logs_args.netid, logs_args.check ) )
+
     args = parser.parse_args()
+    if ( len( args.checklists ) == 0 ) and ( args.checklist_dir is None ):
+        parser.error( "no checklists given (use CHECKLIST(S) or --dir DIR)" )
+    if args.window < 1:
+        parser.error( "--window must be at least 1" )
+
     set_verbosity( args.verbose )
+    profiler = MemProfiler( enabled = args.memprofile is not None )
+    if args.api_url:
+        set_api_base_url( args.api_url )
+    set_batch( args.batch )
+    num_answers = 0
+    if args.answers is not None: # Read before the logs directory (which may hold it) is cleared
+        num_answers = get_queue().load_answers( get_abs_path( args.answers ) )
+
     setlogdir( args.logs )
-    removelogdir()
+    if not args.resume:
+        removelogdir()
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
     # Instantiate main logger and CheckManager
@@ -134,39 +239,22 @@ if __name__ == "__main__":
     summary_file = os.path.join( log_dir, "summary.log" )
     summary_logger = gen_file_logger( summary_file )
 
-    checks_mngr = checks.checks_manager.ChecksManager()
+    results_sink = ResultsSink( os.path.join( log_dir, "results.jsonl" ) )
+    questions_path = os.path.join( log_dir, QUESTIONS_FILE_NAME )
+    set_questions_file( questions_path )
+    if args.resume and os.path.exists( questions_path ):
+        summary_logger.info( "Kept %d questions from the interrupted run",
+                             get_queue().load_questions( questions_path ) )
+    checks_mngr = checks.checks_manager.ChecksManager( results_sink, args.per_file_logs )
 
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-    # Obtain the rosters from the checklists
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-
-    rosters = []
-    netids_found: Dict[str, str] = {}
-
-    summary_logger.info( "Checking NetID uniqueness across checklists..." )
-
-    for checklist_path in args.checklists:
-        # Use the absolute path, for clarity
-        checklist = obj.checklist_obj.Checklist( get_abs_path( checklist_path ) )
-        roster = obj.roster_obj.Roster( checklist )
-
-        rosters.append( roster )
-
-        if roster.netid in netids_found:
-            summary_logger.error( "NetID %s (in %s) is a duplicate (previously found in %s)",
-                                  roster.netid, os.path.relpath( checklist_path ),
-                                                os.path.relpath( netids_found[ roster.netid ] ) )
-            sys.exit( 1 )
-
-        else:
-            netids_found[ roster.netid ] = checklist_path
-
-    summary_logger.log( SUCCESS, "No duplicate NetIDs detected" )
+    if args.answers is not None:
+        summary_logger.info( "Read %d answers from %s", num_answers, args.answers )
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
     # Grade/Credits Validation
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
+    grades: Optional[obj.grades_obj.Grades] = None
     if args.grades :
         # Form grades
         grades = obj.grades_obj.Grades()
@@ -177,61 +265,116 @@ if __name__ == "__main__":
 
         bulk_add_grades_data( grades.gen_api_reqs() )
 
-        checks_mngr.add_check( "grade-validation",
-                               lambda x, y : checks.grade_check.grade_check( x, grades, y ) )
-
-        checks_mngr.add_check( "credits-validation",
-                               lambda x, y : checks.credits_check.credits_check( x, grades, y ) )
+    profiler.phase( "grades" )
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-    # Semantics Validation
+    # Add Checks
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    if args.semantics:
-
-        for roster in rosters:
-            bulk_add_roster_data( roster.req_entries )
-
-        # Add semantics checks
+    rules_plan = add_checks( checks_mngr, grades, semantics = args.semantics, rules = args.rules,
+                             assign = args.assign, batch = args.batch )
 
-        checks_mngr.add_check( "common-core",   common_core_check )
-        checks_mngr.add_check( "fws-check",     fws_check         )
-        checks_mngr.add_check( "ece-core",      ece_core_check    )
-        checks_mngr.add_check( "ece-found",     ece_found_check   )
-        checks_mngr.add_check( "ece-upper",     ece_upper_check   )
-        checks_mngr.add_check( "extra-classes", extra_check       )
-        checks_mngr.add_check( "checkoffs",     checkoffs_check   )
+    profiler.phase( "semantics-setup" )
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
     # Populate API Information
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    # The grades' data is fetched up front; the data for each window of
+    # students' classes is fetched as the window is read
 
     summary_logger.info( "Adding API data..." )
     bulk_populate()
 
-    if args.grades:
+    if grades is not None:
         grades.populate_aliases()
         obj.sections_obj.populate_aliases( grades.get_aliases() )
 
+    profiler.phase( "api" )
+
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-    # Run Checks
+    # Stream the Students
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    # Each window of students is read, prefetched, checked, exported,
+    # and annotated before the next is read, so only a window of
+    # Rosters is held at a time (see checks/pipeline.py)
+
+    # Use absolute paths, for clarity
+    checklist_paths = [ get_abs_path( path ) for path in
+                        obj.checklist_sources.checklist_files( args.checklists,
+                                                               args.checklist_dir ) ]
+    checklist_cache = obj.checklist_cache.ChecklistCache( os.path.join( log_dir,
+                                                                        "checklist-cache" ) )
+
+    results_format = export_format( args.export_format )
+    if results_format != args.export_format:
+        summary_logger.info( "pyarrow isn't installed; exporting results as CSV" )
+    results_writer = ResultsWriter( os.path.join( log_dir, "results" ), results_format,
+                                    list( checks_mngr.checks ) )
 
-    checks_mngr.run_checks( rosters, log_dir, summary_logger )
+    annotated_checklists_dir = os.path.join( log_dir, "annotated-checklists" )
+    stream = StudentStream( checks_mngr, results_writer, annotated_checklists_dir,
+                            semantics = args.semantics, rules_plan = rules_plan,
+                            resume = args.resume )
+
+    summary_logger.info( "Checking NetID uniqueness across checklists..." )
+    checks_mngr.open_logs( log_dir, summary_logger )
+
+    def profile_window( window_idx: int, stage: str ) -> None:
+        """Profiles each window, once it's been annotated"""
+        if stage == STAGES[-1]:
+            profiler.phase( f"window-{window_idx}" )
+
+    stream.run( checklist_paths, args.window, summary_logger, per_sheet = args.per_sheet,
+                checklist_cache = checklist_cache, stage_hook = profile_window )
+
+    if stream.num_duplicates == 0:
+        summary_logger.log( SUCCESS, "No duplicate NetIDs detected" )
+    else:
+        summary_logger.error( "%d duplicate NetIDs skipped", stream.num_duplicates )
+    summary_logger.info( "Checklist cache: %s", checklist_cache )
+    if args.resume:
+        summary_logger.info( "Resuming: %d of %d students already checked",
+                             stream.num_restored, len( stream.netids_found ) )
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
     # Summary
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
     checks_mngr.summary( summary_logger )
+    if args.semantics:
+        summary_logger.info( "Ucheck cache: %s", ucheck_cache.stats )
+    if bulk_api.stats.requests > 0:
+        summary_logger.info( "API bulk fetches: %s", bulk_api.stats )
+    if bulk_api.stats.failures > 0:
+        summary_logger.warning( "%d department(s) couldn't be fetched from the API; their " +
+                                "classes are reported as not offered", bulk_api.stats.failures )
     summary_logger.info( "Run logs in the %s directory", args.logs )
 
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-    # Output Annotated Checklists
-    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+    results_path = results_writer.close()
+    summary_logger.info( "Results table in %s",
+                         os.path.join( args.logs, os.path.basename( results_path ) ) )
 
-    annotated_checklists_dir = os.path.join( log_dir, "annotated-checklists" )
-    os.makedirs( annotated_checklists_dir, exist_ok = True )
+    prune_annotated_checklists( annotated_checklists_dir, stream.annotation_names )
+    summary_logger.info( "Annotated %d workbooks (%d unchanged)", stream.num_annotated,
+                         stream.num_workbooks - stream.num_annotated )
+
+    if get_queue().num_questions() > 0:
+        get_queue().save()
+        if get_queue().num_open() > 0:
+            summary_logger.warning( "%d questions left open; answer them in %s, and re-run " +
+                                    "with --answers", get_queue().num_open(), questions_path )
+        else:
+            summary_logger.info( "%d answered questions written to %s",
+                                 get_queue().num_questions(), questions_path )
+
+    results_sink.close()
+
+    profiler.phase( "summary" )
+
+    if args.memprofile is not None:
+        profiler.save( get_abs_path( args.memprofile ) )
+        summary_logger.info( "Memory profile saved to %s", args.memprofile )
 
-    for roster in rosters:
-        make_annotated_checklist( roster, annotated_checklists_dir )
+    # The run is only successful if every checklist was checked
+    if stream.num_duplicates > 0:
+        sys.exit( 1 )
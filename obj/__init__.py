@@ -5,4 +5,6 @@ import obj.class_records_obj
 import obj.coordinates_obj
 import obj.grades_obj
 import obj.checklist_obj
+import obj.checklist_cache
 import obj.roster_obj
+import obj.checklist_sources
@@ -0,0 +1,217 @@
+"""
+#=====================================================================
+# checklist_cache.py
+#=====================================================================
+# A cache of the data parsed from checklists, keyed by the contents of
+# each checklist's file, so that unchanged checklists aren't re-read
+# on every run
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from obj.checklist_obj import Checklist, CheckoffCells, ReqCells, student_attr_labels
+from obj.checklist_obj import read_checklist_data
+from obj.coordinates_obj import Coordinates
+import exceptions as excp
+
+# Changed whenever the checklist parser would extract different data
+# from the same file, to invalidate the cached records
+CHECKLIST_PARSER_VERSION = 1
+
+# A checklist's parsed data, as stored in the cache
+ChecklistRecord = Dict[ str, Any ]
+
+def file_digest( path: str ) -> str:
+    """Returns the SHA-256 digest of a file's contents"""
+
+    sha = hashlib.sha256()
+    with open( path, "rb" ) as digest_file:
+        for chunk in iter( lambda: digest_file.read( 1 << 16 ), b"" ):
+            sha.update( chunk )
+    return sha.hexdigest()
+
+#---------------------------------------------------------------------
+# Records
+#---------------------------------------------------------------------
+# A record holds the raw cells that the Checklist's properties are
+# derived from:
+#
+#  - attrs: The student attributes, as [ label, cells right, value ],
+#           with a value of null for labels not found exactly once
+#           (along with the number of times it was found)
+#
+#  - reqs: The requirement entries, as
+#          [ y, x, req, course, credits, term, grade, category ]
+#
+#  - checkoffs: The checkoff entries, as [ y, x, req, course ]
+
+def checklist_record( checklist: Checklist ) -> ChecklistRecord:
+    """
+    Extracts the record of a checklist. Any error in finding its entries
+    is raised, so only checklists that parse are cached
+    """
+
+    attrs: List[ List[Any] ] = []
+    for label, num_right in student_attr_labels:
+        try:
+            attrs.append( [ label, num_right, checklist.get_student_attr( label, num_right ) ] )
+        except excp.checklist_exceptions.MultipleAttributeError as err:
+            attrs.append( [ label, num_right, None, err.num ] )
+
+    return {
+        "version"   : CHECKLIST_PARSER_VERSION,
+        "attrs"     : attrs,
+        "reqs"      : [ [ coord.y, coord.x, *cells ] for coord, *cells in checklist.req_cells() ],
+        "checkoffs" : [ [ coord.y, coord.x, *cells ]
+                        for coord, *cells in checklist.checkoff_cells() ]
+    }
+
+class CachedChecklist( Checklist ):
+    """
+    A checklist whose properties are derived from a cached record, rather
+    than from the spreadsheet. If anything not in the record is needed
+    (such as looking up an arbitrary cell), the spreadsheet is read then
+
+    Attributes:
+
+     - filepath: The filepath that the data was sourced from (str)
+
+     - sheet, member: Always None, as only whole files are cached (None)
+
+     - record: The checklist's cached record (dict)
+
+     - _attrs: The student attributes in the record, keyed by their
+               label and number of cells right of it (dict mapping
+               tuple of (str, int) to list)
+
+     - _data: The 2D array taken from the checklist spreadsheet, once it's
+              read (list of lists of str, or None)
+
+     - layout: Always None, as only cells not in the record are searched
+               for (None)
+    """
+
+    def __init__( self, file_path: str, record: ChecklistRecord ): # pylint: disable=super-init-not-called
+        self.filepath = file_path
+        self.sheet    = None
+        self.member   = None
+        self.record   = record
+        self._attrs: Dict[ Tuple[ str, int ], List[Any] ] = {
+            ( attr[0], attr[1] ): attr for attr in record[ "attrs" ] }
+        self._data: Optional[ List[ List[Any] ] ] = None # type: ignore[assignment]
+        self.layout = None
+
+    @property
+    def data( self ) -> List[ List[Any] ]:
+        """Gets the 2D array taken from the checklist spreadsheet, reading it if needed"""
+
+        if self._data is None:
+            self._data = read_checklist_data( self.filepath )
+        return self._data
+
+    def get_student_attr( self, val: str, num_right: int, case_insensitive: bool = True ) -> str:
+        """Gets a student attribute from the record, if it's there"""
+
+        attr = self._attrs.get( ( val, num_right ) )
+        if ( attr is None ) or not case_insensitive:
+            return super().get_student_attr( val, num_right, case_insensitive )
+
+        if attr[2] is None:
+            raise excp.checklist_exceptions.MultipleAttributeError( val, attr[3] )
+        return str( attr[2] )
+
+    def req_cells( self ) -> List[ReqCells]:
+        """Gets the raw cells of the requirement entries, from the record"""
+
+        return [ ( Coordinates( y, x ), req, course, cred, term, grade, cat )
+                 for y, x, req, course, cred, term, grade, cat in self.record[ "reqs" ] ]
+
+    def checkoff_cells( self ) -> List[CheckoffCells]:
+        """Gets the raw cells of the checkoff entries, from the record"""
+
+        return [ ( Coordinates( y, x ), req, course )
+                 for y, x, req, course in self.record[ "checkoffs" ] ]
+
+#---------------------------------------------------------------------
+# ChecklistCache Object
+#---------------------------------------------------------------------
+
+class ChecklistCache:
+    """
+    A directory of checklist records, one per checklist file contents
+    (named by the SHA-256 digest of the file). Records from a different
+    version of the parser are ignored, and replaced
+
+    Attributes:
+
+     - cache_dir: The directory of records (str)
+
+     - hits: The number of checklists loaded from the cache (int)
+
+     - misses: The number of checklists that had to be parsed (int)
+    """
+
+    def __init__( self, cache_dir: str ) -> None:
+        self.cache_dir = cache_dir
+        self.hits      = 0
+        self.misses    = 0
+
+        os.makedirs( cache_dir, exist_ok = True )
+
+    def __str__( self ) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+    def record_path( self, digest: str ) -> str:
+        """Returns the path of the record for a file with the given digest"""
+        return os.path.join( self.cache_dir, f"{digest}.json" )
+
+    def _read_record( self, digest: str ) -> Optional[ChecklistRecord]:
+        """Returns the cached record for the digest, if there's a valid one"""
+
+        try:
+            with open( self.record_path( digest ), "r", encoding = "utf-8" ) as record_file:
+                record = json.load( record_file )
+        except ( OSError, ValueError ): # Missing, or partially written
+            return None
+
+        if not isinstance( record, dict ) or record.get( "version" ) != CHECKLIST_PARSER_VERSION:
+            return None
+        return record
+
+    def _write_record( self, digest: str, record: ChecklistRecord ) -> None:
+        """
+        Caches a record, writing it to a temporary file first so that a
+        partially-written record is never read
+        """
+
+        tmp_path = self.record_path( digest ) + ".tmp"
+        with open( tmp_path, "w", encoding = "utf-8" ) as record_file:
+            json.dump( record, record_file, separators = ( ",", ":" ) )
+        os.replace( tmp_path, self.record_path( digest ) )
+
+    def load( self, file_path: str ) -> Checklist:
+        """
+        Returns the Checklist for the given file; from its cached record
+        if there is one, or otherwise by parsing it (and caching the
+        record)
+        """
+
+        if not file_path.endswith( ".xlsx" ):
+            raise excp.checklist_exceptions.UnsupportedFileTypeError( file_path )
+
+        digest = file_digest( file_path )
+        record = self._read_record( digest )
+        if record is not None:
+            self.hits += 1
+            return CachedChecklist( file_path, record )
+
+        self.misses += 1
+        checklist = Checklist( file_path )
+        self._write_record( digest, checklist_record( checklist ) )
+        return checklist
@@ -11,8 +11,9 @@
 # Date: December 2nd, 2023
 """
 
-from typing import List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 import datetime
+import math
 
 import pandas as pd
 from dateutil import parser
@@ -21,6 +22,152 @@ from obj.roster_entry_obj import RosterEntry, ReqEntry, CheckoffEntry, req_types
 from obj.coordinates_obj import Coordinates
 import exceptions as excp
 
+# The raw cells of a requirement entry:
+# ( coordinates, req, course, credits, term, grade, category )
+ReqCells = Tuple[ Coordinates, str, str, str, str, str, str ]
+
+# The raw cells of a checkoff entry: ( coordinates, req, course )
+CheckoffCells = Tuple[ Coordinates, str, str ]
+
+# The labels of the student attributes, and how many cells to the right
+# of the label each attribute is
+student_attr_labels: List[ Tuple[ str, int ] ] = [
+    ( "First Name:",              1 ),
+    ( "Last Name:",               1 ),
+    ( "NetID:",                   1 ),
+    ( "CUID:",                    1 ),
+    ( "Advisor:",                 1 ),
+    ( "Student Initials",         3 ),
+    ( "Expected Graduation Term", 3 )
+]
+
+def read_checklist_data( file_path: str ) -> List[ List[Any] ]:
+    """Reads the cells of a checklist spreadsheet, as a 2D array"""
+
+    if file_path.endswith( ".xlsx" ):
+        dataframe = pd.read_excel( file_path, skiprows = None, header = None )
+
+    # Don't currently support CSVs - we want to have annotated versions at the end
+
+    # elif file_path.endswith( ".csv" ):
+    #     dataframe = pd.read_csv( file_path )
+
+    else:
+        raise excp.checklist_exceptions.UnsupportedFileTypeError( file_path )
+
+    return dataframe_data( dataframe )
+
+def dataframe_data( dataframe: pd.DataFrame ) -> List[ List[Any] ]:
+    """Returns the cells of a sheet read by pandas, as a 2D array"""
+    return cast( List[ List[Any] ], ( dataframe.to_numpy() ).tolist() )
+
+#---------------------------------------------------------------------
+# Template Layouts
+#---------------------------------------------------------------------
+# Students all fill in the same checklist template, so rather than
+# searching the whole sheet for every label, we learn where the labels
+# are from the first checklist with a given layout, and reuse their
+# coordinates for later checklists with the same layout
+
+# The labels whose coordinates are fixed by the template
+layout_labels: List[str] = [ label for label, _ in student_attr_labels ] + \
+                           [ "Adv. Programming", "Tech. Writing" ]
+
+def cell_has( data_value: Any, val: str, case_insensitive: bool = True ) -> bool:
+    """Returns whether a cell has val (str) as a substring"""
+
+    return ( (                      ( val         in str( data_value )           ) ) or
+             ( case_insensitive and ( val.lower() in str( data_value ).lower() ) ) )
+
+def is_req_label( data_value: Any ) -> bool:
+    """Returns whether a cell would be found as a requirement label"""
+    return any( cell_has( data_value, req_type ) for req_type in req_types )
+
+def is_blank( data_value: Any ) -> bool:
+    """Returns whether a cell is empty (read by pandas as NaN)"""
+    return isinstance( data_value, float ) and math.isnan( data_value )
+
+class ChecklistLayout:
+    """
+    The layout of a checklist template, learned from a full search of a
+    checklist that uses it
+
+    Attributes:
+
+     - shape: The number of rows and columns in the sheet (tuple of int)
+
+     - label_coords: The coordinates of each of the layout_labels that
+                     was found exactly once (dict mapping str to
+                     Coordinates)
+
+     - label_columns: The columns that requirement labels were found in
+                      (list of int)
+
+     - signature: The template's text in the label columns; every cell
+                  that isn't blank or a requirement label (tuple of
+                  tuples of (int (row), int (column), str))
+    """
+
+    def __init__( self, checklist: "Checklist" ) -> None:
+        data = checklist.data
+
+        self.shape         = ( len( data ), len( data[0] ) if data else 0 )
+        self.label_coords: Dict[ str, Coordinates ] = {}
+        self.label_columns = sorted( { coord.x for coord in
+                                       checklist.find_cell_multival( req_types ) } )
+        self.signature     = self.column_signature( data )
+
+        # Only labels found exactly once are learned, as matches() only
+        # checks that they're still there; the rest (such as a label
+        # that was edited or repeated) are searched for in full in every
+        # checklist with this layout
+        for label in layout_labels:
+            coords = checklist.find_cell( label )
+            if len( coords ) == 1:
+                self.label_coords[ label ] = coords[0]
+
+    def column_signature( self, data: List[ List[Any] ] ) -> Tuple[ Tuple[ int, int, str ], ... ]:
+        """Returns the template's text in the label columns of a sheet"""
+
+        return tuple( ( row_idx, column_idx, str( row[ column_idx ] ) )
+                      for column_idx in self.label_columns
+                      for row_idx, row in enumerate( data )
+                      if not is_blank( row[ column_idx ] ) and
+                         not is_req_label( row[ column_idx ] ) )
+
+    def matches( self, data: List[ List[Any] ] ) -> bool:
+        """
+        Returns whether a sheet has this layout; the same shape, the same
+        template text in the label columns, and the labels where they
+        were found before
+        """
+
+        if ( len( data ), len( data[0] ) if data else 0 ) != self.shape:
+            return False
+
+        for label, coord in self.label_coords.items():
+            if not cell_has( data[ coord.y ][ coord.x ], label ):
+                return False
+
+        return self.column_signature( data ) == self.signature
+
+# The layouts seen so far in this run
+known_layouts: List[ChecklistLayout] = []
+
+def checklist_layout( checklist: "Checklist" ) -> ChecklistLayout:
+    """
+    Returns the layout of the checklist; a known one if it matches, or
+    otherwise one learned from the checklist
+    """
+
+    for layout in known_layouts:
+        if layout.matches( checklist.data ):
+            return layout
+
+    layout = ChecklistLayout( checklist )
+    known_layouts.append( layout )
+    return layout
+
 #---------------------------------------------------------------------
 # Checklist Object
 #---------------------------------------------------------------------
@@ -38,9 +185,19 @@ class Checklist:
 
      - filepath: The filepath that the data was sourced from (str)
 
+     - sheet: The sheet of the workbook that the data was sourced from,
+              or None for the first sheet (str or None)
+
+     - member: The workbook in a zip file that the data was sourced
+               from, or None if filepath is the workbook (str or None)
+
      - _data: The 2D array taken from the checklist spreadsheet
               (list of lists of str)
 
+     - layout: The layout of the checklist's template, used to find its
+               labels without searching the whole sheet
+               (ChecklistLayout, or None to always search)
+
     Properties (dynamically derived):
 
      - first_name: First name of the student (str)
@@ -74,59 +231,67 @@ class Checklist:
     support these properties for access by other code, to ensure compatibility
     """
 
-    def __init__( self, file_path: str ):
+    def __init__( self, file_path: str, sheet: Optional[str] = None, member: Optional[str] = None,
+                  data: Optional[ List[ List[Any] ] ] = None ):
         """
         Initializes the Checklist data, based off of the given file path
+        (or the given data, if it was already read from the file)
         """
         self.filepath = file_path
+        self.sheet    = sheet
+        self.member   = member
+        self._data    = data if data is not None else read_checklist_data( file_path )
+        self.layout: Optional[ChecklistLayout] = None
+        self.layout = checklist_layout( self )
 
-        if file_path.endswith( ".xlsx" ):
-            dataframe = pd.read_excel( file_path, skiprows = None, header = None )
-
-        # Don't currently support CSVs - we want to have annotated versions at the end
-
-        # elif file_path.endswith( ".csv" ):
-        #     dataframe = pd.read_csv( file_path )
-
-        else:
-            raise excp.checklist_exceptions.UnsupportedFileTypeError( file_path )
-
-        self._data = ( dataframe.to_numpy() ).tolist()
+    @property
+    def data( self ) -> List[ List[Any] ]:
+        """Gets the 2D array taken from the checklist spreadsheet"""
+        return self._data
 
-    def find_cell( self, val: str, case_insensitive: bool = True ) -> List[Coordinates]:
+    def find_cell( self, val: str, case_insensitive: bool = True,
+                   columns: Optional[ List[int] ] = None ) -> List[Coordinates]:
         """
         Returns a list of Coordinates of cells with val (str) as a substring
-        (returns a list of Coordinates)
+        (returns a list of Coordinates), optionally only in the given columns
         """
 
         result = []
 
-        for row_idx, row in enumerate( self._data ):
-            for column_idx, data_value in enumerate( row ):
-                if (                        ( val         in str( data_value )           ) or
-                     ( case_insensitive and ( val.lower() in str( data_value ).lower() ) ) ):
-
+        for row_idx, row in enumerate( self.data ):
+            for column_idx in ( columns if columns is not None else range( len( row ) ) ):
+                if cell_has( row[ column_idx ], val, case_insensitive ):
                     result.append( Coordinates( row_idx, column_idx ) )
 
         return result
 
-    def find_cell_multival( self, vals: Set[str],
-                            case_insensitive: bool = True ) -> List[Coordinates]:
+    def find_cell_multival( self, vals: Set[str], case_insensitive: bool = True,
+                            columns: Optional[ List[int] ] = None ) -> List[Coordinates]:
         """
         Returns a list of Coordinates of cells with any string in vals as a substring
         """
         result = []
         for val in vals:
-            result += self.find_cell( val, case_insensitive )
+            result += self.find_cell( val, case_insensitive, columns )
         return result
 
+    def find_label( self, val: str, case_insensitive: bool = True ) -> List[Coordinates]:
+        """
+        Returns a list of Coordinates of cells with the label val (str) as a
+        substring; from the layout for labels fixed by the template
+        """
+
+        if case_insensitive and ( self.layout is not None ) and ( val in self.layout.label_coords ):
+            return [ self.layout.label_coords[ val ] ]
+        return self.find_cell( val, case_insensitive )
+
 
     def get_cell( self, coord: Coordinates ) -> str:
         """
         Returns the value of the cell (str) at the given coordinates
         """
 
-        return str( self._data[ coord.y ][ coord.x ] )
+        return str( self.data[ coord.y ][ coord.x ] )
 
     #---------------------------------------------------------------------
     # Dynamic Properties - Student Attributes
@@ -135,7 +300,7 @@ class Checklist:
     def get_student_attr( self, val: str, num_right: int, case_insensitive: bool = True ) -> str:
         """Gets an attribute next to the given label (val) a given number of spaces away"""
 
-        val_label = self.find_cell( val, case_insensitive )
+        val_label = self.find_label( val, case_insensitive )
         if len( val_label ) != 1:
             raise excp.checklist_exceptions.MultipleAttributeError( val, len( val_label ) )
 
@@ -197,14 +362,15 @@ class Checklist:
     # Dynamic Properties - Roster Entries
     #---------------------------------------------------------------------
 
-    @property
-    def req_entries( self ) -> List[ReqEntry]:
-        """Gets the requirement entries in the checklist"""
+    def req_cells( self ) -> List[ReqCells]:
+        """Gets the raw cells of the requirement entries in the checklist"""
 
-        req_entries: List[ReqEntry] = []
+        req_cells: List[ReqCells] = []
 
         # Get requirements
-        entry_coords = self.find_cell_multival( req_types )
+        # Requirement labels are only in the layout's label columns
+        entry_coords = self.find_cell_multival(
+            req_types, columns = self.layout.label_columns if self.layout is not None else None )
 
         for coord in entry_coords:
             req    = self.get_cell( coord )
@@ -218,30 +384,34 @@ class Checklist:
             else:
                 cat = ""
 
-            req_entries.append( ReqEntry( req, course, coord, cred, term, grade, cat ) )
+            req_cells.append( ( coord, req, course, cred, term, grade, cat ) )
 
-        return req_entries
+        return req_cells
 
-    @property
-    def checkoff_entries( self ) -> List[CheckoffEntry]:
-        """Gets the checkoff entries in the checklist"""
+    def checkoff_cells( self ) -> List[CheckoffCells]:
+        """Gets the raw cells of the checkoff entries in the checklist"""
 
-        checkoff_entries: List[CheckoffEntry] = []
+        advprog_coord  = self.find_label( "Adv. Programming" )[ 0 ]
+        techwrit_coord = self.find_label( "Tech. Writing" )[ 0 ]
 
-        # Get checkoffs
+        return [ ( advprog_coord,  "ADV. PROGRAMMING",
+                   self.get_student_attr( "Adv. Programming", 2 ) ),
+                 ( techwrit_coord, "TECH. WRITING",
+                   self.get_student_attr( "Tech. Writing"   , 2 ) ) ]
 
-        advprog_coord  = self.find_cell( "Adv. Programming" )[ 0 ]
-        techwrit_coord = self.find_cell( "Tech. Writing" )[ 0 ]
+    @property
+    def req_entries( self ) -> List[ReqEntry]:
+        """Gets the requirement entries in the checklist"""
 
-        checkoff_entries.append( CheckoffEntry( "ADV. PROGRAMMING",
-                                                self.get_student_attr( "Adv. Programming", 2 ),
-                                                advprog_coord ) )
+        return [ ReqEntry( req, course, coord, cred, term, grade, cat )
+                 for coord, req, course, cred, term, grade, cat in self.req_cells() ]
 
-        checkoff_entries.append( CheckoffEntry( "TECH. WRITING",
-                                                self.get_student_attr( "Tech. Writing"   , 2 ),
-                                                techwrit_coord ) )
+    @property
+    def checkoff_entries( self ) -> List[CheckoffEntry]:
+        """Gets the checkoff entries in the checklist"""
 
-        return checkoff_entries
+        return [ CheckoffEntry( req, course, coord )
+                 for coord, req, course in self.checkoff_cells() ]
 
     @property
     def entries( self ) -> List[RosterEntry]:
@@ -0,0 +1,183 @@
+"""
+#=====================================================================
+# checklist_sources.py
+#=====================================================================
+# Reading checklists from the files they're given in; a workbook per
+# student, a workbook with a sheet per student, or a zip file of
+# workbooks
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import glob
+import io
+import os
+import zipfile
+from typing import IO, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from obj.checklist_obj import Checklist, dataframe_data
+from obj.checklist_cache import ChecklistCache
+from obj.roster_obj import Roster
+import exceptions as excp
+
+#---------------------------------------------------------------------
+# Workbooks
+#---------------------------------------------------------------------
+
+def workbook_members( zip_path: str ) -> List[str]:
+    """Returns the workbooks in a zip file, in order of their names"""
+
+    with zipfile.ZipFile( zip_path ) as zip_file:
+        return sorted( name for name in zip_file.namelist()
+                       if name.endswith( ".xlsx" ) and not name.startswith( "__MACOSX/" ) )
+
+def read_workbook( file_path: str, member: Optional[str] = None ) -> Union[ str, IO[bytes] ]:
+    """
+    Returns something pandas can read a workbook from; the path of the
+    workbook, or the contents of a workbook in a zip file
+    """
+
+    if member is None:
+        return file_path
+    with zipfile.ZipFile( file_path ) as zip_file:
+        return io.BytesIO( zip_file.read( member ) )
+
+def workbook_checklists( file_path: str, member: Optional[str] = None,
+                         per_sheet: bool = False ) -> Iterator[Checklist]:
+    """
+    Yields the checklists in a workbook; one for every sheet if per_sheet
+    is set, or otherwise one for the first sheet. The workbook is opened
+    once in pandas' read-only mode, and each sheet's rows are streamed
+    from it as the sheet's checklist is needed, so only one sheet is
+    held in memory at a time
+    """
+
+    with pd.ExcelFile( read_workbook( file_path, member ), engine = "openpyxl" ) as workbook:
+        sheet_names = [ str( name ) for name in workbook.sheet_names ]
+
+        for sheet in ( sheet_names if per_sheet else sheet_names[ :1 ] ):
+            data = dataframe_data( workbook.parse( sheet, header = None ) )
+            yield Checklist( file_path, sheet = sheet if per_sheet else None, member = member,
+                             data = data )
+
+#---------------------------------------------------------------------
+# Checklist Files
+#---------------------------------------------------------------------
+
+def is_checklist_file( file_name: str ) -> bool:
+    """
+    Returns whether a file in a directory of checklists should be read
+    (skipping hidden files and Excel's lock files)
+    """
+
+    return ( file_name.endswith( ( ".xlsx", ".zip" ) ) and
+             not file_name.startswith( ( ".", "~$" ) ) )
+
+def checklist_files( paths: Iterable[str], directory: Optional[str] = None ) -> Iterator[str]:
+    """
+    Yields the files to read checklists from; each of the given paths
+    (with glob patterns, such as "cohort/*.xlsx", expanded in order of
+    name), followed by the checklist files in the given directory (in
+    order of name)
+    """
+
+    for path in paths:
+        if glob.has_magic( path ):
+            yield from sorted( glob.glob( path ) )
+        else:
+            yield path
+
+    if directory is not None:
+        yield from sorted( os.path.join( directory, file_name )
+                           for file_name in os.listdir( directory )
+                           if is_checklist_file( file_name ) )
+
+#---------------------------------------------------------------------
+# Checklist Sources
+#---------------------------------------------------------------------
+
+def iter_checklists( file_path: str, per_sheet: bool = False,
+                     cache: Optional[ChecklistCache] = None ) -> Iterator[Checklist]:
+    """
+    Yields the checklists in the given file:
+
+     - for a zip file, the checklists in each of its workbooks
+
+     - for a workbook with per_sheet set, the checklist in each of its
+       sheets
+
+     - otherwise, the checklist in the workbook's first sheet (loaded
+       through the cache, if one is given)
+    """
+
+    if file_path.endswith( ".zip" ):
+        for member in workbook_members( file_path ):
+            yield from workbook_checklists( file_path, member, per_sheet )
+
+    elif not file_path.endswith( ".xlsx" ):
+        raise excp.checklist_exceptions.UnsupportedFileTypeError( file_path )
+
+    elif per_sheet:
+        yield from workbook_checklists( file_path, per_sheet = True )
+
+    elif cache is not None:
+        yield cache.load( file_path )
+
+    else:
+        yield Checklist( file_path )
+
+def source_name( source: Union[ Checklist, Roster ] ) -> str:
+    """
+    Describes where a checklist (or the Roster from it) is from, relative
+    to the working directory, for messages
+    """
+
+    name = os.path.relpath( source.filepath )
+    if source.member is not None:
+        name += f":{source.member}"
+    if source.sheet is not None:
+        name += f" [{source.sheet}]"
+    return name
+
+def checklist_windows( file_paths: Iterable[str], window: int, per_sheet: bool = False,
+                       cache: Optional[ChecklistCache] = None ) -> Iterator[ List[Checklist] ]:
+    """
+    Yields the checklists in the given files a window of (at least)
+    the given number at a time, reading each window's checklists only
+    as it's needed. Windows only end between workbooks, so that all of
+    a workbook's checklists are in the same window (a workbook with more
+    checklists than the window makes a larger one)
+    """
+
+    checklists: List[Checklist] = []
+    last_workbook = None
+
+    for file_path in file_paths:
+        for checklist in iter_checklists( file_path, per_sheet, cache ):
+            workbook = ( checklist.filepath, checklist.member )
+            if ( len( checklists ) >= window ) and ( workbook != last_workbook ):
+                yield checklists
+                checklists = []
+
+            checklists.append( checklist )
+            last_workbook = workbook
+
+    if len( checklists ) > 0:
+        yield checklists
+
+def find_netid( file_paths: Iterable[str], netid: str, per_sheet: bool = False,
+                cache: Optional[ChecklistCache] = None ) -> Optional[str]:
+    """
+    Returns where the first checklist in the given files for the given
+    student is from (or None if there isn't one), for reporting a
+    duplicate without keeping the source of every checklist read
+    """
+
+    for file_path in file_paths:
+        for checklist in iter_checklists( file_path, per_sheet, cache ):
+            if checklist.netid == netid:
+                return source_name( checklist )
+    return None
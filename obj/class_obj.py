@@ -8,9 +8,10 @@
 # Date: October 2nd, 2023
 """
 
-from typing import Optional, Set, Any
+from typing import Any, FrozenSet, Optional, Set
 
 from api import class_api
+from api.course_attrs import CourseAttrs
 from obj.sections_obj import get_section
 import ui
 import exceptions as excp
@@ -35,10 +36,12 @@ class Class:
 
      - titleLong: The title of the class (long version) (str)
 
-     - all_names: All names that the class goes by (set of str)
+     - all_names: All names that the class goes by (frozenset of str)
 
-     * all_departments: Other departments that the class is listed in
-       (set of str)
+     * all_departments: All departments that the class is listed in
+       (frozenset of str)
+
+     - level: The course number as an int, if numeric (int or None)
 
      * other_names: All names that the class goes by (set of str)
 
@@ -68,7 +71,17 @@ class Class:
      - term_sourced: The term from which information was sourced (if
                      possible, the same as term_taken)
 
+     - num_enrl_groups: The number of enroll groups the class has
+                        during term_sourced (int)
+
      - _enrl_idx: The index of the enrolled section (if only 1, set to 0)
+
+     - _departments: The departments backing all_departments
+                     (frozenset of str)
+
+    The attributes are read from the record precomputed when the API
+    data was cached (see api/course_attrs.py), rather than from the
+    JSON data itself
     """
 
     def __init__( self, course_name: str, term_opt: Optional[str] = None,
@@ -86,144 +99,91 @@ class Class:
         course_name = ui.parser.parse_class_name( course_name )
 
         if term_opt is None:
-            term = ui.user.prompt_term( course_name )
+            term = ui.ambiguities.ask_term( course_name )
         else:
             term = ui.parser.parse_class_term( term_opt )
 
         self.primary_name = course_name
         self.term_taken   = term
 
-        # Grab the data for the course
-        try:
-            json_object = class_api.get_class( course_name, term, ping_source = ping_source )
-            self.term_sourced = term
-
-        except excp.api_exceptions.TermNotFoundError as e:
-            if class_api.in_future( term ): # Find the next best term
-                json_object, self.term_sourced = class_api.most_recent_term( course_name, term )
-            else: # Not in the future, we just don't have info on it
-                raise e
-
-        self.set__enrl_idx   ( json_object, netid )
-
-        self.set_all_names   ( json_object )
-        self.set_title       ( json_object )
-        self.set_titleLong   ( json_object )
-        self.set_catalogDistr( json_object )
-        self.set_acadGroup   ( json_object )
-        self.set_acadCareer  ( json_object )
-        self.set_credits     ( json_object )
-        self.set_is_FWS      ( json_object )
-        self.set_is_CDE      ( json_object )
+        # Grab the (precomputed) data for the course
+        attrs, self.term_sourced = class_api.offering_attrs( course_name, term,
+                                                             ping_source = ping_source )
+
+        self.set__enrl_idx( attrs, netid )
+        self.set_from_attrs( attrs )
+
+    @classmethod
+    def from_attrs( cls, attrs: CourseAttrs, term: str, enrl_idx: int = 0 ) -> 'Class':
+        """
+        Creates a Class directly from a precomputed attribute record, for
+        the given enroll group (without needing a student's section)
+        """
+
+        class_obj = cls.__new__( cls )
+        class_obj.primary_name    = attrs.primary_name
+        class_obj.term_taken      = ui.parser.parse_class_term( term )
+        class_obj.term_sourced    = class_obj.term_taken
+        class_obj.num_enrl_groups = len( attrs.groups )
+        class_obj._enrl_idx       = enrl_idx
+        class_obj.set_from_attrs( attrs )
+        return class_obj
 
     #---------------------------------------------------------------------
     # Attribute setters
     #---------------------------------------------------------------------
 
-    def set__enrl_idx( self, json_obj: dict, netid: str ) -> None:
+    def set_from_attrs( self, attrs: CourseAttrs ) -> None:
+        """Sets the class' attributes from the record for its enroll group"""
+
+        group = attrs.groups[ self._enrl_idx ]
+
+        self.all_names    = group.names
+        self._departments = group.depts
+        self.level        = attrs.level
+        self.title        = attrs.title
+        self.titleLong    = attrs.titleLong
+        self.catalogDistr = list( attrs.distributions )
+        self.acadGroup    = attrs.acadGroup
+        self.acadCareer   = attrs.acadCareer
+        self.min_credits  = group.min_credits
+        self.max_credits  = group.max_credits
+        self.is_FWS       = group.is_FWS
+        self.is_CDE       = attrs.is_CDE
+
+    def set__enrl_idx( self, attrs: CourseAttrs, netid: str ) -> None:
         """Sets the section that we're looking at"""
 
-        if len( json_obj[ "enrollGroups" ] ) == 1: # Only one option
+        self.num_enrl_groups = len( attrs.groups )
+
+        if self.num_enrl_groups == 1: # Only one option
             self._enrl_idx = 0
             return
 
-        if get_section( netid, self.term_taken, self.primary_name ) != "":
-            # Use the recorded section
-            enrl_idx = 0
-            sections_found = []
-            section_taken = get_section( netid, self.term_taken, self.primary_name )
+        section_taken = get_section( netid, self.term_taken, self.primary_name )
+        if section_taken != "":
+            # Use the recorded section, from the offering's index of them
+            enrl_idx = attrs.section_groups.get( section_taken )
 
-            for group in json_obj[ "enrollGroups" ]:
-                for section in group["classSections"]:
-                    sections_found.append( section["section"] )
-                    if section["section"] == section_taken:
-                        self._enrl_idx = enrl_idx
-                        return
-                enrl_idx += 1
+            if enrl_idx is None:
+                # Have a non-null section, but couldn't find in records
+                raise excp.class_exceptions.SectionNotFoundError( self.primary_name,
+                                                                  self.term_taken,
+                                                                  section_taken, attrs.sections )
 
-            # Have a non-null section, but couldn't find in records
-            raise excp.class_exceptions.SectionNotFoundError( self.primary_name, self.term_taken,
-                                                              section_taken, sections_found )
+            self._enrl_idx = enrl_idx
+            return
 
-        # Otherwise, we need to prompt the user to choose
-        prompt_msg = f"Looks like {self.primary_name} ({self.term_taken}) has multiple " + \
-                      "sections - which one did you take?"
+        # Otherwise, we need to ask the user to choose (or in batch mode,
+        # provisionally use the first)
 
         # Use first section to identify enroll group
-        options = [ x["classSections"][0]["section"] for x in json_obj[ "enrollGroups" ] ]
-        sel_option = ui.user.prompt_usr_list( prompt_msg, options, 0 )
+        options = [ group.sections[0] for group in attrs.groups ]
+        names = sorted( set().union( *( group.names for group in attrs.groups ) ) )
+        sel_option = ui.ambiguities.ask_section( netid, self.primary_name, self.term_taken,
+                                                 names, options )
         self._enrl_idx = options.index( sel_option )
 
-    def set_all_names( self, json_obj: dict ) -> None:
-        """Gets the crosslisted names for the class"""
-
-        all_names = { self.primary_name }
-        for crosslist in json_obj[ "enrollGroups" ][ self._enrl_idx ][ "simpleCombinations" ]:
-            other_name = f"{crosslist[ 'subject' ]} {crosslist[ 'catalogNbr' ]}"
-            all_names.add( other_name )
-        self.all_names = all_names
-
-    def set_title( self, json_obj: dict ) -> None:
-        """Sets the title of the class"""
-
-        self.title = json_obj[ "titleShort" ]
-
-    def set_titleLong( self, json_obj: dict ) -> None:
-        """Sets the long title of the class"""
-
-        self.titleLong = json_obj[ "titleLong" ]
-
-    def set_catalogDistr( self, json_obj: dict ) -> None:
-        """Sets the distribution of the class"""
-
-        distr_string = json_obj[ "catalogDistr" ]
-        distr_string = distr_string.strip( "()" ) # Strip off parenthesis
-        self.catalogDistr = distr_string.split( ", " )
-
-    def set_acadGroup( self, json_obj: dict ) -> None:
-        """Sets the academic group of the class"""
-
-        self.acadGroup = json_obj[ "acadGroup" ]
-
-    def set_acadCareer( self, json_obj: dict ) -> None:
-        """Sets the class' affiliation"""
-
-        self.acadGroup = json_obj[ "acadCareer" ]
-
-    def set_is_FWS( self, json_obj: dict ) -> None:
-        """Sets whether the class is an FWS or not"""
-
-        if "FWS: " in json_obj[ "titleLong" ]:
-            self.is_FWS = True
-            return
-
-        if( ( "ENGL 2880" in self.all_names ) or ( "ENGL 2890" in self.all_names ) ):
-            self.is_FWS = True # Counts for FWS credit
-            return
-
-        self.is_FWS = False
-
-    def set_is_CDE( self, json_obj: dict ) -> None:
-        """Sets whether the class is a CDE or not"""
-
-        string_to_search = "Culminating design experience (CDE)".upper()
-
-        if string_to_search in json_obj[ "catalogComments" ].upper():
-            self.is_CDE = True
-            return
-
-        if string_to_search in json_obj[ "catalogPrereqCoreq" ].upper():
-            self.is_CDE = True
-            return
-
-        self.is_CDE = False
-
-    def set_credits( self, json_obj: dict ) -> None:
-        """Sets the number of credits the class was taken for"""
-
-        self.max_credits = float( json_obj[ "enrollGroups" ][ self._enrl_idx ][ "unitsMaximum" ] )
-        self.min_credits = float( json_obj[ "enrollGroups" ][ self._enrl_idx ][ "unitsMinimum" ] )
-
     #---------------------------------------------------------------------
     # Dynamic Properties
     #---------------------------------------------------------------------
@@ -241,18 +201,22 @@ class Class:
         return ui.parser.get_nbr_from_name( self.primary_name )
 
     @property
-    def all_departments( self ) -> Set[str]:
+    def enrl_idx( self ) -> int:
+        """Returns the index of the enroll group the class was taken in"""
+
+        return self._enrl_idx
+
+    @property
+    def all_departments( self ) -> FrozenSet[str]:
         """Returns all of the class' crosslisted departments"""
 
-        return { ui.parser.get_dept_from_name( i ) for i in self.all_names }
+        return self._departments
 
     @property
     def other_names( self ) -> Set[str]:
         """Returns all other names the class goes by (not including primary)"""
 
-        cpy_to_return = self.all_names.copy()
-        cpy_to_return.remove( self.primary_name )
-        return cpy_to_return
+        return set( self.all_names - { self.primary_name } )
 
     @property
     def other_departments( self ) -> Set[str]:
@@ -28,7 +28,7 @@ class ClassRecord:
 
      - class_name: Name of the class (str)
 
-     - term: Term the class was taken (str)
+     - term: Term the class was taken (Term)
 
      - cred_taken: Credits that the student took the class for (int)
 
@@ -37,6 +37,8 @@ class ClassRecord:
      - grade: Grade achieved in the class (str)
     """
 
+    __slots__ = ( "netid", "class_name", "term", "cred_taken", "cred_applied", "grade" )
+
     def __init__( self, netid: str, class_name: str, term: str, cred_taken: int, grade: str ):
         self.netid        = netid
         self.class_name   = class_name
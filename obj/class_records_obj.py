@@ -8,11 +8,89 @@
 # Date: December 4th, 2023
 """
 
+from typing import Dict, List, Tuple
+
 from obj.grades_obj import Grades
 from obj.class_record_obj import ClassRecord
 
 from exceptions.class_records_exceptions import RecordNotFoundError
 
+# A claim of credits from a class, as (class name, term, credits)
+CreditClaim = Tuple[ str, str, int ]
+
+#---------------------------------------------------------------------
+# CreditConflict Object
+#---------------------------------------------------------------------
+
+class CreditConflict:
+    """
+    A class whose claims together apply more credits than it was taken for
+
+    Attributes:
+
+     - netid: The student who took the class (str)
+
+     - class_name: Name of the class (str)
+
+     - term: Term the class was taken (str)
+
+     - num_taken: Credits that the class was taken for, less any already
+                  applied (int)
+
+     - num_claimed: Credits that the claims apply in total (int)
+
+     - claims: Indices of the claims for the class (list of int)
+    """
+
+    def __init__( self, netid: str, class_name: str, term: str, *, num_taken: int,
+                  num_claimed: int, claims: List[int] ):
+        self.netid       = netid
+        self.class_name  = class_name
+        self.term        = term
+        self.num_taken   = num_taken
+        self.num_claimed = num_claimed
+        self.claims      = claims
+
+    @property
+    def err_msg( self ) -> str:
+        """A description of the conflict"""
+
+        return f"Too many credits applied towards {self.class_name} in {self.term} " + \
+               f"for {self.netid} (Took the class for {self.num_taken}, attempted to " + \
+               f"apply {self.num_claimed} across {len( self.claims )} listing(s))"
+
+#---------------------------------------------------------------------
+# CreditAllocation Object
+#---------------------------------------------------------------------
+
+class CreditAllocation:
+    """
+    The result of allocating many credit claims at once
+
+    Attributes:
+
+     - allocated: The credits allocated to each claim from each record,
+                  empty if the claim couldn't be satisfied (list of list
+                  of (ClassRecord, int) tuples, parallel to the claims)
+
+     - missing: Indices of the claims for classes without a record
+                (list of int)
+
+     - conflicts: Classes whose claims couldn't all be satisfied
+                  (list of CreditConflict)
+    """
+
+    def __init__( self, num_claims: int ):
+        self.allocated: List[ List[ Tuple[ ClassRecord, int ] ] ] = \
+            [ [] for _ in range( num_claims ) ]
+        self.missing:   List[int]            = []
+        self.conflicts: List[CreditConflict] = []
+
+    def conflicts_by_claim( self ) -> Dict[ int, CreditConflict ]:
+        """Returns the conflict that each conflicting claim is part of"""
+
+        return { idx: conflict for conflict in self.conflicts for idx in conflict.claims }
+
 #---------------------------------------------------------------------
 # ClassRecords Object
 #---------------------------------------------------------------------
@@ -52,3 +130,70 @@ class ClassRecords:
             raise RecordNotFoundError( self.netid, class_name, term )
 
         correct_record.use_cred( num_cred )
+
+    def allocate_cred( self, claims: List[CreditClaim] ) -> CreditAllocation:
+        """
+        Allocates all of the given credit claims together, applying the
+        credits if every claim on a class can be satisfied
+
+        Claims are grouped by class and term; each group is a small flow
+        problem from the claims to the matching records (limited by their
+        remaining credits), where every claim can draw on every record.
+        The group has a valid split exactly when its total claim fits in
+        the records' total capacity, so the result doesn't depend on the
+        order of the claims, and all claims on an overdrawn class are
+        reported together
+        """
+
+        allocation = CreditAllocation( len( claims ) )
+
+        records_for: Dict[ Tuple[str, str], List[ClassRecord] ] = {}
+        for record in self.records:
+            records_for.setdefault( ( record.class_name, record.term ), [] ).append( record )
+
+        claims_for: Dict[ Tuple[str, str], List[int] ] = {}
+        for idx, ( class_name, term, _ ) in enumerate( claims ):
+            claims_for.setdefault( ( class_name, term ), [] ).append( idx )
+
+        for ( class_name, term ), claim_idxs in claims_for.items():
+            if ( class_name, term ) not in records_for:
+                allocation.missing.extend( claim_idxs )
+                continue
+
+            records     = records_for[ ( class_name, term ) ]
+            capacity    = sum( record.cred_taken - record.cred_applied for record in records )
+            num_claimed = sum( claims[ idx ][2] for idx in claim_idxs )
+
+            if num_claimed > capacity:
+                allocation.conflicts.append( CreditConflict( self.netid, class_name, term,
+                                                             num_taken = capacity,
+                                                             num_claimed = num_claimed,
+                                                             claims = claim_idxs ) )
+                continue
+
+            self._route( records, [ ( idx, claims[ idx ][2] ) for idx in claim_idxs ],
+                         allocation )
+
+        return allocation
+
+    @staticmethod
+    def _route( records: List[ClassRecord], amounts: List[ Tuple[ int, int ] ],
+                allocation: CreditAllocation ) -> None:
+        """
+        Routes each (claim index, credits) amount through the records with
+        credits remaining, recording the split in the allocation; the
+        records must have enough credits remaining for all amounts
+        """
+
+        record_iter = iter( records )
+        record      = next( record_iter )
+        for idx, to_allocate in amounts:
+            while to_allocate > 0:
+                remaining = record.cred_taken - record.cred_applied
+                if remaining == 0:
+                    record = next( record_iter )
+                    continue
+                num_cred = min( remaining, to_allocate )
+                record.cred_applied += num_cred
+                allocation.allocated[ idx ].append( ( record, num_cred ) )
+                to_allocate -= num_cred
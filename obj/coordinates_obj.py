@@ -33,6 +33,8 @@ class Coordinates:
        y
     """
 
+    __slots__ = ( "y", "x" )
+
     def __init__( self, y: int, x: int ):
         """Initializes the values"""
         self.y = y
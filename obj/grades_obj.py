@@ -9,8 +9,9 @@
 """
 
 import csv
-from typing import Optional, List, Dict, Union, Tuple, cast
+from typing import FrozenSet, Optional, List, Dict, Union, Tuple, cast
 
+from api import class_api
 import exceptions as excp
 from obj.class_record_obj import ClassRecord
 from obj.class_obj import Class
@@ -51,12 +52,20 @@ TERM_MAPPING: Dict[str, str] = {
     "winter" : "WI"
 }
 
-def term_str_convert( term_str: str ) -> str:
+# Registrar data repeats the same few verbose terms on every line, so
+# each one is only converted once
+_converted_terms: Dict[str, ui.parser.Term] = {}
+
+def term_str_convert( term_str: str ) -> ui.parser.Term:
     """
     Converts a verbose term string to the simplified version
     Ex. 'Spring 2023' => 'SP23'
     """
 
+    if term_str in _converted_terms:
+        return _converted_terms[ term_str ]
+
+    verbose_str = term_str
     term_str = term_str.strip()
 
     letters = "".join( [ x for x in term_str if x.isalpha() ] )
@@ -65,7 +74,9 @@ def term_str_convert( term_str: str ) -> str:
     season = TERM_MAPPING[ letters.lower() ]
     year   = digits[-2:] # Last two
 
-    return season + year
+    term = ui.parser.Term( season + year )
+    _converted_terms[ verbose_str ] = term
+    return term
 
 #---------------------------------------------------------------------
 # Grades Object
@@ -95,7 +106,7 @@ class Grades:
        }
 
         - student: The student's NetID (str)
-        - term: The term name (ex. 'FA23') (str)
+        - term: The term name (ex. 'FA23') (Term)
         - class: The class name (ex. 'ECE 2720') (str)
         - num_credits: The number of credits taken (int)
         - grade: The grade received (str)
@@ -188,14 +199,30 @@ class Grades:
         }
 
     def populate_aliases( self ) -> None:
-        """Populates class alias data based on API data"""
+        """
+        Populates class alias data based on API data
+
+        The names of each offering (by term and class) are looked up
+        once, and every student who took it is mapped through them. Only
+        offerings whose enroll groups are cross-listed differently need
+        the section a student took, and therefore a Class to resolve it
+        """
+
+        crosslist_index: Dict[ Tuple[ str, str ], Optional[ FrozenSet[str] ] ] = {}
 
         for netid, terms in self._grades.items():
             for term, classes in terms.items():
                 for class_str in classes:
-                    class_obj = Class( class_str, term, netid = netid )
+                    offering = ( term, class_str )
+                    if offering not in crosslist_index:
+                        attrs, _ = class_api.offering_attrs( class_str, term )
+                        crosslist_index[ offering ] = attrs.crosslist_names
+
+                    names = crosslist_index[ offering ]
+                    if names is None: # Depends on the section taken
+                        names = Class( class_str, term, netid = netid ).all_names
 
-                    for name in class_obj.all_names:
+                    for name in names:
                         self._aliases[ ( term, name ) ] = class_str
 
     def get_aliases( self ) -> Dict[ Tuple[ str, str ], str ]:
@@ -13,7 +13,7 @@
 # Date: December 2nd, 2023
 """
 
-from typing import Set, Dict
+from typing import Set, Dict, Tuple
 
 from obj.coordinates_obj import Coordinates
 from ui.parser import parse_class_name as pclass, \
@@ -30,6 +30,27 @@ WARNING   = 5
 VALID     = 0
 UNCHECKED = -1
 
+#---------------------------------------------------------------------
+# Packed Validity Representation
+#---------------------------------------------------------------------
+# Rather than a dictionary per entry, the validity of every component
+# is packed into a single integer, using two bits per component. The
+# codes are ordered the same way as the validity levels, so merging
+# a new level is a single comparison on the relevant bits
+
+_LEVEL_TO_CODE: Dict[int, int] = {
+    UNCHECKED: 0,
+    VALID    : 1,
+    WARNING  : 2,
+    ERROR    : 3
+}
+
+_CODE_TO_LEVEL: Tuple[int, ...] = ( UNCHECKED, VALID, WARNING, ERROR )
+_CODE_TO_STR:   Tuple[str, ...] = ( " ", "V", "W", "X" )
+
+_BITS_PER_COMPONENT = 2
+_COMPONENT_MASK     = 0b11
+
 #---------------------------------------------------------------------
 # Requirement/Checkoff Types
 #---------------------------------------------------------------------
@@ -71,6 +92,14 @@ checkoff_types: Set[str] = {
     "TECH. WRITING"
 }
 
+#---------------------------------------------------------------------
+# Validity Components
+#---------------------------------------------------------------------
+# The components of each type of entry, in the order they are packed
+
+req_components:      Tuple[str, ...] = ( "req", "course", "cred", "term", "grade", "cat" )
+checkoff_components: Tuple[str, ...] = ( "req", "course" )
+
 #---------------------------------------------------------------------
 # RosterEntry Object
 #---------------------------------------------------------------------
@@ -89,17 +118,36 @@ class RosterEntry:
 
      - coord: Coordinates used to indicate the requirement index (Coordinates)
 
-     - validity: The validity of the components of the entry 
+     - _validity: The validity of the components of the entry, packed
+                  two bits per component in the order given by
+                  components (int)
+
+     - _overall: The packed code of the worst validity seen across all
+                 components (int)
+
+    Properties (dynamically derived):
+
+     - validity: The validity of the components of the entry
                  (dict mapping str (component names) to int (validity))
 
     This is to be used for both requirement and checkoff entries.
     If a course is found to be invalid, it will be stored as an empty string.
+
+    Entries are created once per requirement for every student, so they
+    use __slots__ to avoid a per-instance __dict__
     """
 
+    __slots__ = ( "req", "coord", "course_used", "_validity", "_overall" )
+
+    # The components of the entry, and their packing index
+    components:     Tuple[str, ...] = ()
+    _component_idx: Dict[str, int]  = {}
+
     def __init__( self, req: str, course: str, coord: Coordinates ):
-        self.req                     = req.upper()
-        self.coord                   = coord
-        self.validity: Dict[str,int] = {}
+        self.req       = req.upper()
+        self.coord     = coord
+        self._validity = 0 # All components UNCHECKED
+        self._overall  = 0
 
         try:
             self.course_used = pclass( course )
@@ -115,32 +163,59 @@ class RosterEntry:
         """
         return f"({self.val_str()}) {self.req} satisfied by {self.course_used}"
 
+    def _merge( self, component: str, level: int ) -> None:
+        """Raises the validity of the component to at least the given level"""
+
+        shift = self._component_idx[ component ] * _BITS_PER_COMPONENT
+        code  = _LEVEL_TO_CODE[ level ]
+
+        if code > ( ( self._validity >> shift ) & _COMPONENT_MASK ):
+            self._validity = ( self._validity & ~( _COMPONENT_MASK << shift ) ) | \
+                             ( code << shift )
+
+        self._overall = max( self._overall, code )
+
     def valid( self, component: str ) -> None:
         """Indicates that the entry is valid"""
-        self.validity[ component ] = max( self.validity[ component ], VALID )
+        self._merge( component, VALID )
 
     def warn( self, component: str ) -> None:
         """Indicates that the entry has a warning"""
-        self.validity[ component ] = max( self.validity[ component ], WARNING )
+        self._merge( component, WARNING )
 
     def error( self, component: str ) -> None:
         """Indicates that the entry has an error"""
-        self.validity[ component ] = max( self.validity[ component ], ERROR )
+        self._merge( component, ERROR )
 
     def val_str( self ) -> str:
         """Returns a string representing the overall validity"""
+        return _CODE_TO_STR[ self._overall ]
 
-        if any( x == ERROR   for x in self.validity.values() ): # ERROR
-            return "X"
-        if any( x == WARNING for x in self.validity.values() ): # WARNING
-            return "W"
-        if any( x == VALID   for x in self.validity.values() ): # VALID
-            return "V"
-        return " "
+    def overall_val( self ) -> int:
+        """Returns the worst validity across all components"""
+        return _CODE_TO_LEVEL[ self._overall ]
 
     def get_val( self, component: str ) -> int:
         """Returns the validity of the given component"""
-        return self.validity[ component ]
+
+        shift = self._component_idx[ component ] * _BITS_PER_COMPONENT
+        return _CODE_TO_LEVEL[ ( self._validity >> shift ) & _COMPONENT_MASK ]
+
+    def packed_val( self ) -> int:
+        """Returns the packed validity of every component (to record it)"""
+        return self._validity
+
+    def restore_val( self, packed: int ) -> None:
+        """Restores the validity of every component, as recorded by packed_val"""
+
+        self._validity = packed
+        self._overall  = max( ( packed >> ( idx * _BITS_PER_COMPONENT ) ) & _COMPONENT_MASK
+                              for idx in range( len( self.components ) ) )
+
+    @property
+    def validity( self ) -> Dict[str, int]:
+        """Returns the validity of each component (for debugging)"""
+        return { component: self.get_val( component ) for component in self.components }
 
 #---------------------------------------------------------------------
 # ReqEntry Object
@@ -160,7 +235,7 @@ class ReqEntry( RosterEntry ):
 
      - cred_applied: Credits applied to satisfy the requirement (int)
 
-     - term: Term that the class was taken (str)
+     - term: Term that the class was taken (Term, or str if invalid)
 
      - grade: Grade reported for the class (str)
 
@@ -173,6 +248,11 @@ class ReqEntry( RosterEntry ):
     or -1 (int)        
     """
 
+    __slots__ = ( "cred_applied", "term", "grade", "cat" )
+
+    components     = req_components
+    _component_idx = { component: idx for idx, component in enumerate( req_components ) }
+
     def __init__( self, req: str, course: str, coord: Coordinates, cred: str, term: str, grade: str,
                   cat: str ):
 
@@ -184,7 +264,7 @@ class ReqEntry( RosterEntry ):
             self.cred_applied = -1
 
         try:
-            self.term = pterm( term )
+            self.term: str = pterm( term )
         except excp.ui_exceptions.InvalidTermError:
             self.term = ""
 
@@ -195,15 +275,6 @@ class ReqEntry( RosterEntry ):
 
         self.cat          = cat
 
-        self.validity = {
-            "req"    : UNCHECKED,
-            "course" : UNCHECKED,
-            "cred"   : UNCHECKED,
-            "term"   : UNCHECKED,
-            "grade"  : UNCHECKED,
-            "cat"    : UNCHECKED
-        }
-
         assert ( self.req in req_types ), \
                f"Error: Listed requirement {self.req} not recognized"
 
@@ -238,15 +309,15 @@ class CheckoffEntry( RosterEntry ):
     If a course is found to be invalid, it will be stored as an empty string.  
     """
 
+    __slots__ = ()
+
+    components     = checkoff_components
+    _component_idx = { component: idx for idx, component in enumerate( checkoff_components ) }
+
     def __init__( self, req: str, course: str, coord: Coordinates ):
 
         super().__init__( req, course, coord )
 
-        self.validity = {
-            "req"    : UNCHECKED,
-            "course" : UNCHECKED
-        }
-
         assert ( self.req in checkoff_types ), \
                f"Error: Listed requirement {self.req} not recognized"
 
@@ -28,6 +28,12 @@ class Roster():
 
      - filepath: The filepath that the data was sourced from (str)
 
+     - sheet: The sheet of the workbook that the data was sourced from,
+              or None for the first sheet (str or None)
+
+     - member: The workbook in a zip file that the data was sourced
+               from, or None if filepath is the workbook (str or None)
+
      - netid: The student's NetID (str)
 
      - req_entries: A list of the student's ReqEntrys (list of ReqEntrys)
@@ -37,10 +43,33 @@ class Roster():
 
     def __init__( self, checklist: Checklist ):
         self.filepath         = checklist.filepath
+        self.sheet            = checklist.sheet
+        self.member           = checklist.member
         self.netid            = checklist.netid
         self.req_entries      = checklist.req_entries
         self.checkoff_entries = checklist.checkoff_entries
 
+    def packed_validity( self ) -> List[int]:
+        """Returns the packed validity of each entry, in order (to record it)"""
+
+        return [ entry.packed_val() for entry in self.req_entries ] + \
+               [ entry.packed_val() for entry in self.checkoff_entries ]
+
+    def restore_validity( self, packed: List[int] ) -> bool:
+        """
+        Restores the validity of each entry, as recorded by packed_validity,
+        returning whether it could be (it can't if the roster's entries
+        have changed since)
+        """
+
+        entries: List[RosterEntry] = [ *self.req_entries, *self.checkoff_entries ]
+        if len( entries ) != len( packed ):
+            return False
+
+        for entry, entry_packed in zip( entries, packed ):
+            entry.restore_val( entry_packed )
+        return True
+
     def get_entry( self, coord: Coordinates ) -> Optional[ RosterEntry ]:
         """Gets the entry based off of the coordinate of the entry"""
 
@@ -25,12 +25,20 @@ TERM_MAPPING: Dict[str, str] = {
     "winter" : "WI"
 }
 
-def term_str_convert( term_str: str ) -> str:
+# Registrar data repeats the same few verbose terms on every line, so
+# each one is only converted once
+_converted_terms: Dict[str, ui.parser.Term] = {}
+
+def term_str_convert( term_str: str ) -> ui.parser.Term:
     """
     Converts a verbose term string to the simplified version
     Ex. 'Spring 2023' => 'SP23'
     """
 
+    if term_str in _converted_terms:
+        return _converted_terms[ term_str ]
+
+    verbose_str = term_str
     term_str = term_str.strip()
 
     letters = "".join( [ x for x in term_str if x.isalpha() ] )
@@ -39,7 +47,9 @@ def term_str_convert( term_str: str ) -> str:
     season = TERM_MAPPING[ letters.lower() ]
     year   = digits[-2:] # Last two
 
-    return season + year
+    term = ui.parser.Term( season + year )
+    _converted_terms[ verbose_str ] = term
+    return term
 
 #---------------------------------------------------------------------
 # Grades Object
@@ -66,7 +76,7 @@ class Sections:
        }
 
         - student: The student's NetID (str)
-        - term: The term name (ex. 'FA23') (str)
+        - term: The term name (ex. 'FA23') (Term)
         - class: The class name (ex. 'ECE 2720') (str)
         - section: The section the student enrolled in (str)
 
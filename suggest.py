@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+#=====================================================================
+# suggest.py
+#=====================================================================
+# Suggests course offerings that can satisfy a requirement in a term
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import argparse
+import sys
+from typing import NoReturn
+
+from api.bulk_api import bulk_populate_data
+from api.class_api import get_roster_registry
+from obj.roster_entry_obj import req_types
+from checks.rules.ece_rules import ECE_CHECKS
+from checks.rules.rule_compiler import build_eligibility_index, req_departments
+from ui.parser import parse_class_term
+import exceptions as excp
+
+DESCRIPTION = """
+Lists the course offerings during a term that can satisfy a requirement,
+based on the ECE requirement rules
+"""
+
+#---------------------------------------------------------------------
+# Argument Parsing
+#---------------------------------------------------------------------
+
+class DefaultHelpParser( argparse.ArgumentParser ):
+    """
+    A thin wrapper around argparse.ArgumentParser to print the help message
+    on an error
+    """
+
+    def error( self, message: str ) -> NoReturn:
+        """Displays the error and help message on an error"""
+        sys.stderr.write( f'error: {message}\n' )
+        self.print_help()
+        sys.exit( 2 )
+
+parser = DefaultHelpParser( description = DESCRIPTION,
+                            usage = "%(prog)s TERM REQUIREMENT",
+                            formatter_class = argparse.RawTextHelpFormatter )
+
+parser.add_argument( "term", help = "The term to search (ex. FA23)", metavar = "TERM" )
+
+parser.add_argument( "req", help = "The requirement to satisfy (ex. \"4000+\")",
+                     metavar = "REQUIREMENT" )
+
+parser.add_argument( "-d", "--dept", action = "append", dest = "depts", metavar = "DEPT",
+                     help = "A department to search (default: those named by the requirement)" )
+
+#---------------------------------------------------------------------
+# Main Code
+#---------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    try:
+        term = parse_class_term( args.term )
+    except excp.ui_exceptions.InvalidTermError:
+        parser.error( f"{args.term} isn't a valid term (ex. FA23)" )
+
+    if term not in get_roster_registry():
+        parser.error( f"The API has no data for {term}" )
+
+    req = args.req.upper()
+
+    if req not in req_types:
+        parser.error( f"{args.req} isn't a requirement " +
+                      f"(options: {', '.join( sorted( req_types ) )})" )
+
+    index = build_eligibility_index( ECE_CHECKS )
+    if not index.indexes( req ):
+        parser.error( f"No rules describe the {req} requirement" )
+
+    depts = sorted( args.depts if args.depts else req_departments( ECE_CHECKS, req ) )
+    if len( depts ) == 0:
+        parser.error( f"Any class can satisfy {req}; specify departments to search with -d" )
+
+    bulk_populate_data( [ ( term, dept.upper() ) for dept in depts ] )
+
+    for course_name, section in index.offerings_for( term, req ):
+        if section == "":
+            print( course_name )
+        else:
+            print( f"{course_name} (section {section})" )
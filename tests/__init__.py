@@ -0,0 +1 @@
+"""Golden Tests"""
@@ -0,0 +1,61 @@
+"""
+#=====================================================================
+# cohort_run.py
+#=====================================================================
+# Utilities for tests that run grad_val.py on a synthetic cohort,
+# against a local stub server
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+# The top-level directory, where grad_val.py is run from
+TOP_DIR = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+
+# Some checks log in the order of a set of classes, so all runs use the
+# same hash seed
+RUN_ENV = { **os.environ, "PYTHONHASHSEED": "0" }
+
+def start_stub_server( catalog_path: str ) -> Tuple[ subprocess.Popen, str ]:
+    """
+    Starts a stub server for a cohort's catalog in its own process,
+    returning the process and the API URL it serves
+    """
+
+    # The server announces its URL once it's listening
+    server = subprocess.Popen( # pylint: disable=consider-using-with
+        [ sys.executable, "-m", "bench.stub_server", catalog_path, "-p", "0" ],
+        cwd = TOP_DIR, stdout = subprocess.PIPE, text = True )
+    assert server.stdout is not None
+    return server, server.stdout.readline().split()[-1]
+
+def stop_stub_server( server: subprocess.Popen ) -> None:
+    """Stops a stub server started with start_stub_server"""
+
+    server.terminate()
+    server.wait()
+    if server.stdout is not None:
+        server.stdout.close()
+
+def run_grad_val( cohort_dir: str, logs_dir: str, api_url: str, flags: List[str],
+                  checklist_dir: str = "" ) -> int:
+    """
+    Runs grad_val.py with the cohort's grades, returning its exit status.
+    The checklists are read from the cohort's checklists/ directory,
+    unless another directory is given
+    """
+
+    if checklist_dir == "":
+        checklist_dir = os.path.join( cohort_dir, "checklists" )
+
+    return subprocess.run( [ sys.executable, "grad_val.py", "--dir", checklist_dir, "-sg",
+                             os.path.join( cohort_dir, "grades.csv" ), "-l", logs_dir,
+                             "--api-url", api_url, "--export-format", "csv", *flags ],
+                           cwd = TOP_DIR, env = RUN_ENV, check = False,
+                           stdin = subprocess.DEVNULL, stdout = subprocess.DEVNULL,
+                           stderr = subprocess.DEVNULL ).returncode
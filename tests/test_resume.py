@@ -0,0 +1,233 @@
+"""
+#=====================================================================
+# test_resume.py
+#=====================================================================
+# Tests that a run interrupted part-way through, once resumed, writes
+# the same results table, annotated checklists, and questions as a run
+# that wasn't interrupted, including for workbooks with a checklist per
+# sheet
+#
+# Run from the top-level directory with:
+#
+#   python -m pytest tests
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from typing import Dict, List, Tuple, cast
+
+import openpyxl
+from openpyxl.worksheet.worksheet import Worksheet
+
+from bench.synthetic_cohort import gen_cohort
+from tests.cohort_run import run_grad_val, start_stub_server, stop_stub_server
+
+# The students in each workbook, with a checklist per sheet
+WORKBOOKS: Dict[ str, List[str] ] = {
+    "multi-a.xlsx" : [ "syn0", "syn1", "syn2", "syn3" ],
+    "multi-b.xlsx" : [ "syn4", "syn5", "syn6" ]
+}
+
+# The student the interrupted run had just finished, part-way through
+# the first workbook (and the first window of three students)
+LAST_DONE = "syn1"
+
+# The students who took a class without a recorded section, in a term
+# where it had two, so that a question is deferred for each
+AMBIGUOUS_NETIDS = [ "syn0", "syn1", "syn3" ]
+
+# The seasons of the terms in the registrar's grades
+SEASONS = { "Fall": "FA", "Spring": "SP" }
+
+def combine_checklists( checklist_dir: str, netids: List[str], dest_path: str ) -> None:
+    """Combines students' checklists into a workbook, with a sheet per student"""
+
+    workbook = openpyxl.load_workbook( os.path.join( checklist_dir, f"{netids[0]}.xlsx" ) )
+    first_sheet = cast( Worksheet, workbook.active )
+    first_sheet.title = netids[0]
+
+    for netid in netids[1:]:
+        sheet = workbook.copy_worksheet( first_sheet )
+        sheet.title = netid
+        source = cast( Worksheet, openpyxl.load_workbook(
+            os.path.join( checklist_dir, f"{netid}.xlsx" ) ).active )
+        for row_idx, row in enumerate( source.iter_rows( values_only = True ) ):
+            for column_idx, value in enumerate( row ):
+                sheet.cell( row = row_idx + 1, column = column_idx + 1, value = value )
+
+    workbook.save( dest_path )
+
+def catalog_key( row: Dict[ str, str ] ) -> str:
+    """Returns the key of the catalog's classes for a grade's term and subject"""
+
+    season, year = row[ "Academic Term Ldescr" ].split()
+    return f"{SEASONS[ season ]}{year[2:]}/{row[ 'Subject' ]}"
+
+def make_ambiguous( cohort_dir: str, netids: List[str] ) -> None:
+    """
+    Gives the class of each student's first grade a second section in
+    its term, and removes the section from their grade, so that the
+    section they took has to be asked
+    """
+
+    grades_path  = os.path.join( cohort_dir, "grades.csv" )
+    catalog_path = os.path.join( cohort_dir, "catalog.json" )
+
+    with open( grades_path, "r", encoding = "utf-8", newline = "" ) as grades_file:
+        reader = csv.DictReader( grades_file )
+        fields = list( reader.fieldnames or [] )
+        rows   = list( reader )
+    with open( catalog_path, "r", encoding = "utf-8" ) as catalog_file:
+        catalog = json.load( catalog_file )
+
+    for netid in netids:
+        row = next( row for row in rows if row[ "Netid" ] == netid )
+        row[ "Class Section" ] = ""
+
+        class_data = next( class_data
+                           for class_data in catalog[ catalog_key( row ) ][ "data" ][ "classes" ]
+                           if class_data[ "catalogNbr" ] == row[ "Catalog Nbr" ] )
+        if len( class_data[ "enrollGroups" ] ) == 1:
+            second_group = json.loads( json.dumps( class_data[ "enrollGroups" ][0] ) )
+            second_group[ "classSections" ] = [ { "section": "002" } ]
+            class_data[ "enrollGroups" ].append( second_group )
+
+    with open( grades_path, "w", encoding = "utf-8", newline = "" ) as grades_file:
+        writer = csv.DictWriter( grades_file, fields )
+        writer.writeheader()
+        writer.writerows( rows )
+    with open( catalog_path, "w", encoding = "utf-8" ) as catalog_file:
+        json.dump( catalog, catalog_file )
+
+def interrupt( logs_dir: str, netid: str ) -> None:
+    """
+    Makes a run's logs look as if it was interrupted just after the
+    student was checked: the sink is cut after their completion marker,
+    the questions file only has the questions of the students checked
+    by then, and the results table and annotated checklists are removed
+    """
+
+    sink_path = os.path.join( logs_dir, "results.jsonl" )
+    with open( sink_path, "r", encoding = "utf-8" ) as sink_file:
+        lines = sink_file.readlines()
+
+    records  = [ json.loads( line ) for line in lines ]
+    done_idx = next( idx for idx, record in enumerate( records )
+                     if record[ "netid" ] == netid and record.get( "done" ) )
+    with open( sink_path, "w", encoding = "utf-8" ) as sink_file:
+        sink_file.writelines( lines[ : done_idx + 1 ] )
+
+    # Questions about a student are keyed by "KIND NETID ..."
+    done_netids    = { record[ "netid" ] for record in records[ : done_idx + 1 ] }
+    questions_path = os.path.join( logs_dir, "questions.json" )
+    with open( questions_path, "r", encoding = "utf-8" ) as questions_file:
+        questions = json.load( questions_file )
+    with open( questions_path, "w", encoding = "utf-8" ) as questions_file:
+        json.dump( [ question for question in questions
+                     if question[ "key" ].split()[1] in done_netids ], questions_file )
+
+    os.remove( os.path.join( logs_dir, "results.csv" ) )
+    shutil.rmtree( os.path.join( logs_dir, "annotated-checklists" ) )
+
+def workbook_parts( path: str ) -> Dict[ str, bytes ]:
+    """Returns the contents of each part of a workbook"""
+
+    with zipfile.ZipFile( path ) as xlsx:
+        return { name: xlsx.read( name ) for name in xlsx.namelist() }
+
+class ResumeTest( unittest.TestCase ):
+    """
+    Runs grad_val.py --batch on a cohort with deferred questions; once
+    on workbooks of several students (with --per-sheet), and once on a
+    checklist per student. A copy of each run is interrupted part-way
+    through the first workbook or window, and resumed
+    """
+
+    work_dir: tempfile.TemporaryDirectory
+    logs: Dict[ str, Tuple[ str, str ] ]
+
+    @classmethod
+    def setUpClass( cls ) -> None:
+        cls.work_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        cohort_dir   = os.path.join( cls.work_dir.name, "cohort" )
+        gen_cohort( sum( len( netids ) for netids in WORKBOOKS.values() ), cohort_dir, seed = 0 )
+        make_ambiguous( cohort_dir, AMBIGUOUS_NETIDS )
+
+        workbook_dir = os.path.join( cls.work_dir.name, "workbooks" )
+        os.makedirs( workbook_dir )
+        for workbook_name, netids in WORKBOOKS.items():
+            combine_checklists( os.path.join( cohort_dir, "checklists" ), netids,
+                                os.path.join( workbook_dir, workbook_name ) )
+
+        server, api_url = start_stub_server( os.path.join( cohort_dir, "catalog.json" ) )
+        cls.logs = {}
+        try:
+            for name, flags, checklist_dir in (
+                    ( "per-sheet", [ "--per-sheet", "--window", "1" ], workbook_dir ),
+                    ( "per-file", [ "--window", "3" ], os.path.join( cohort_dir, "checklists" ) ) ):
+                full_logs    = os.path.join( cls.work_dir.name, f"logs-{name}-full" )
+                resumed_logs = os.path.join( cls.work_dir.name, f"logs-{name}-resumed" )
+                flags        = flags + [ "--batch" ]
+
+                assert run_grad_val( cohort_dir, full_logs, api_url, flags, checklist_dir ) == 0
+                shutil.copytree( full_logs, resumed_logs )
+                interrupt( resumed_logs, LAST_DONE )
+                assert run_grad_val( cohort_dir, resumed_logs, api_url, flags + [ "--resume" ],
+                                     checklist_dir ) == 0
+                cls.logs[ name ] = ( full_logs, resumed_logs )
+        finally:
+            stop_stub_server( server )
+
+    @classmethod
+    def tearDownClass( cls ) -> None:
+        cls.work_dir.cleanup()
+
+    def read_logs( self, name: str, file_name: str ) -> Tuple[ str, str ]:
+        """Returns the contents of a file from a full run, and from its resumed copy"""
+
+        contents = []
+        for logs_dir in self.logs[ name ]:
+            with open( os.path.join( logs_dir, file_name ), "r", encoding = "utf-8" ) as logs_file:
+                contents.append( logs_file.read() )
+        return contents[0], contents[1]
+
+    def test_results( self ) -> None:
+        """The results table includes the students checked before the interruption"""
+
+        for name in self.logs:
+            with self.subTest( run = name ):
+                full, resumed = self.read_logs( name, "results.csv" )
+                self.assertEqual( full, resumed )
+
+    def test_questions( self ) -> None:
+        """The questions about students checked before the interruption are kept"""
+
+        for name in self.logs:
+            with self.subTest( run = name ):
+                full, resumed = self.read_logs( name, "questions.json" )
+                self.assertEqual( [ question[ "key" ].split()[1]
+                                    for question in json.loads( full ) ], AMBIGUOUS_NETIDS )
+                self.assertEqual( full, resumed )
+
+    def test_annotations( self ) -> None:
+        """Every sheet of every workbook is annotated, whenever it was checked"""
+
+        full_logs, resumed_logs = self.logs[ "per-sheet" ]
+        for workbook_name in WORKBOOKS:
+            with self.subTest( workbook = workbook_name ):
+                self.assertEqual(
+                    workbook_parts( os.path.join( full_logs, "annotated-checklists",
+                                                  workbook_name ) ),
+                    workbook_parts( os.path.join( resumed_logs, "annotated-checklists",
+                                                  workbook_name ) ) )
+
+if __name__ == "__main__":
+    unittest.main()
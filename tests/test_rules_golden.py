@@ -0,0 +1,119 @@
+"""
+#=====================================================================
+# test_rules_golden.py
+#=====================================================================
+# Golden tests that the compiled rules engine (--rules) reaches the
+# same results as the hand-written check modules, on a synthetic
+# cohort checked against a local stub server
+#
+# Run from the top-level directory with:
+#
+#   python -m pytest tests
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from typing import Dict, List, Tuple
+
+from bench.synthetic_cohort import gen_cohort
+from tests.cohort_run import run_grad_val, start_stub_server, stop_stub_server
+
+# The number of students in the cohort
+NUM_STUDENTS = 25
+
+# The fields of a record that differ between any two runs
+RUN_FIELDS = ( "run", "time" )
+
+# A message logged by each path through the checks that the cohort's
+# mistakes should exercise, keyed by the check that logs it
+COVERED_MESSAGES: List[ Tuple[ str, str ] ] = [
+    ( "ece-found",   "check failed by" ),                          # Foundation group
+    ( "ece-upper",   "Class isn't a valid CDE" ),                  # CDE
+    ( "ece-upper",   "Class isn't a valid 4000+ ECE technical" ),  # Level
+    ( "common-core", "for the EXP. PHYS. requirement" ),           # Conditional
+    ( "common-core", "wasn't offered during" )                     # Course not offered
+]
+
+def read_records( path: str ) -> List[ Dict[ str, object ] ]:
+    """Reads a JSON Lines file, without the fields specific to the run"""
+
+    records = []
+    with open( path, "r", encoding = "utf-8" ) as records_file:
+        for line in records_file:
+            record = json.loads( line )
+            for field in RUN_FIELDS:
+                record.pop( field, None )
+            records.append( record )
+    return records
+
+class RulesGoldenTest( unittest.TestCase ):
+    """
+    Runs grad_val.py on a synthetic cohort with the hand-written checks
+    and with the compiled rules, and compares their outputs
+    """
+
+    work_dir: tempfile.TemporaryDirectory
+    server: subprocess.Popen
+    api_url: str
+    logs: Dict[ str, str ]
+
+    @classmethod
+    def setUpClass( cls ) -> None:
+        cls.work_dir = tempfile.TemporaryDirectory() # pylint: disable=consider-using-with
+        cohort_dir   = os.path.join( cls.work_dir.name, "cohort" )
+        gen_cohort( NUM_STUDENTS, cohort_dir, seed = 0 )
+
+        cls.server, cls.api_url = start_stub_server( os.path.join( cohort_dir, "catalog.json" ) )
+
+        cls.logs = {}
+        for name, flags in ( ( "checks", [] ), ( "rules", [ "--rules" ] ) ):
+            cls.logs[ name ] = os.path.join( cls.work_dir.name, f"logs-{name}" )
+            assert run_grad_val( cohort_dir, cls.logs[ name ], cls.api_url, flags ) == 0
+
+    @classmethod
+    def tearDownClass( cls ) -> None:
+        stop_stub_server( cls.server )
+        cls.work_dir.cleanup()
+
+    def log_path( self, name: str, file_name: str ) -> str:
+        """Returns the path of a file in a run's logs directory"""
+        return os.path.join( self.logs[ name ], file_name )
+
+    def test_events( self ) -> None:
+        """Every check logs the same messages, about the same entries"""
+
+        self.assertEqual( read_records( self.log_path( "checks", "events.jsonl" ) ),
+                          read_records( self.log_path( "rules",  "events.jsonl" ) ) )
+
+    def test_coverage( self ) -> None:
+        """The cohort's mistakes are reported by each of the paths they're meant to exercise"""
+
+        events = read_records( self.log_path( "checks", "events.jsonl" ) )
+        for check, message in COVERED_MESSAGES:
+            with self.subTest( check = check, message = message ):
+                self.assertTrue( any( ( event[ "check" ] == check ) and
+                                      ( message in str( event[ "message" ] ) )
+                                      for event in events ) )
+
+    def test_results( self ) -> None:
+        """Every check finds the same number of errors and warnings"""
+
+        results = read_records( self.log_path( "checks", "results.jsonl" ) )
+        self.assertGreater( len( results ), 0 )
+        self.assertEqual( results, read_records( self.log_path( "rules", "results.jsonl" ) ) )
+
+    def test_validity( self ) -> None:
+        """Every entry is given the same validity"""
+
+        with open( self.log_path( "checks", "results.csv" ), "r", encoding = "utf-8" ) as checks, \
+             open( self.log_path( "rules",  "results.csv" ), "r", encoding = "utf-8" ) as rules:
+            self.assertEqual( checks.read(), rules.read() )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 """Import UI Files"""
 
+import ui.ambiguities
 import ui.annotate
+import ui.event_log
 import ui.parser
 import ui.user
 import ui.logger
+import ui.memprofile
+import ui.results_export
@@ -0,0 +1,292 @@
+"""
+#=====================================================================
+# ambiguities.py
+#=====================================================================
+# A queue of the questions that would otherwise block a run on the
+# user's input, so that unattended (batch) runs can continue with a
+# provisional answer, and the questions can be answered for a later
+# run
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import ui.parser
+import ui.user
+import exceptions as excp
+
+# The name of the file of questions in the logs directory
+QUESTIONS_FILE_NAME = "questions.json"
+
+#---------------------------------------------------------------------
+# Question Object
+#---------------------------------------------------------------------
+
+class Question:
+    """
+    A question for the user, such as which section of a class a student
+    took
+
+    Attributes:
+
+     - key: Identifies the question across runs (str)
+         ex. "section ab123 FA23 ECE 2300"
+
+     - kind: The kind of question ("section" or "term") (str)
+
+     - netid: The student the question is about, if any (str)
+
+     - course: The class the question is about (str)
+
+     - term: The term the question is about, if any (str)
+
+     - names: All names of the class, to match it against a student's
+              entries (list of str)
+
+     - prompt: The question, as it would be prompted (str)
+
+     - options: The possible answers, if limited (list of str)
+
+     - provisional: The answer used in the meantime, if any (str or None)
+
+     - answer: The user's answer, once given (str or None)
+    """
+
+    def __init__( self, kind: str, course: str, prompt: str, *, netid: str = "", term: str = "",
+                  names: Optional[List[str]] = None,
+                  options: Optional[List[str]] = None ) -> None:
+        self.key         = " ".join( part for part in ( kind, netid, term, course ) if part )
+        self.kind        = kind
+        self.netid       = netid
+        self.course      = course
+        self.term        = term
+        self.names       = names if names is not None else [ course ]
+        self.prompt      = prompt
+        self.options     = options if options is not None else []
+        self.provisional: Optional[str] = None
+        self.answer: Optional[str]      = None
+
+    def to_json( self ) -> Dict[ str, Any ]:
+        """Returns the question as written to the questions file"""
+
+        return { "key"         : self.key,
+                 "question"    : self.prompt,
+                 "options"     : self.options,
+                 "provisional" : self.provisional,
+                 "answer"      : self.answer }
+
+#---------------------------------------------------------------------
+# AmbiguityQueue Object
+#---------------------------------------------------------------------
+
+class AmbiguityQueue:
+    """
+    The questions asked during a run. Questions answered in an earlier
+    run's questions file aren't asked again. Otherwise, they're
+    prompted for, or in batch mode, given their provisional answer (the
+    prompt's default) and left open
+
+    Attributes:
+
+     - batch: Whether to defer questions, rather than prompting (bool)
+
+     - answers: The answers from an earlier run, by question key
+                (dict mapping str to str)
+
+     - questions: The questions asked during the run, by key, in the
+                  order they were asked (dict mapping str to Question)
+
+     - netid_questions: The questions asked about each student
+                        (dict mapping str to list of Question)
+
+     - earlier: The questions written by an interrupted run that this
+                one resumes, by key, which are written again unless
+                they're asked again (dict mapping str to dict)
+
+     - path: The file that the questions are saved to as the run goes,
+             if any (str or None)
+
+     - unsaved: Whether questions have been asked or answered since
+                they were last saved (bool)
+    """
+
+    def __init__( self ) -> None:
+        self.batch = False
+        self.earlier: Dict[ str, Dict[ str, Any ] ] = {}
+        self.path: Optional[str] = None
+        self.unsaved = False
+        self.answers: Dict[ str, str ] = {}
+        self.questions: Dict[ str, Question ] = {}
+        self.netid_questions: Dict[ str, List[Question] ] = {}
+
+    def load_answers( self, path: str ) -> int:
+        """
+        Reads the answered questions from an earlier run's questions
+        file, returning the number of answers
+        """
+
+        with open( path, "r", encoding = "utf-8" ) as questions_file:
+            for question in json.load( questions_file ):
+                answer = question.get( "answer" )
+                if answer not in ( None, "" ):
+                    self.answers[ question[ "key" ] ] = str( answer )
+
+        return len( self.answers )
+
+    def load_questions( self, path: str ) -> int:
+        """
+        Reads the questions written by an interrupted run that this one
+        resumes, returning the number read. They're written again with
+        this run's questions (unless this run asks them again), as the
+        students they're about aren't checked again; their answers are
+        reused for this run's questions
+        """
+
+        with open( path, "r", encoding = "utf-8" ) as questions_file:
+            for question in json.load( questions_file ):
+                self.earlier[ question[ "key" ] ] = question
+                answer = question.get( "answer" )
+                if answer not in ( None, "" ):
+                    self.answers.setdefault( question[ "key" ], str( answer ) )
+
+        return len( self.earlier )
+
+    def ask( self, question: Question, default: Optional[str] = None ) -> Optional[str]:
+        """
+        Returns the answer to a question; the earlier answer if there is
+        one (from this run, or the answers file), or otherwise the user's
+        (when prompting) or the default (in batch mode, where the
+        question is left open). Answers from the file are checked against
+        the options, if there are any
+        """
+
+        if question.key not in self.questions:
+            self.questions[ question.key ] = question
+            self.netid_questions.setdefault( question.netid, [] ).append( question )
+            self.unsaved = True
+        question = self.questions[ question.key ]
+        if question.answer is not None: # Already answered during this run
+            return question.answer
+
+        answer = self.answers.get( question.key )
+        if ( answer is not None ) and ( ( len( question.options ) == 0 ) or
+                                        ( answer in question.options ) ):
+            question.answer = answer
+            return answer
+
+        if self.batch:
+            question.provisional = default
+            return default
+
+        self.unsaved = True
+        if len( question.options ) > 0:
+            question.answer = ui.user.prompt_usr_list( question.prompt, question.options,
+                                                       question.options.index( default )
+                                                       if default in question.options else 0 )
+        else:
+            question.answer = ui.user.prompt_term( question.course )
+        return question.answer
+
+    def open_questions( self, netid: str ) -> List[Question]:
+        """Returns a student's questions that were left open"""
+
+        return [ question for question in self.netid_questions.get( netid, [] )
+                 if question.answer is None ]
+
+    def num_open( self ) -> int:
+        """Returns the number of questions left open (including those kept)"""
+        return sum( 1 for record in self._records() if record.get( "answer" ) is None )
+
+    def _records( self ) -> List[ Dict[ str, Any ] ]:
+        """
+        Returns the questions to write; those kept from an interrupted
+        run, then those asked during this one
+        """
+
+        return [ record for key, record in self.earlier.items() if key not in self.questions ] + \
+               [ question.to_json() for question in self.questions.values() ]
+
+    def num_questions( self ) -> int:
+        """Returns the number of questions asked (including those kept)"""
+        return len( self.questions ) + sum( 1 for key in self.earlier if key not in self.questions )
+
+    def write( self, path: str ) -> None:
+        """
+        Writes every question asked to the given file (with the answers
+        given so far), to be answered and read by a later run. The file
+        is replaced in one step, so an interrupted write leaves the
+        previous version in place
+        """
+
+        partial_path = path + ".partial"
+        with open( partial_path, "w", encoding = "utf-8" ) as questions_file:
+            json.dump( self._records(), questions_file, indent = 2 )
+            questions_file.write( "\n" )
+        os.replace( partial_path, path )
+
+    def save( self ) -> None:
+        """
+        Writes the questions to the queue's file (if it has one), if any
+        were asked or answered since they were last saved. This is done
+        before each student is marked as checked, so that an interrupted
+        run still leaves the questions of every student it finished
+        """
+
+        if ( self.path is not None ) and self.unsaved:
+            self.write( self.path )
+            self.unsaved = False
+
+#---------------------------------------------------------------------
+# Global Queue
+#---------------------------------------------------------------------
+
+_QUEUE = AmbiguityQueue()
+
+def set_batch( batch: bool ) -> None:
+    """Sets whether questions are deferred, rather than prompted for"""
+    _QUEUE.batch = batch
+
+def set_questions_file( path: Optional[str] ) -> None:
+    """Sets the file that the run's questions are saved to as it goes"""
+    _QUEUE.path = path
+
+def get_queue() -> AmbiguityQueue:
+    """Returns the run's queue of questions"""
+    return _QUEUE
+
+def ask_section( netid: str, course: str, term: str, names: List[str],
+                 options: List[str] ) -> str:
+    """
+    Asks which enroll group (identified by its first section) a student
+    took a class in, defaulting to the first
+    """
+
+    prompt = ( f"Looks like {course} ({term}) has multiple " +
+                "sections - which one did you take?" )
+
+    question = Question( "section", course, prompt, netid = netid, term = term,
+                         names = names, options = options )
+    return str( _QUEUE.ask( question, default = options[0] ) )
+
+def ask_term( course: str ) -> str:
+    """
+    Asks which term a class was taken in. There's no sensible
+    provisional term, so an UnansweredQuestionError is raised when the
+    question is deferred
+    """
+
+    prompt = ( f"Looks like {course} doesn't have an associated term. " +
+                "What term did/will you take this course?" )
+
+    answer = _QUEUE.ask( Question( "term", course, prompt ) )
+    if answer is None:
+        raise excp.ui_exceptions.UnansweredQuestionError( prompt )
+
+    term = ui.parser.parse_class_term( answer )
+    if not ui.parser.validate_class_term( term ):
+        raise excp.ui_exceptions.InvalidTermError( answer )
+    return term
@@ -9,17 +9,26 @@
 # Date: December 8th, 2023
 """
 
+import hashlib
+import json
 import os
+import posixpath
+import re
 import shutil
-from typing import Tuple, Set, List, cast
+import zipfile
+from typing import Dict, Iterable, Tuple, Set, List, Match, Optional, cast
+from xml.etree import ElementTree
 
 import openpyxl
 from openpyxl.styles import PatternFill
+from openpyxl.utils.cell import column_index_from_string
 from openpyxl.worksheet.worksheet import Worksheet
 
+from obj.checklist_cache import file_digest
+from obj.checklist_sources import read_workbook, source_name
 from obj.roster_obj import Roster
 from obj.roster_entry_obj import RosterEntry, ERROR, WARNING, VALID
-from obj.roster_entry_obj import req_types
+from obj.roster_entry_obj import req_types, req_components
 from obj.coordinates_obj import Coordinates
 import exceptions as excp
 
@@ -31,6 +40,12 @@ error_fill   = PatternFill( patternType = "solid", fgColor = "cc3300" )
 warning_fill = PatternFill( patternType = "solid", fgColor = "ffcc00" )
 valid_fill   = PatternFill( patternType = "solid", fgColor = "99cc33" )
 
+validity_fills: Dict[ int, PatternFill ] = {
+    VALID   : valid_fill,
+    WARNING : warning_fill,
+    ERROR   : error_fill
+}
+
 #---------------------------------------------------------------------
 # Wrapper Functions for interacting with an OpenPyXL Worksheet
 #---------------------------------------------------------------------
@@ -130,16 +145,6 @@ def fill_cell( ws: Worksheet, coordinate: str, fill_pattern: PatternFill ) -> No
 # Roster Interactions
 #---------------------------------------------------------------------
 
-def xlsx_copy( roster: Roster, dest_dir: str ) -> str:
-    """
-    Copies the checklist to the given destination directory, and returns the 
-    path to the copied file
-    """
-
-    dest_path = os.path.join( dest_dir, f"{roster.netid}.xlsx" )
-    shutil.copyfile( roster.filepath, dest_path )
-    return dest_path
-
 def color_cell( ws: Worksheet, coord: str, validity_level: int ) -> None:
     """Colors a cell according to its validity"""
 
@@ -152,12 +157,8 @@ def color_cell( ws: Worksheet, coord: str, validity_level: int ) -> None:
     if validity_level == ERROR:
         fill_cell( ws, coord, error_fill )
 
-def make_annotated_checklist( roster: Roster, dest_dir: str ) -> None:
-    """Makes an annotated checklist in the specified directory"""
-
-    dest_file = xlsx_copy( roster, dest_dir )
-    wb = openpyxl.load_workbook( dest_file )
-    ws = cast( Worksheet, wb.active )
+def color_sheet( ws: Worksheet, roster: Roster ) -> None:
+    """Colors the cells of a roster's entries in the sheet it's from"""
 
     # Color the requirements
 
@@ -203,5 +204,457 @@ def make_annotated_checklist( roster: Roster, dest_dir: str ) -> None:
     color_cell( ws, tech_writ_coord,             tech_writ_entry.get_val( "req"    ) )
     color_cell( ws, cr( cr( tech_writ_coord ) ), tech_writ_entry.get_val( "course" ) )
 
-    # Save the file
-    wb.save( dest_file )
+def make_annotated_workbook_openpyxl( rosters: List[Roster], dest_path: str ) -> None:
+    """
+    Makes an annotated copy of the rosters' workbook at the given path by
+    loading and re-saving the whole workbook with OpenPyXL
+    """
+
+    wb = openpyxl.load_workbook( read_workbook( rosters[0].filepath, rosters[0].member ) )
+
+    for roster in rosters:
+        color_sheet( cast( Worksheet, wb[ roster.sheet ] if roster.sheet is not None
+                                      else wb.active ), roster )
+
+    wb.save( dest_path )
+
+#---------------------------------------------------------------------
+# Direct Style Patching
+#---------------------------------------------------------------------
+# Rather than loading and re-serializing the whole workbook, we add our
+# fills to the workbook's stylesheet, and only change the style index
+# ("s") of the cells we color in the sheet's XML. Every other part of
+# the workbook is copied unchanged
+
+MAIN_NS    = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+CELL_TAG  = re.compile( r"<c\b[^>]*>" )
+CELL_REF  = re.compile( r'(?<=\s)r="([A-Z]+)([0-9]+)"' )
+CELL_STYLE = re.compile( r'(?<=\s)s="([0-9]+)"' )
+
+def annotation_validity( roster: Roster ) -> Dict[ str, int ]:
+    """
+    Returns the validity of each cell to color (by OpenPyXL coordinate),
+    from the validity of the components of the roster's entries
+    """
+
+    cells: List[ Tuple[ Coordinates, int ] ] = []
+
+    # Requirements are laid out by component, with the category only
+    # for liberal studies
+    for req_entry in roster.req_entries:
+        coord = req_entry.coord
+        for component in req_components:
+            if ( component != "cat" ) or ( req_entry.req == "LS" ):
+                cells.append( ( coord, req_entry.get_val( component ) ) )
+            coord = coord.right()
+
+    # Checkoffs have their course two cells to the right
+    for checkoff_entry in roster.checkoff_entries:
+        cells.append( ( checkoff_entry.coord,                 checkoff_entry.get_val( "req"    ) ) )
+        cells.append( ( checkoff_entry.coord.right().right(), checkoff_entry.get_val( "course" ) ) )
+
+    return { tuple_to_coord( ( coord.y + 1, coord.x + 1 ) ): validity_level
+             for coord, validity_level in cells if validity_level in validity_fills }
+
+def annotation_fills( roster: Roster ) -> Dict[ str, PatternFill ]:
+    """Returns the fill of each cell to color (by OpenPyXL coordinate)"""
+
+    return { coord: validity_fills[ validity_level ]
+             for coord, validity_level in annotation_validity( roster ).items() }
+
+def fill_xml( fill: PatternFill ) -> str:
+    """Returns the stylesheet element for one of our (solid) fills"""
+    return ( f'<fill><patternFill patternType="{fill.patternType}">'
+             f'<fgColor rgb="{fill.fgColor.rgb}"/></patternFill></fill>' )
+
+def set_attrs( element: str, attrs: Dict[ str, str ] ) -> str:
+    """
+    Sets attributes on the opening tag of an XML element, given as text,
+    replacing them if they're already present
+    """
+
+    tag_end = element.index( ">" )
+    if element[ tag_end - 1 ] == "/":
+        tag_end -= 1
+    tag, rest = element[ :tag_end ], element[ tag_end: ]
+
+    for name, value in attrs.items():
+        attr = re.compile( rf'(?<=\s){name}="[^"]*"' )
+        if attr.search( tag ):
+            tag = attr.sub( f'{name}="{value}"', tag )
+        else:
+            tag = tag.rstrip() + f' {name}="{value}"'
+
+    return tag + rest
+
+class StylePatcher:
+    """
+    Adds fills to a workbook's stylesheet (styles.xml), along with the
+    cell formats needed to apply them to cells that already have a
+    format. The new formats copy the originals, so a colored cell keeps
+    its font, border, alignment, and number format
+
+    Attributes:
+
+     - styles_xml: The original stylesheet (str)
+
+     - file: The checklist the stylesheet is from (str)
+
+     - num_fills: The number of fills in the original stylesheet (int)
+
+     - cell_xfs: The cell formats in the original stylesheet
+                 (list of str (<xf> elements))
+
+     - new_fills: The fills added, mapped to their index
+                  (dict mapping str (<fill> elements) to int)
+
+     - new_xfs: The cell formats added, mapped to their index
+                (dict mapping tuple of (int (original format),
+                int (fill index)) to int)
+
+     - new_xf_elements: The cell formats added, in order
+                        (list of str (<xf> elements))
+    """
+
+    FILLS     = re.compile( r"(<fills\b[^>]*>)(.*?)</fills>",     re.DOTALL )
+    CELL_XFS  = re.compile( r"(<cellXfs\b[^>]*>)(.*?)</cellXfs>", re.DOTALL )
+    FILL      = re.compile( r"<fill[\s/>]" )
+    XF        = re.compile( r"<xf\b[^>]*?/>|<xf\b[^>]*>.*?</xf>", re.DOTALL )
+
+    def __init__( self, styles_xml: str, file: str ) -> None:
+        self.styles_xml = styles_xml
+        self.file       = file
+
+        fills    = self.FILLS.search( styles_xml )
+        cell_xfs = self.CELL_XFS.search( styles_xml )
+        if ( fills is None ) or ( cell_xfs is None ):
+            raise excp.checklist_exceptions.UnpatchableChecklistError(
+                file, "no fills or cell formats in the stylesheet" )
+
+        self.num_fills = len( self.FILL.findall( fills.group( 2 ) ) )
+        self.cell_xfs  = self.XF.findall( cell_xfs.group( 2 ) )
+
+        self.new_fills: Dict[ str, int ] = {}
+        self.new_xfs: Dict[ Tuple[ int, int ], int ] = {}
+        self.new_xf_elements: List[str] = []
+
+    def styled( self, xf_idx: int, fill: PatternFill ) -> int:
+        """
+        Returns the index of a cell format that's the given format with
+        the given fill, adding it if needed
+        """
+
+        fill_idx = self.new_fills.setdefault( fill_xml( fill ),
+                                              self.num_fills + len( self.new_fills ) )
+
+        if xf_idx >= len( self.cell_xfs ):
+            raise excp.checklist_exceptions.UnpatchableChecklistError(
+                self.file, f"a cell has an undefined format ({xf_idx})" )
+
+        if ( xf_idx, fill_idx ) not in self.new_xfs:
+            new_xf_idx = len( self.cell_xfs ) + len( self.new_xf_elements )
+            self.new_xfs[ ( xf_idx, fill_idx ) ] = new_xf_idx
+            self.new_xf_elements.append( set_attrs( self.cell_xfs[ xf_idx ],
+                                                    { "fillId"    : str( fill_idx ),
+                                                      "applyFill" : "1" } ) )
+
+        return self.new_xfs[ ( xf_idx, fill_idx ) ]
+
+    def patched( self ) -> str:
+        """Returns the stylesheet with the added fills and cell formats"""
+
+        num_fills = self.num_fills + len( self.new_fills )
+        num_xfs   = len( self.cell_xfs ) + len( self.new_xf_elements )
+
+        def add_fills( match: Match[str] ) -> str:
+            return ( set_attrs( match.group( 1 ), { "count": str( num_fills ) } ) +
+                     match.group( 2 ) + "".join( self.new_fills ) + "</fills>" )
+
+        def add_xfs( match: Match[str] ) -> str:
+            return ( set_attrs( match.group( 1 ), { "count": str( num_xfs ) } ) +
+                     match.group( 2 ) + "".join( self.new_xf_elements ) + "</cellXfs>" )
+
+        styles_xml = self.FILLS.sub( add_fills, self.styles_xml, count = 1 )
+        return self.CELL_XFS.sub( add_xfs, styles_xml, count = 1 )
+
+def _rel_targets( xlsx: zipfile.ZipFile, part: str ) -> Dict[ str, Tuple[ str, str ] ]:
+    """
+    Returns the relationships of a part of the workbook (or of the
+    package, if part is ""), mapping their IDs to their type and the
+    path of their target
+    """
+
+    part_dir, part_name = posixpath.split( part )
+    rels = ElementTree.fromstring( xlsx.read( posixpath.join( part_dir, "_rels",
+                                                              f"{part_name}.rels" ) ) )
+
+    targets = {}
+    for rel in rels.iter( f"{{{PKG_REL_NS}}}Relationship" ):
+        target = rel.get( "Target", "" )
+        if target.startswith( "/" ):
+            path = target[ 1: ]
+        else:
+            path = posixpath.normpath( posixpath.join( part_dir, target ) )
+        targets[ rel.get( "Id", "" ) ] = ( rel.get( "Type", "" ), path )
+
+    return targets
+
+def _workbook_parts( xlsx: zipfile.ZipFile,
+                     file: str ) -> Tuple[ Dict[ Optional[str], str ], str ]:
+    """
+    Returns the paths of the sheets in the workbook (by name, with the
+    active sheet that OpenPyXL would open under None) and of the
+    stylesheet
+    """
+
+    try:
+        workbook_path = next( path for rel_type, path in _rel_targets( xlsx, "" ).values()
+                              if rel_type.endswith( "/officeDocument" ) )
+        workbook_rels = _rel_targets( xlsx, workbook_path )
+        workbook      = ElementTree.fromstring( xlsx.read( workbook_path ) )
+
+        view       = workbook.find( f"{{{MAIN_NS}}}bookViews/{{{MAIN_NS}}}workbookView" )
+        active_tab = int( view.get( "activeTab", "0" ) ) if view is not None else 0
+        sheets     = workbook.findall( f"{{{MAIN_NS}}}sheets/{{{MAIN_NS}}}sheet" )
+
+        sheet_paths: Dict[ Optional[str], str ] = {
+            sheet.get( "name" ): workbook_rels[ sheet.get( f"{{{DOC_REL_NS}}}id", "" ) ][ 1 ]
+            for sheet in sheets }
+        sheet_paths[ None ] = sheet_paths[ sheets[ active_tab ].get( "name" ) ]
+
+        styles_path = next( path for rel_type, path in workbook_rels.values()
+                            if rel_type.endswith( "/styles" ) )
+    except ( KeyError, IndexError, StopIteration, ValueError ) as err:
+        raise excp.checklist_exceptions.UnpatchableChecklistError(
+            file, "couldn't find the sheets and stylesheet" ) from err
+
+    return sheet_paths, styles_path
+
+def _insert_cell( sheet_xml: str, coord: str, xf_idx: int ) -> str:
+    """
+    Adds an empty cell with the given format to the sheet, for cells
+    that have no value or format of their own
+    """
+
+    row, col = coord_to_tuple( coord )
+    cell = f'<c r="{coord}" s="{xf_idx}"/>'
+
+    row_tag = re.search( rf'<row\b[^>]*?\sr="{row}"[^>]*>', sheet_xml )
+    if row_tag is not None:
+        if row_tag.group( 0 ).endswith( "/>" ): # An empty row
+            return ( sheet_xml[ :row_tag.start() ] + row_tag.group( 0 )[ :-2 ] + ">" + cell +
+                     "</row>" + sheet_xml[ row_tag.end(): ] )
+
+        # Keep the row's cells in order of column
+        row_end = sheet_xml.index( "</row>", row_tag.end() )
+        insert_at = row_end
+        for cell_tag in CELL_TAG.finditer( sheet_xml, row_tag.end(), row_end ):
+            cell_ref = CELL_REF.search( cell_tag.group( 0 ) )
+            if ( ( cell_ref is not None ) and
+                 ( column_index_from_string( cell_ref.group( 1 ) ) > col ) ):
+                insert_at = cell_tag.start()
+                break
+        return sheet_xml[ :insert_at ] + cell + sheet_xml[ insert_at: ]
+
+    # Add a new row, keeping the rows in order
+    new_row = f'<row r="{row}">{cell}</row>'
+    for other_row in re.finditer( r'<row\b[^>]*?\sr="([0-9]+)"', sheet_xml ):
+        if int( other_row.group( 1 ) ) > row:
+            return sheet_xml[ :other_row.start() ] + new_row + sheet_xml[ other_row.start(): ]
+    if "</sheetData>" in sheet_xml:
+        return sheet_xml.replace( "</sheetData>", new_row + "</sheetData>", 1 )
+    return sheet_xml.replace( "<sheetData/>", f"<sheetData>{new_row}</sheetData>", 1 )
+
+def patch_sheet( sheet_xml: str, fills: Dict[ str, PatternFill ], styles: StylePatcher ) -> str:
+    """Returns the sheet with the given cells' formats changed to have their fills"""
+
+    patched = set()
+
+    def patch_cell( match: Match[str] ) -> str:
+        cell_tag = match.group( 0 )
+        cell_ref = CELL_REF.search( cell_tag )
+        if cell_ref is None:
+            return cell_tag
+        coord = cell_ref.group( 1 ) + cell_ref.group( 2 )
+        if coord not in fills:
+            return cell_tag
+
+        patched.add( coord )
+        cell_style = CELL_STYLE.search( cell_tag )
+        xf_idx = int( cell_style.group( 1 ) ) if cell_style is not None else 0
+        return set_attrs( cell_tag, { "s": str( styles.styled( xf_idx, fills[ coord ] ) ) } )
+
+    sheet_xml = CELL_TAG.sub( patch_cell, sheet_xml )
+
+    for coord, fill in fills.items():
+        if coord not in patched:
+            sheet_xml = _insert_cell( sheet_xml, coord, styles.styled( 0, fill ) )
+
+    return sheet_xml
+
+def _copy_info( info: zipfile.ZipInfo ) -> zipfile.ZipInfo:
+    """Returns a fresh copy of a member's information, for writing it to a new archive"""
+
+    new_info = zipfile.ZipInfo( info.filename, info.date_time )
+    new_info.compress_type = info.compress_type
+    new_info.external_attr = info.external_attr
+    new_info.create_system = info.create_system
+    return new_info
+
+def make_annotated_workbook( rosters: List[Roster], dest_path: str ) -> None:
+    """
+    Makes an annotated copy of the workbook the rosters are from (each on
+    its own sheet) at the given path, by directly patching the styles of
+    the workbook. Workbooks that can't be patched are annotated with
+    OpenPyXL instead
+    """
+
+    file = source_name( rosters[0] )
+
+    with zipfile.ZipFile( read_workbook( rosters[0].filepath, rosters[0].member ) ) as src:
+        try:
+            sheet_paths, styles_path = _workbook_parts( src, file )
+            styles = StylePatcher( src.read( styles_path ).decode( "utf-8" ), file )
+
+            sheet_xmls: Dict[ str, str ] = {}
+            for roster in rosters:
+                if roster.sheet not in sheet_paths:
+                    raise excp.checklist_exceptions.UnpatchableChecklistError(
+                        file, f"couldn't find the sheet {roster.sheet}" )
+                sheet_path = sheet_paths[ roster.sheet ]
+                if sheet_path not in sheet_xmls:
+                    sheet_xmls[ sheet_path ] = src.read( sheet_path ).decode( "utf-8" )
+                sheet_xmls[ sheet_path ] = patch_sheet( sheet_xmls[ sheet_path ],
+                                                        annotation_fills( roster ), styles )
+        except excp.checklist_exceptions.UnpatchableChecklistError:
+            make_annotated_workbook_openpyxl( rosters, dest_path )
+            return
+
+        patched_parts = { sheet_path: sheet_xml.encode( "utf-8" )
+                          for sheet_path, sheet_xml in sheet_xmls.items() }
+        patched_parts[ styles_path ] = styles.patched().encode( "utf-8" )
+
+        with zipfile.ZipFile( dest_path, "w" ) as dest:
+            for info in src.infolist():
+                if info.filename in patched_parts:
+                    dest.writestr( _copy_info( info ), patched_parts[ info.filename ] )
+                else:
+                    with src.open( info ) as src_member, \
+                         dest.open( _copy_info( info ), "w" ) as dest_member:
+                        shutil.copyfileobj( src_member, dest_member )
+
+def make_annotated_checklist( roster: Roster, dest_dir: str ) -> None:
+    """Makes an annotated checklist for a student in the specified directory"""
+    make_annotated_workbook( [ roster ], os.path.join( dest_dir, f"{roster.netid}.xlsx" ) )
+
+#---------------------------------------------------------------------
+# Annotated Workbooks
+#---------------------------------------------------------------------
+# Each source workbook gets one annotated copy, named by the student's
+# NetID if it only holds their checklist, or otherwise by the
+# workbook's own name
+
+def annotation_groups( rosters: Iterable[Roster] ) -> List[ List[Roster] ]:
+    """Groups rosters by the workbook they're from, in the order they're first seen"""
+
+    groups: Dict[ Tuple[ str, Optional[str] ], List[Roster] ] = {}
+    for roster in rosters:
+        groups.setdefault( ( roster.filepath, roster.member ), [] ).append( roster )
+    return list( groups.values() )
+
+def annotation_name( rosters: List[Roster] ) -> str:
+    """Returns the name of the annotated copy of the rosters' workbook (without .xlsx)"""
+
+    if ( len( rosters ) == 1 ) and ( rosters[0].sheet is None ):
+        return rosters[0].netid
+    workbook_file = rosters[0].member if rosters[0].member is not None else rosters[0].filepath
+    return os.path.splitext( posixpath.basename( workbook_file.replace( os.sep, "/" ) ) )[0]
+
+#---------------------------------------------------------------------
+# Skipping Unchanged Annotations
+#---------------------------------------------------------------------
+# Alongside each annotated workbook, we store a digest of its source
+# workbook and the validity of each colored cell on each sheet. If
+# neither has changed since the workbook was annotated, it's kept as-is
+
+# Changed whenever the annotator would produce different output for the
+# same inputs, to invalidate the stored digests
+ANNOTATION_VERSION = 1
+
+# Annotated workbooks, and their digests (".NAME.xlsx.digest")
+ANNOTATION_FILE = re.compile( r"^(?!~\$)\.?(.+?)\.xlsx(\.digest)?$" )
+
+def workbook_digest( roster: Roster ) -> str:
+    """Returns the SHA-256 digest of the workbook a roster is from"""
+
+    if roster.member is None:
+        return file_digest( roster.filepath )
+    with zipfile.ZipFile( roster.filepath ) as zip_file:
+        return hashlib.sha256( zip_file.read( roster.member ) ).hexdigest()
+
+def annotation_digest( rosters: List[Roster] ) -> str:
+    """
+    Returns a digest of everything an annotated workbook depends on;
+    the source workbook, and the validity of each colored cell on each
+    of its sheets
+    """
+
+    key = json.dumps( [ ANNOTATION_VERSION, workbook_digest( rosters[0] ),
+                        [ [ roster.sheet, sorted( annotation_validity( roster ).items() ) ]
+                          for roster in rosters ] ] )
+    return hashlib.sha256( key.encode( "utf-8" ) ).hexdigest()
+
+def digest_path( dest_dir: str, name: str ) -> str:
+    """Returns the path of the digest stored alongside an annotated workbook"""
+    return os.path.join( dest_dir, f".{name}.xlsx.digest" )
+
+def stored_digest( dest_dir: str, name: str ) -> Optional[str]:
+    """
+    Returns the digest stored with an annotated workbook, or None if
+    either is missing
+    """
+
+    if not os.path.exists( os.path.join( dest_dir, f"{name}.xlsx" ) ):
+        return None
+    try:
+        with open( digest_path( dest_dir, name ), "r", encoding = "utf-8" ) as digest_file:
+            return digest_file.read().strip()
+    except OSError:
+        return None
+
+def update_annotated_workbook( rosters: List[Roster], dest_dir: str ) -> bool:
+    """
+    Makes an annotated copy of the rosters' workbook in the specified
+    directory, unless one made from the same workbook and validities is
+    already there. Returns whether the workbook was annotated
+    """
+
+    name   = annotation_name( rosters )
+    digest = annotation_digest( rosters )
+    if stored_digest( dest_dir, name ) == digest:
+        return False
+
+    # Remove the old digest first, so that an interrupted annotation isn't
+    # taken to be up-to-date
+    if os.path.exists( digest_path( dest_dir, name ) ):
+        os.remove( digest_path( dest_dir, name ) )
+
+    make_annotated_workbook( rosters, os.path.join( dest_dir, f"{name}.xlsx" ) )
+
+    with open( digest_path( dest_dir, name ), "w", encoding = "utf-8" ) as digest_file:
+        digest_file.write( digest + "\n" )
+    return True
+
+def prune_annotated_checklists( dest_dir: str, names: Set[str] ) -> None:
+    """
+    Removes annotated workbooks (and their digests) left by earlier runs
+    that aren't named in the given set
+    """
+
+    for file_name in os.listdir( dest_dir ):
+        annotation_file = ANNOTATION_FILE.match( file_name )
+        if ( annotation_file is not None ) and ( annotation_file.group( 1 ) not in names ):
+            os.remove( os.path.join( dest_dir, file_name ) )
@@ -0,0 +1,190 @@
+"""
+#=====================================================================
+# event_log.py
+#=====================================================================
+# A single structured log of every check's messages in a run, with
+# per-student views rendered from it on demand
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import datetime
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from obj.roster_entry_obj import RosterEntry
+from ui.logger import RoutedQueueHandler, BatchedFileHandler, file_formatter, verbose_print
+
+# The name of the event log in the logs directory
+EVENT_LOG_NAME = "events.jsonl"
+
+# Identifies the events logged by this run (as a resumed run may append
+# to the log of an earlier one)
+RUN_ID = f"{datetime.datetime.now().isoformat( timespec = 'seconds' )}-{os.getpid()}"
+
+# An event, as read from the log
+Event = Dict[ str, Any ]
+
+#---------------------------------------------------------------------
+# Entry Coordinates
+#---------------------------------------------------------------------
+
+def at_entry( entry: RosterEntry ) -> Dict[ str, Any ]:
+    """
+    Returns the extra logging information to tie a message to a roster
+    entry, used as logger.info( ..., extra = at_entry( entry ) )
+    """
+    return { "coord": entry.coord }
+
+#---------------------------------------------------------------------
+# Writing Events
+#---------------------------------------------------------------------
+
+class EventFormatter( logging.Formatter ):
+    """A formatter of records as JSON lines of events"""
+
+    def format( self, record: logging.LogRecord ) -> str:
+        """Formats the record as an event"""
+
+        coord = getattr( record, "coord", None )
+        return json.dumps( {
+            "run"     : RUN_ID,
+            "time"    : file_formatter.formatTime( record, file_formatter.datefmt ),
+            "netid"   : getattr( record, "netid", "" ),
+            "check"   : getattr( record, "check", "" ),
+            "level"   : record.levelname,
+            "message" : record.getMessage(),
+            "coord"   : [ coord.y, coord.x ] if coord is not None else None
+        } )
+
+class EventContext( logging.Filter ):
+    """
+    A filter that stamps each record with the student and check that are
+    being logged about
+
+    Attributes:
+
+     - netid: The NetID of the student being checked (str)
+
+     - check: The name of the check being run (str)
+    """
+
+    def __init__( self ) -> None:
+        super().__init__()
+        self.netid = ""
+        self.check = ""
+
+    def filter( self, record: logging.LogRecord ) -> bool:
+        """Stamps the record with the current student and check"""
+        record.netid = self.netid
+        record.check = self.check
+        return True
+
+class EventLog:
+    """
+    The event log of a run, written by a single Logger shared by all
+    checks; the ChecksManager sets the student and check before each
+    check runs. Messages are also printed when verbose
+
+    Attributes:
+
+     - path: The path of the event log (str)
+
+     - context: The student and check being logged about (EventContext)
+
+     - logger: The Logger to give to checks (logging.Logger)
+    """
+
+    def __init__( self, path: str ) -> None:
+        self.path    = path
+        self.context = EventContext()
+
+        event_handler = BatchedFileHandler( path )
+        event_handler.setFormatter( EventFormatter() )
+
+        self.logger = logging.getLogger( f"{path} events" )
+        self.logger.addHandler( RoutedQueueHandler( verbose_print, event_handler ) )
+        self.logger.addFilter( self.context )
+        self.logger.setLevel( logging.DEBUG )
+
+    def set_context( self, netid: str, check_name: str ) -> None:
+        """Sets the student and check that following messages are about"""
+        self.context.netid = netid
+        self.context.check = check_name
+
+#---------------------------------------------------------------------
+# Reading Events
+#---------------------------------------------------------------------
+
+def read_events( path: str, netid: str,
+                 check_name: Optional[str] = None ) -> Dict[ str, List[Event] ]:
+    """
+    Returns a student's events (optionally only for one check), as a
+    dict mapping each check (in the order they ran) to its events. If
+    a check was run on the student by multiple runs (such as when a run
+    was resumed), only the events from the latest are included
+    """
+
+    netid_field = f'"netid": {json.dumps( netid )}'
+    latest: Dict[ str, Tuple[ str, List[Event] ] ] = {}
+
+    with open( path, "r", encoding = "utf-8" ) as event_file:
+        for line in event_file:
+            if netid_field not in line: # Skip parsing other students' events
+                continue
+            try:
+                event = json.loads( line )
+            except json.JSONDecodeError: # Partially written
+                continue
+            if event[ "netid" ] != netid:
+                continue
+            if ( check_name is not None ) and ( event[ "check" ] != check_name ):
+                continue
+
+            run, events = latest.get( event[ "check" ], ( "", [] ) )
+            if run != event[ "run" ]:
+                events = []
+                latest[ event[ "check" ] ] = ( event[ "run" ], events )
+            events.append( event )
+
+    return { check: events for check, ( _, events ) in latest.items() }
+
+def render_event( event: Event ) -> str:
+    """Renders an event as it would have appeared in a per-student log"""
+    return f"{event[ 'time' ]} [{event[ 'level' ]}] {event[ 'message' ]}"
+
+def show_logs( log_dir: str, netid: str, check_name: Optional[str] = None ) -> int:
+    """
+    Prints a student's logs (optionally only for one check) from the
+    event log in the given directory, falling back to the per-file logs
+    of runs that used them. Returns the exit code
+    """
+
+    event_path = os.path.join( log_dir, EVENT_LOG_NAME )
+
+    if os.path.exists( event_path ):
+        lines_by_check = { check: [ render_event( event ) for event in events ]
+                           for check, events in read_events( event_path, netid,
+                                                             check_name ).items() }
+    else:
+        lines_by_check = {}
+        check_names = [ check_name ] if check_name is not None else sorted( os.listdir( log_dir ) )
+        for check in check_names:
+            log_path = os.path.join( log_dir, check, f"{netid}.log" )
+            if os.path.isfile( log_path ):
+                with open( log_path, "r", encoding = "utf-8" ) as log_file:
+                    lines_by_check[ check ] = log_file.read().splitlines()
+
+    if len( lines_by_check ) == 0:
+        print( f"No logs found for {netid}" + ( f" in {check_name}" if check_name else "" ) )
+        return 1
+
+    for idx, ( check, lines ) in enumerate( lines_by_check.items() ):
+        if check_name is None:
+            print( ( "\n" if idx > 0 else "" ) + f"== {check} ==" )
+        print( "\n".join( lines ) )
+
+    return 0
@@ -8,9 +8,15 @@
 # Date: December 3rd, 2023
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+from collections import deque
+from typing import Deque, Optional, Set, Tuple
 
 # Disable root logging except for critical messages
 logging.getLogger().setLevel( level = logging.CRITICAL )
@@ -82,12 +88,147 @@ verbose_print = logging.StreamHandler( stream = sys.stdout )
 verbose_print.setFormatter( print_formatter )
 verbose_print.addFilter( verbose_filter )
 
+class BatchedFileHandler( logging.FileHandler ):
+    """
+    A FileHandler that doesn't flush after every record; the log writer
+    flushes it once a batch of records has been written
+    """
+
+    def emit( self, record: logging.LogRecord ) -> None:
+        """Writes the record to the file, without flushing"""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write( self.format( record ) + self.terminator )
+        except Exception: # pylint: disable=broad-exception-caught
+            self.handleError( record )
+
 def get_file_handler( file_path: str ) -> logging.FileHandler:
     """Gets a handler to log to the specific file"""
-    handler = logging.FileHandler( file_path )
+    handler = BatchedFileHandler( file_path )
     handler.setFormatter( file_formatter )
     return handler
 
+#---------------------------------------------------------------------
+# Asynchronous Writing
+#---------------------------------------------------------------------
+# Rather than writing to stdout and files on the thread that logs a
+# message, loggers put their records on a queue with the handlers to
+# write them with. A single background LogWriter writes the records
+# in the order they were logged, flushing the handlers it wrote to
+# whenever it catches up with the queue, so checks don't wait on I/O.
+# The queue is drained when the program exits
+
+class LogQueue:
+    """
+    A first-in, first-out queue of log records, shared across threads
+
+    NOTE: We don't use the queue module, as grequests has gevent replace
+    its queues with cooperative versions that can't be waited on from
+    another thread (threading itself is left alone)
+
+    Attributes:
+
+     - records: The records waiting to be written (deque of LogRecord)
+
+     - ready: A condition signalled when a record is added
+              (threading.Condition)
+    """
+
+    def __init__( self ) -> None:
+        self.records: Deque[Optional[logging.LogRecord]] = deque()
+        self.ready = threading.Condition()
+
+    def put_nowait( self, record: Optional[logging.LogRecord] ) -> None:
+        """Adds a record to the queue"""
+        with self.ready:
+            self.records.append( record )
+            self.ready.notify()
+
+    def get( self, block: bool = True ) -> Optional[logging.LogRecord]:
+        """Removes and returns the oldest record, waiting for one if blocking"""
+        with self.ready:
+            while not self.records:
+                if not block:
+                    raise queue.Empty
+                self.ready.wait()
+            return self.records.popleft()
+
+    def empty( self ) -> bool:
+        """Returns whether the queue is empty"""
+        return not self.records
+
+log_queue = LogQueue()
+
+class RoutedQueueHandler( logging.handlers.QueueHandler ):
+    """
+    A QueueHandler that tags each record with the handlers the LogWriter
+    should write it with
+
+    Attributes:
+
+     - targets: The handlers to write records with (tuple of logging.Handler)
+    """
+
+    def __init__( self, *targets: logging.Handler ) -> None:
+        super().__init__( log_queue )
+        self.targets = targets
+
+    def prepare( self, record: logging.LogRecord ) -> logging.LogRecord:
+        """
+        Renders the message (in case its arguments change before it's
+        written), and tags the record with our targets. The rest of the
+        formatting is left to the LogWriter
+        """
+        record.msg  = record.getMessage()
+        record.args = None
+        record.targets = self.targets
+        return record
+
+class LogWriter( logging.handlers.QueueListener ):
+    """
+    A QueueListener that writes each record with the handlers it was
+    tagged with, flushing them once the queue is empty
+
+    Attributes:
+
+     - unflushed: The handlers written to since they were last flushed
+                  (set of logging.Handler)
+    """
+
+    def __init__( self ) -> None:
+        super().__init__( log_queue, respect_handler_level = True )
+        self.unflushed: Set[logging.Handler] = set()
+
+    def handle( self, record: logging.LogRecord ) -> None:
+        """Writes a record, flushing once we've caught up with the queue"""
+
+        targets: Tuple[ logging.Handler, ... ] = getattr( record, "targets", () )
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle( record )
+                self.unflushed.add( handler )
+
+        if log_queue.empty():
+            self.flush()
+
+    def flush( self ) -> None:
+        """Flushes the handlers that have been written to"""
+
+        for handler in self.unflushed:
+            handler.flush()
+        self.unflushed.clear()
+
+    def stop( self ) -> None:
+        """Writes any remaining records, then stops the writer"""
+
+        super().stop()
+        self.flush()
+
+log_writer = LogWriter()
+log_writer.start()
+atexit.register( log_writer.stop )
+
 #---------------------------------------------------------------------
 # Define Loggers
 #---------------------------------------------------------------------
@@ -105,7 +246,7 @@ def get_file_handler( file_path: str ) -> logging.FileHandler:
 # A logger to always print
 
 logger = logging.getLogger( "always_log" )
-logger.addHandler( always_print )
+logger.addHandler( RoutedQueueHandler( always_print ) )
 logger.setLevel( logging.DEBUG )
 
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -116,8 +257,7 @@ logger.setLevel( logging.DEBUG )
 def gen_file_logger( file_path: str ) -> logging.Logger:
     """Generates a file logger with printing"""
     file_logger = logging.getLogger( f"{os.path.basename( file_path )} logger" )
-    file_logger.addHandler( always_print )
-    file_logger.addHandler( get_file_handler( file_path ) )
+    file_logger.addHandler( RoutedQueueHandler( always_print, get_file_handler( file_path ) ) )
     file_logger.setLevel( logging.DEBUG )
     return file_logger
 
@@ -130,7 +270,7 @@ def gen_file_logger( file_path: str ) -> logging.Logger:
 def gen_v_file_logger( file_path: str ) -> logging.Logger:
     """Generates a file logger with verbose printing"""
     v_file_logger = logging.getLogger( f"{file_path} logger" )
-    v_file_logger.addHandler( verbose_print )
-    v_file_logger.addHandler( get_file_handler( file_path ) )
+    v_file_logger.addHandler( RoutedQueueHandler( verbose_print,
+                                                  get_file_handler( file_path ) ) )
     v_file_logger.setLevel( logging.DEBUG )
     return v_file_logger
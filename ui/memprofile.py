@@ -0,0 +1,177 @@
+"""
+#=====================================================================
+# memprofile.py
+#=====================================================================
+# A memory profiler for the phases of a validation run, using
+# tracemalloc snapshots taken at each phase boundary
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Union
+
+try:
+    import resource
+except ImportError: # Not available on Windows
+    resource = None # type: ignore[assignment]
+
+# The number of allocation sites to report for each phase
+TOP_ALLOCATORS = 10
+
+# Allocations made by the profiler itself, or while importing modules
+IGNORED_FILES = [ tracemalloc.__file__, "<frozen importlib._bootstrap>",
+                  "<frozen importlib._bootstrap_external>", "<unknown>" ]
+
+# A report on the allocations of a single site
+SiteReport = Dict[ str, Union[ str, int ] ]
+
+# A report on a single phase
+PhaseReport = Dict[ str, Union[ str, int, float, None, List[SiteReport] ] ]
+
+#---------------------------------------------------------------------
+# Resident Set Size
+#---------------------------------------------------------------------
+
+def peak_rss() -> Optional[int]:
+    """
+    Returns the peak resident set size of the process since it started
+    (not since any given phase) in bytes, or None if it isn't available
+    on this platform
+    """
+
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+
+    # Linux reports in kilobytes, macOS in bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+def current_rss() -> Optional[int]:
+    """
+    Returns the current resident set size of the process in bytes, or
+    None if it isn't available on this platform
+    """
+
+    try:
+        with open( "/proc/self/statm", "r", encoding = "utf-8" ) as statm_file:
+            resident_pages = int( statm_file.read().split()[1] )
+    except OSError:
+        return None
+
+    return resident_pages * os.sysconf( "SC_PAGE_SIZE" )
+
+#---------------------------------------------------------------------
+# Memory Profiler
+#---------------------------------------------------------------------
+
+def _site_reports( stats: List[tracemalloc.Statistic] ) -> List[SiteReport]:
+    """Summarizes the largest allocation sites of a snapshot"""
+
+    return [ { "site"   : f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+               "size"   : stat.size,
+               "blocks" : stat.count } for stat in stats[ :TOP_ALLOCATORS ] ]
+
+def _growth_reports( stats: List[tracemalloc.StatisticDiff] ) -> List[SiteReport]:
+    """Summarizes the allocation sites that grew the most between snapshots"""
+
+    return [ { "site"        : f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+               "size"        : stat.size,
+               "size_growth" : stat.size_diff,
+               "blocks"      : stat.count } for stat in stats[ :TOP_ALLOCATORS ] ]
+
+class MemProfiler:
+    """
+    A profiler of the memory used by each phase of a run. A snapshot is
+    taken at the end of each phase, and compared against the one before
+    it. When disabled, marking phases does nothing
+
+    Attributes:
+
+     - enabled: Whether we're profiling (bool)
+
+     - phases: The reports on each phase so far, in order (list of dict)
+
+     - last_snapshot: The snapshot at the end of the previous phase
+                      (tracemalloc.Snapshot or None)
+
+     - last_time: When the previous phase ended (float)
+
+     - last_rss: The resident set size at the end of the previous phase
+                 (int, or None if it isn't available)
+    """
+
+    def __init__( self, enabled: bool = True ) -> None:
+        self.enabled = enabled
+        self.phases: List[PhaseReport] = []
+        self.last_snapshot: Optional[tracemalloc.Snapshot] = None
+        self.last_time = time.perf_counter()
+        self.last_rss  = current_rss()
+
+        if self.enabled:
+            tracemalloc.start()
+            self.last_snapshot = self._snapshot()
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        """Takes a snapshot of the current allocations, ignoring our own"""
+
+        return tracemalloc.take_snapshot().filter_traces(
+            [ tracemalloc.Filter( False, filename ) for filename in IGNORED_FILES ] )
+
+    def phase( self, name: str ) -> None:
+        """Marks the end of the given phase, recording its memory usage"""
+
+        if not self.enabled:
+            return
+
+        end_time = time.perf_counter()
+        traced, traced_peak = tracemalloc.get_traced_memory()
+        rss = current_rss()
+        snapshot = self._snapshot()
+
+        assert self.last_snapshot is not None
+        growth = [ stat for stat in snapshot.compare_to( self.last_snapshot, "lineno" )
+                   if stat.size_diff > 0 ]
+        growth.sort( key = lambda stat: stat.size_diff, reverse = True )
+
+        self.phases.append( {
+            "phase"        : name,
+            "time"         : end_time - self.last_time,
+            "traced"       : traced,
+            "traced_peak"  : traced_peak,
+            "current_rss"  : rss,
+            "rss_growth"   : ( rss - self.last_rss ) if ( rss is not None and
+                                                           self.last_rss is not None ) else None,
+            "run_peak_rss" : peak_rss(),
+            "top_held"     : _site_reports( snapshot.statistics( "lineno" ) ),
+            "top_growth"   : _growth_reports( growth )
+        } )
+
+        # Python 3.9+ can measure the peak of each phase separately;
+        # otherwise, the traced peak is the peak since the run started
+        if hasattr( tracemalloc, "reset_peak" ):
+            tracemalloc.reset_peak()
+
+        self.last_snapshot = snapshot
+        self.last_rss  = rss
+        self.last_time = time.perf_counter()
+
+    def save( self, path: str ) -> None:
+        """Stops profiling, and saves the phase reports as JSON"""
+
+        if not self.enabled:
+            return
+
+        tracemalloc.stop()
+        self.last_snapshot = None
+
+        with open( path, "w", encoding = "utf-8" ) as profile_file:
+            json.dump( { "python" : sys.version.split()[0],
+                         "phases" : self.phases }, profile_file, indent = 2 )
@@ -8,6 +8,8 @@
 # Date: October 2nd, 2023
 """
 
+from typing import Dict, Tuple
+
 import exceptions as excp
 
 #---------------------------------------------------------------------
@@ -61,16 +63,87 @@ def get_nbr_from_name( class_name: str ) -> str:
     """
     return class_name.split( " " )[1]
 
+#---------------------------------------------------------------------
+# Term Object
+#---------------------------------------------------------------------
+# Terms are compared often (sorting rosters, checking for future
+# terms, term-conditional requirements), so each term is parsed once
+# into an interned Term with a precomputed ordinal. Chronological
+# comparisons are then plain integer comparisons
+
+# Seasons, in chronological order within a year
+SEASONS: Tuple[str, ...] = ( "WI", "SP", "SU", "FA" )
+
+class Term( str ):
+    """
+    A validated term ID (ex. 'FA23')
+
+    Term is a subclass of str, so it can be used anywhere a term string
+    is expected (including as a dictionary key, where it is
+    interchangeable with the equivalent str). Constructing the same
+    term twice returns the same object.
+
+    Ordering comparisons (<, <=, >, >=) are chronological rather than
+    lexicographical
+
+    Attributes:
+
+     - ordinal: A value such that chronologically later terms have
+                higher values (int)
+    """
+
+    _interned: Dict[str, 'Term'] = {}
+    ordinal: int
+
+    def __new__( cls, term: str ) -> 'Term':
+        interned = cls._interned.get( term )
+        if interned is not None:
+            return interned
+
+        if not validate_class_term( term ):
+            raise excp.ui_exceptions.InvalidTermError( term )
+
+        new_term = super().__new__( cls, term )
+        new_term.ordinal = ( int( term[2:4] ) * len( SEASONS ) ) + SEASONS.index( term[0:2] )
+
+        cls._interned[ str( term ) ] = new_term
+        return new_term
+
+    def __lt__( self, other: str ) -> bool:
+        return self.ordinal <  as_term( other ).ordinal
+
+    def __le__( self, other: str ) -> bool:
+        return self.ordinal <= as_term( other ).ordinal
+
+    def __gt__( self, other: str ) -> bool:
+        return self.ordinal >  as_term( other ).ordinal
+
+    def __ge__( self, other: str ) -> bool:
+        return self.ordinal >= as_term( other ).ordinal
+
+def as_term( term: str ) -> Term:
+    """
+    Returns the Term for a properly formatted term string (or the Term
+    itself, if already given one)
+    """
+
+    if isinstance( term, Term ):
+        return term
+    return Term( term )
+
 #---------------------------------------------------------------------
 # Parsing for Class Terms
 #---------------------------------------------------------------------
 
-def parse_class_term( ugly_term: str ) -> str:
+def parse_class_term( ugly_term: str ) -> Term:
     """
     Parses non-optimal user input into a usable term ID
 
     Ex. " fA '2 2" -> "FA22"
     """
+    if isinstance( ugly_term, Term ): # Already parsed
+        return ugly_term
+
     stripped_term = ugly_term.strip()
 
     letters = [ x for x in stripped_term if x.isalpha() ]
@@ -81,7 +154,7 @@ def parse_class_term( ugly_term: str ) -> str:
     if not validate_class_term( term ): # Still not a valid term
         raise excp.ui_exceptions.InvalidTermError( ugly_term )
 
-    return term
+    return Term( term )
 
 def validate_class_term( term: str ) -> bool:
     """
@@ -96,7 +169,7 @@ def validate_class_term( term: str ) -> bool:
 
     result = len( term ) == 4
     result = result and ( ( term[2:4] ).isdigit() )
-    result = result and ( term[0:2] in [ "SP", "SU", "FA", "WI" ] )
+    result = result and ( term[0:2] in SEASONS )
     return result
 
 def term_index( term: str ) -> float:
@@ -107,20 +180,7 @@ def term_index( term: str ) -> float:
     Assumes that the term passed in is formatted properly
     """
 
-    if not validate_class_term( term ):
-        raise excp.ui_exceptions.InvalidTermError( term )
-
-    term_season =   "".join( [ x for x in term if x.isalpha() ] )
-    term_year = int("".join( [ x for x in term if x.isdigit() ] ) )
-
-    seasons = {
-        "WI": 0,
-        "SP": 0.25,
-        "SU": 0.5,
-        "FA": 0.75
-    }
-
-    return term_year + seasons[term_season]
+    return as_term( term ).ordinal / len( SEASONS )
 
 def term_is_later( term1: str, term2: str ) -> bool:
     """
@@ -130,7 +190,7 @@ def term_is_later( term1: str, term2: str ) -> bool:
     Assumes that the terms passed in are formatted properly
     """
 
-    return term_index( term1 ) > term_index( term2 )
+    return as_term( term1 ).ordinal > as_term( term2 ).ordinal
 
 #---------------------------------------------------------------------
 # Parsing for Grades
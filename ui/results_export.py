@@ -0,0 +1,210 @@
+"""
+#=====================================================================
+# results_export.py
+#=====================================================================
+# A columnar export of a cohort's results, with one row per component
+# of each roster entry, for querying across the whole cohort
+#
+# Author: Aidan McNay
+# Date: October 19th, 2026
+"""
+
+import os
+from typing import Dict, List, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError: # Only needed for Parquet and Feather
+    pyarrow = None
+
+from obj.roster_obj import Roster
+from obj.roster_entry_obj import ERROR, WARNING, VALID, UNCHECKED
+
+# The formats we can export to, and their file extensions
+EXPORT_FORMATS: Dict[ str, str ] = {
+    "parquet" : ".parquet",
+    "feather" : ".feather",
+    "csv"     : ".csv"
+}
+
+# The names of each validity level, as exported
+VALIDITY_NAMES: Dict[ int, str ] = {
+    UNCHECKED : "UNCHECKED",
+    VALID     : "VALID",
+    WARNING   : "WARNING",
+    ERROR     : "ERROR"
+}
+
+# The columns describing each component, before the per-check counts
+BASE_COLUMNS = [ "netid", "entry", "req", "row", "col", "course", "term", "component",
+                 "validity" ]
+
+# Columns with few distinct values, stored as categories
+CATEGORY_COLUMNS = [ "netid", "entry", "req", "course", "term", "component", "validity" ]
+
+#---------------------------------------------------------------------
+# Building the Table
+#---------------------------------------------------------------------
+
+def _add_roster( roster: Roster, columns: Dict[ str, List[object] ] ) -> int:
+    """
+    Adds a row for each component of a roster's entries, returning the
+    number of rows added
+    """
+
+    num_rows = 0
+
+    for entry_type, entries in ( ( "req",      roster.req_entries      ),
+                                 ( "checkoff", roster.checkoff_entries ) ):
+        for entry in entries:
+            term = str( getattr( entry, "term", "" ) ) # Plain strings, not Terms
+            for component in entry.components:
+                columns[ "entry"     ].append( entry_type )
+                columns[ "req"       ].append( entry.req )
+                columns[ "row"       ].append( entry.coord.y )
+                columns[ "col"       ].append( entry.coord.x )
+                columns[ "course"    ].append( str( entry.course_used ) )
+                columns[ "term"      ].append( term )
+                columns[ "component" ].append( component )
+                columns[ "validity"  ].append( VALIDITY_NAMES[ entry.get_val( component ) ] )
+                num_rows += 1
+
+    columns[ "netid" ].extend( [ roster.netid ] * num_rows )
+    return num_rows
+
+def results_columns( check_names: Sequence[str] ) -> List[str]:
+    """Returns the columns of the table, for the given checks"""
+
+    return BASE_COLUMNS + [ f"{check_name}:{suffix}" for check_name in check_names
+                                                     for suffix in [ "errors", "warnings" ] ]
+
+def results_frame( rosters: Sequence[Roster], results: Dict[ str, Dict[ str, Tuple[ int, int ] ] ],
+                   check_names: Sequence[str] ) -> pd.DataFrame:
+    """
+    Builds a table with one row per (netid, roster entry, component),
+    giving the component's validity, along with the number of errors and
+    warnings each check found for the student (as "CHECK:errors" and
+    "CHECK:warnings" columns)
+
+    Entries are identified by their type ("req" or "checkoff"), the
+    requirement they satisfy, and their row and column in the checklist
+    """
+
+    columns: Dict[ str, List[object] ] = { name: [] for name in BASE_COLUMNS }
+    netid_counts: List[ Tuple[ str, int ] ] = []
+
+    for roster in rosters:
+        netid_counts.append( ( roster.netid, _add_roster( roster, columns ) ) )
+
+    for check_name in check_names:
+        for idx, suffix in enumerate( [ "errors", "warnings" ] ):
+            check_column: List[object] = []
+            for netid, num_rows in netid_counts:
+                result = results.get( netid, {} ).get( check_name )
+                check_column.extend( [ result[ idx ] if result is not None else None ] * num_rows )
+            columns[ f"{check_name}:{suffix}" ] = check_column
+
+    return _set_dtypes( pd.DataFrame( columns ) )
+
+def _set_dtypes( frame: pd.DataFrame ) -> pd.DataFrame:
+    """
+    Stores repetitive columns as categories, and the per-check counts as
+    nullable integers (missing if the check didn't run on the student)
+    """
+
+    for column in frame.columns:
+        if column in CATEGORY_COLUMNS:
+            frame[ column ] = frame[ column ].astype( "category" )
+        elif column not in BASE_COLUMNS:
+            frame[ column ] = frame[ column ].astype( "Int64" )
+    return frame
+
+#---------------------------------------------------------------------
+# Reading and Writing
+#---------------------------------------------------------------------
+
+def has_arrow() -> bool:
+    """Returns whether pyarrow is available, for Parquet and Feather files"""
+    return pyarrow is not None
+
+def export_format( requested: str ) -> str:
+    """
+    Returns the format to export to, falling back to CSV if the requested
+    format needs pyarrow and it isn't installed
+    """
+
+    if requested != "csv" and not has_arrow():
+        return "csv"
+    return requested
+
+#---------------------------------------------------------------------
+# Writing a Window at a Time
+#---------------------------------------------------------------------
+
+class ResultsWriter:
+    """
+    Writes the table a window of students at a time, so that the whole
+    table is never held in memory. Each window's rows are appended to a
+    CSV spool file; when the writer is closed, the spool is moved into
+    place as the CSV export, or converted to Parquet or Feather a batch
+    of rows at a time with pyarrow
+
+    Attributes:
+
+     - path_base: The path to write to, without the format's extension (str)
+
+     - fmt: The format to write (str)
+
+     - columns: The columns of the table (list of str)
+
+     - spool_path: The path of the CSV spool file (str)
+    """
+
+    def __init__( self, path_base: str, fmt: str, check_names: Sequence[str] ) -> None:
+        self.path_base  = path_base
+        self.fmt        = fmt
+        self.columns    = results_columns( check_names )
+        self.spool_path = path_base + ".partial" + EXPORT_FORMATS[ "csv" ]
+
+        pd.DataFrame( columns = self.columns ).to_csv( self.spool_path, index = False )
+
+    def write( self, frame: pd.DataFrame ) -> None:
+        """Appends the rows of a window of students (from results_frame)"""
+
+        frame[ self.columns ].to_csv( self.spool_path, mode = "a", header = False, index = False )
+
+    def close( self ) -> str:
+        """Writes the table in its format, returning the path written to"""
+
+        path = self.path_base + EXPORT_FORMATS[ self.fmt ]
+
+        if self.fmt == "csv":
+            os.replace( self.spool_path, path )
+        else:
+            self._convert_spool( path )
+            os.remove( self.spool_path )
+
+        return path
+
+    def _convert_spool( self, path: str ) -> None:
+        """Converts the spool to Parquet or Feather, a batch of rows at a time"""
+
+        column_types = { column: ( pyarrow.string() if column in CATEGORY_COLUMNS
+                                   else pyarrow.int64() ) for column in self.columns }
+        reader = pyarrow.csv.open_csv(
+            self.spool_path, convert_options = pyarrow.csv.ConvertOptions(
+                column_types = column_types, strings_can_be_null = False ) )
+
+        if self.fmt == "parquet":
+            writer = pyarrow.parquet.ParquetWriter( path, reader.schema )
+        else:
+            writer = pyarrow.ipc.new_file( path, reader.schema )
+
+        with writer:
+            for batch in reader:
+                writer.write_batch( batch )